@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Query and render the shared Cyber Essentials answer store
+
+The CE scripts add their organisation to the store named by IFA_CE_STORE
+(see ifa_workbooks/ce_store.py); this lists what it holds, shows one
+organisation's status by section, and renders any organisation's workbook.
+
+Usage: ce-answers.py ce-answers.db list
+       ce-answers.py ce-answers.db status "MEMA Financial Services Ltd"
+       ce-answers.py ce-answers.db render "MEMA Financial Services Ltd" mema.xlsx
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.ce_store import (connect, create_schema, organisations, outstanding, render_organisation,
+                                    section_status)
+
+parser = argparse.ArgumentParser(description='Query and render the shared Cyber Essentials answer store')
+parser.add_argument('store', help='SQLite answer store')
+commands = parser.add_subparsers(dest='command', required=True)
+commands.add_parser('list', help='every organisation with its outstanding answers')
+status = commands.add_parser('status', help="one organisation's answers by section")
+status.add_argument('organisation')
+render = commands.add_parser('render', help="write one organisation's workbook")
+render.add_argument('organisation')
+render.add_argument('output', help='.xlsx path')
+args = parser.parse_args()
+
+if not os.path.exists(args.store):
+    print(f"❌ No answer store at {args.store}")
+    sys.exit(1)
+conn = connect(args.store)
+create_schema(conn)
+
+try:
+    if args.command == 'list':
+        print(f"{'Organisation':<40} {'Layout':<13} {'Based on':<24} {'Questions':>9} {'Outstanding':>11}")
+        for name, layout, base, questions, waiting in organisations(conn):
+            print(f"{name[:40]:<40} {layout:<13} {(base or '-')[:24]:<24} {questions:>9} {waiting:>11}")
+    elif args.command == 'status':
+        print(f"{'Section':<30} {'Questions':>9} {'Ready':>6} {'Outstanding':>11}")
+        for section, questions, ready, waiting in section_status(conn, args.organisation):
+            print(f"{section[:30]:<30} {questions:>9} {ready:>6} {waiting:>11}")
+        for q_no, question, value in outstanding(conn, args.organisation):
+            print(f"❌ {q_no} {question} - {value}")
+    else:
+        start = time.perf_counter()
+        render_organisation(conn, args.organisation).save(args.output)
+        print(f"✅ Created: {args.output} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+except KeyError as e:
+    print(f"❌ {e.args[0]}")
+    sys.exit(1)
+finally:
+    conn.close()
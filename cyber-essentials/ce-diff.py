@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Compare two Cyber Essentials question-set revisions
+
+Matches questions by Q No., then by text, and reports added, removed,
+reworded, renumbered and moved questions in a change workbook. Either
+revision may be an exported CE workbook, a CE generator script (its data
+list is read, not run) or an organisation in an answer store. With
+--each-organisation, every organisation in the store is compared against
+NEW instead, one line per organisation.
+
+Usage: ce-diff.py OLD NEW --output changes.xlsx [--store ce-answers.db] [--include-unchanged]
+       ce-diff.py NEW --store ce-answers.db --each-organisation [--report drift.csv]
+
+    ce-diff.py create-cyber-essentials-excel.py create-mema-cyber-essentials.py --output drift.xlsx
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.ce_diff import (CHANGE_KINDS, QuestionDiffer, build_diff_workbook, change_counts,
+                                   load_question_set, store_question_set)
+from ifa_workbooks.ce_store import connect, create_schema, organisations
+
+parser = argparse.ArgumentParser(description='Compare Cyber Essentials question-set revisions')
+parser.add_argument('sources', nargs='+', metavar='SOURCE',
+                    help='OLD and NEW (or only NEW): .xlsx export, generator .py script or organisation in --store')
+parser.add_argument('--output', help='change workbook (.xlsx) for an OLD NEW comparison')
+parser.add_argument('--store', help='answer store to read organisations from')
+parser.add_argument('--include-unchanged', action='store_true', help='list unchanged questions too')
+parser.add_argument('--each-organisation', action='store_true',
+                    help='compare every organisation in --store against NEW')
+parser.add_argument('--report', help='with --each-organisation, write the counts to this CSV')
+args = parser.parse_args()
+
+if args.each_organisation:
+    if len(args.sources) != 1 or not args.store:
+        parser.error('--each-organisation takes only NEW, and needs --store')
+elif len(args.sources) != 2 or not args.output:
+    parser.error('give OLD and NEW, and --output')
+
+conn = None
+if args.store:
+    if not os.path.exists(args.store):
+        print(f"❌ No answer store at {args.store}")
+        sys.exit(1)
+    conn = connect(args.store)
+    create_schema(conn)
+
+start = time.perf_counter()
+try:
+    if args.each_organisation:
+        differ = QuestionDiffer(load_question_set(args.sources[0], conn))
+        kinds = [kind for kind in CHANGE_KINDS if kind != 'unchanged']
+        lines = []
+        for organisation, *_ in organisations(conn):
+            counts = change_counts(differ.diff(store_question_set(conn, organisation)))
+            lines.append([organisation] + [counts.get(kind, 0) for kind in kinds])
+        print(f"{'Organisation':<40}" + ''.join(f' {kind.title():>10}' for kind in kinds))
+        for organisation, *counts in lines:
+            print(f"{organisation[:40]:<40}" + ''.join(f' {count:>10}' for count in counts))
+        if args.report:
+            with open(args.report, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['organisation'] + kinds)
+                writer.writerows(lines)
+        print(f"\n✅ Compared {len(lines)} organisations in {time.perf_counter() - start:.2f}s")
+    else:
+        old_source, new_source = args.sources
+        changes = QuestionDiffer(load_question_set(new_source, conn)).diff(load_question_set(old_source, conn))
+        wb = build_diff_workbook(changes, os.path.basename(old_source), os.path.basename(new_source),
+                                 include_unchanged=args.include_unchanged)
+        wb.save(args.output)
+        summary = ', '.join(f'{count} {kind}' for kind, count in change_counts(changes).items())
+        print(f"✅ Created: {args.output} ({summary}; {time.perf_counter() - start:.2f}s)")
+except (KeyError, ValueError, OSError) as e:
+    print(f"❌ {e.args[0] if isinstance(e, KeyError) else e}")
+    sys.exit(1)
+finally:
+    if conn is not None:
+        conn.close()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Cyber Essentials workbooks - batch generator
+
+Builds one CE answer workbook per firm from a base answer set plus one
+override file per firm (see ifa_workbooks/ce_batch.py for the format),
+spread across all CPU cores.
+
+Usage: create-ce-workbooks-batch.py BASE OVERRIDES... --output-dir DIR
+           [--store ce-answers.db] [--workers N] [--report report.csv]
+
+BASE is an exported CE workbook (.xlsx) or an organisation already in
+--store; OVERRIDES are .json files or directories of them.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.ce_batch import load_base, load_firms, run_ce_batch, write_report
+from ifa_workbooks.ce_store import CE_STORE_ENV, connect, create_schema
+
+parser = argparse.ArgumentParser(description='Generate one Cyber Essentials workbook per firm')
+parser.add_argument('base', help='exported CE workbook (.xlsx) or organisation in the store')
+parser.add_argument('overrides', nargs='+', help='per-firm override .json files or directories of them')
+parser.add_argument('--output-dir', required=True)
+parser.add_argument('--store', default=os.environ.get(CE_STORE_ENV),
+                    help=f'keep the base and firms in this answer store (default: ${CE_STORE_ENV}, '
+                         f'else a temporary file)')
+parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+parser.add_argument('--report', help='write per-firm timings and outstanding counts to this CSV')
+args = parser.parse_args()
+
+with tempfile.TemporaryDirectory() as scratch:
+    store_path = args.store or os.path.join(scratch, 'ce-answers.db')
+    conn = connect(store_path)
+    create_schema(conn)
+    start = time.perf_counter()
+    try:
+        base = load_base(conn, args.base)
+        firms = load_firms(conn, base, args.overrides)
+    except (KeyError, ValueError, OSError) as e:
+        print(f"❌ {e.args[0] if isinstance(e, KeyError) else e}")
+        sys.exit(1)
+    finally:
+        conn.close()
+    print(f"Loaded {len(firms)} firms on top of '{base}' ({time.perf_counter() - start:.2f}s)")
+    print(f"Generating {len(firms)} workbooks into {args.output_dir}")
+
+    start = time.perf_counter()
+    results = []
+    for result in run_ce_batch(store_path, firms, args.output_dir, workers=args.workers):
+        results.append(result)
+        if result.error:
+            print(f"❌ {result.organisation}: {result.error}")
+        else:
+            print(f"✅ {os.path.basename(result.path)}  {result.seconds * 1000:.0f} ms  "
+                  f"{result.actions} ACTION, {result.confirms} Confirm")
+    elapsed = time.perf_counter() - start
+
+if args.report:
+    write_report(results, args.report)
+
+failed = sum(1 for r in results if r.error)
+actions = sum(r.actions for r in results)
+confirms = sum(r.confirms for r in results)
+per_file = sum(r.seconds for r in results) / len(results) if results else 0
+print(f"\nDone: {len(results) - failed} workbooks, {failed} failed, {elapsed:.1f}s wall, "
+      f"{per_file * 1000:.0f} ms avg per file; {actions} ACTION and {confirms} Confirm items outstanding")
+sys.exit(1 if failed else 0)
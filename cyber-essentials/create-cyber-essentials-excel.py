@@ -3,46 +3,16 @@
 Create Cyber Essentials Question Set Excel file with draft answers
 """
 
-import subprocess
+import os
 import sys
 
-# Install openpyxl if not present
-try:
-    import openpyxl
-except ImportError:
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "openpyxl", "-q"])
-    import openpyxl
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.cache import OutputCache
+from ifa_workbooks.ce_store import CE_STORE_ENV, connect, create_schema, put_answers, render_organisation
+from ifa_workbooks.styles import format_style_report, style_report
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
-
-# Create workbook
-wb = Workbook()
-ws = wb.active
-ws.title = "CE Question Set"
-
-# Styles
-header_font = Font(bold=True, color="FFFFFF", size=11)
-header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-section_fill = PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid")
-section_font = Font(bold=True, size=11)
-wrap_alignment = Alignment(wrap_text=True, vertical="top")
-thin_border = Border(
-    left=Side(style='thin'),
-    right=Side(style='thin'),
-    top=Side(style='thin'),
-    bottom=Side(style='thin')
-)
-
-# Headers
-headers = ["Section", "Q No.", "Question", "Guidance", "Answer Type", "Draft Answer", "Status"]
-for col, header in enumerate(headers, 1):
-    cell = ws.cell(row=1, column=col, value=header)
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.alignment = wrap_alignment
-    cell.border = thin_border
+ORGANISATION = "Cyber Essentials draft question set"
+output_path = "/Users/adeomosanya/Documents/ifa-professional-portal/cyber-essentials/Cyber-Essentials-Question-Set-Answers.xlsx"
 
 # Data - Questions and Answers
 data = [
@@ -151,82 +121,26 @@ data = [
     ("A8 - Malware", "A8.5", "If Option B: only approved apps + list maintained?", "", "Yes/No", "Yes - staff instructed on approved apps. List maintained. New requests need approval.", "Ready"),
 ]
 
-# Write data
-for row_num, row_data in enumerate(data, 2):
-    for col_num, value in enumerate(row_data, 1):
-        cell = ws.cell(row=row_num, column=col_num, value=value)
-        cell.alignment = wrap_alignment
-        cell.border = thin_border
-
-        # Apply section styling
-        if col_num == 1:
-            cell.font = section_font
-
-        # Color code status
-        if col_num == 7:  # Status column
-            if value == "Ready":
-                cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-            elif value == "Pending":
-                cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-            elif value == "Confirm":
-                cell.fill = PatternFill(start_color="BDD7EE", end_color="BDD7EE", fill_type="solid")
-            elif value == "Partial":
-                cell.fill = PatternFill(start_color="FCE4D6", end_color="FCE4D6", fill_type="solid")
-
-# Set column widths
-column_widths = [18, 8, 50, 40, 15, 60, 12]
-for col_num, width in enumerate(column_widths, 1):
-    ws.column_dimensions[get_column_letter(col_num)].width = width
-
-# Freeze top row
-ws.freeze_panes = "A2"
-
-# Add summary sheet
-ws2 = wb.create_sheet("Summary")
-ws2["A1"] = "Cyber Essentials Certification - Status Summary"
-ws2["A1"].font = Font(bold=True, size=14)
+# The Summary sheet's pending items are queried from the answers, not listed here
+store = connect(os.environ.get(CE_STORE_ENV) or ':memory:')
+create_schema(store)
+put_answers(store, ORGANISATION, data)
 
-ws2["A3"] = "Status Legend:"
-ws2["A4"] = "Ready"
-ws2["A4"].fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-ws2["B4"] = "Answer complete and verified"
+# Nightly runs: reuse the last file when neither this script nor the templates changed.
+# Checked after put_answers so a cache hit still records the answers in the store
+cache = OutputCache.from_env()
+cache_key = cache.key(sources=[__file__]) if cache else None
+if cache and cache.fetch(cache_key, output_path):
+    store.close()
+    print(f"Inputs unchanged - copied cached workbook to {output_path}")
+    sys.exit(0)
 
-ws2["A5"] = "Confirm"
-ws2["A5"].fill = PatternFill(start_color="BDD7EE", end_color="BDD7EE", fill_type="solid")
-ws2["B5"] = "Needs your confirmation"
-
-ws2["A6"] = "Pending"
-ws2["A6"].fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-ws2["B6"] = "Requires your input (TBC)"
-
-ws2["A7"] = "Partial"
-ws2["A7"].fill = PatternFill(start_color="FCE4D6", end_color="FCE4D6", fill_type="solid")
-ws2["B7"] = "Partially complete, needs review"
-
-ws2["A9"] = "Items Requiring Your Input:"
-ws2["A9"].font = Font(bold=True)
-
-pending_items = [
-    "A1.1 - Organisation name",
-    "A1.2 - Organisation type",
-    "A1.3 - Registration number",
-    "A1.4 - Registered address",
-    "A1.5 - Main business",
-    "A1.8 - Reasons for certification",
-    "A1.10/A1.11 - Contact permissions",
-    "A2.6 - Mobile devices",
-    "A2.7.1 - Remote workers count",
-    "A2.10 - IT responsible person",
-    "A3.3 - Insurance contact email",
-]
-
-for i, item in enumerate(pending_items, 10):
-    ws2[f"A{i}"] = item
-
-ws2.column_dimensions["A"].width = 40
-ws2.column_dimensions["B"].width = 40
+wb = render_organisation(store, ORGANISATION)
+store.close()
 
 # Save
-output_path = "/Users/adeomosanya/Documents/ifa-professional-portal/cyber-essentials/Cyber-Essentials-Question-Set-Answers.xlsx"
 wb.save(output_path)
+if cache:
+    cache.store(cache_key, output_path)
 print(f"Excel file created: {output_path}")
+print(f"Styles: {format_style_report(style_report(output_path))}")
@@ -3,43 +3,16 @@
 Create MEMA Financial Services Cyber Essentials Question Set Excel
 """
 
-import subprocess
+import os
 import sys
 
-try:
-    import openpyxl
-except ImportError:
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "openpyxl", "-q"])
-    import openpyxl
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.cache import OutputCache
+from ifa_workbooks.ce_store import CE_STORE_ENV, connect, create_schema, put_answers, render_organisation
+from ifa_workbooks.styles import format_style_report, style_report
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
-
-wb = Workbook()
-ws = wb.active
-ws.title = "CE Answers"
-
-# Styles
-header_font = Font(bold=True, color="FFFFFF", size=11)
-header_fill = PatternFill(start_color="2F5496", end_color="2F5496", fill_type="solid")
-section_fill = PatternFill(start_color="D6DCE5", end_color="D6DCE5", fill_type="solid")
-section_font = Font(bold=True, size=11)
-wrap_alignment = Alignment(wrap_text=True, vertical="top")
-thin_border = Border(
-    left=Side(style='thin'), right=Side(style='thin'),
-    top=Side(style='thin'), bottom=Side(style='thin')
-)
-ready_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-action_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-
-headers = ["Section", "Q No.", "Question", "Your Answer", "Status"]
-for col, header in enumerate(headers, 1):
-    cell = ws.cell(row=1, column=col, value=header)
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.alignment = wrap_alignment
-    cell.border = thin_border
+ORGANISATION = "MEMA Financial Services Ltd"
+output = "/Users/adeomosanya/Documents/ifa-professional-portal/cyber-essentials/MEMA-Cyber-Essentials-Answers.xlsx"
 
 # MEMA Financial Services Answers
 data = [
@@ -148,56 +121,26 @@ data = [
     ("A8 Malware", "A8.5", "Only approved apps + list maintained?", "Yes - staff instructed to only install approved business applications. Director approves new app requests. Mobile: only official app stores used.", "Ready"),
 ]
 
-# Write data
-for row_num, row_data in enumerate(data, 2):
-    for col_num, value in enumerate(row_data, 1):
-        cell = ws.cell(row=row_num, column=col_num, value=value)
-        cell.alignment = wrap_alignment
-        cell.border = thin_border
-        if col_num == 1:
-            cell.font = section_font
-        if col_num == 5:
-            if value == "Ready":
-                cell.fill = ready_fill
-            elif "ACTION" in value or "Confirm" in value:
-                cell.fill = action_fill
-
-# Column widths
-widths = [18, 8, 45, 70, 25]
-for col, width in enumerate(widths, 1):
-    ws.column_dimensions[get_column_letter(col)].width = width
-
-ws.freeze_panes = "A2"
-
-# Summary sheet
-ws2 = wb.create_sheet("Actions Required")
-ws2["A1"] = "MEMA Financial Services - Cyber Essentials Actions"
-ws2["A1"].font = Font(bold=True, size=14)
-
-ws2["A3"] = "Before Submission - Verify:"
-ws2["A3"].font = Font(bold=True)
-
-actions = [
-    "1. macOS Firewall is ENABLED (System Settings > Network > Firewall)",
-    "2. Windows Defender Firewall is ENABLED (Settings > Privacy & security > Windows Security > Firewall)",
-    "3. Confirm insurance email address is correct",
-    "4. All devices have auto-updates enabled",
-    "5. MFA is enforced on all cloud services",
-]
-
-for i, action in enumerate(actions, 4):
-    ws2[f"A{i}"] = action
+# Outstanding actions and company details are queried from the answers, not listed here
+store = connect(os.environ.get(CE_STORE_ENV) or ':memory:')
+create_schema(store)
+put_answers(store, ORGANISATION, data, layout="answers")
 
-ws2["A10"] = "Company Details Confirmed:"
-ws2["A10"].font = Font(bold=True)
-ws2["A11"] = "MEMA Financial Services Ltd"
-ws2["A12"] = "Company Number: 15382445"
-ws2["A13"] = "34-35 Hatton Garden, London, EC1N 8DX"
-ws2["A14"] = "IT Contact: Ade Omosanya, Director"
+# Nightly runs: reuse the last file when neither this script nor the templates changed.
+# Checked after put_answers so a cache hit still records the answers in the store
+cache = OutputCache.from_env()
+cache_key = cache.key(sources=[__file__]) if cache else None
+if cache and cache.fetch(cache_key, output):
+    store.close()
+    print(f"Inputs unchanged - copied cached workbook to {output}")
+    sys.exit(0)
 
-ws2.column_dimensions["A"].width = 80
+wb = render_organisation(store, ORGANISATION)
+store.close()
 
 # Save
-output = "/Users/adeomosanya/Documents/ifa-professional-portal/cyber-essentials/MEMA-Cyber-Essentials-Answers.xlsx"
 wb.save(output)
+if cache:
+    cache.store(cache_key, output)
 print(f"Created: {output}")
+print(f"Styles: {format_style_report(style_report(output))}")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Workbook generation benchmarks
+
+Builds each workbook type (v3 pricing in memory, streaming and direct mode,
+Monte Carlo growth, Cyber Essentials, chart-heavy layouts) at several scales
+and records wall time, peak RSS, tracemalloc peak/blocks and output size.
+
+Usage: benchmark-workbooks.py [--quick] [--case KIND ...] [--repeat N]
+           [--output results.json] [--baseline baseline.json] [--save-baseline]
+           [--threshold METRIC=FRACTION ...]
+
+With --baseline the run is compared against a stored result file and exits
+with status 1 if any metric regressed; --save-baseline writes this run to
+the --baseline path instead.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.bench import (DEFAULT_THRESHOLDS, SCALES, compare, format_metrics, load_results, run_suite,
+                                 save_results)
+
+
+def parse_threshold(text):
+    metric, _, value = text.partition('=')
+    if metric not in DEFAULT_THRESHOLDS or not value:
+        raise argparse.ArgumentTypeError(f'expected METRIC=FRACTION with METRIC one of {sorted(DEFAULT_THRESHOLDS)}')
+    return metric, float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark workbook generation')
+    parser.add_argument('--case', action='append', choices=sorted(SCALES), dest='cases',
+                        help='case kind to run (repeatable; default: all)')
+    parser.add_argument('--quick', action='store_true', help='only the two smallest scales of each case')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case (best is kept)')
+    parser.add_argument('--output', help='write results JSON here')
+    parser.add_argument('--baseline', help='baseline JSON to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='store this run as the --baseline file')
+    parser.add_argument('--threshold', type=parse_threshold, action='append', default=[],
+                        help='allowed relative growth, e.g. seconds=0.3 (defaults: ' +
+                             ', '.join(f'{k}={v}' for k, v in DEFAULT_THRESHOLDS.items()) + ')')
+    args = parser.parse_args()
+    if args.save_baseline and not args.baseline:
+        parser.error('--save-baseline needs --baseline PATH')
+
+    results = run_suite(args.cases, quick=args.quick, repeat=args.repeat,
+                        progress=lambda name, metrics: print(f"{name:32} {format_metrics(metrics)}", flush=True))
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if args.baseline:
+        regressions = compare(results, load_results(args.baseline), dict(args.threshold))
+        if not regressions:
+            print(f"\n✅ No regressions against {args.baseline}")
+            return 0
+        print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+        for name, metric, old, new, change in regressions:
+            print(f"  {name:32} {metric:15} {old} -> {new} (+{change:.0%})")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
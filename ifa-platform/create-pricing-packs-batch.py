@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Plannetic Pricing Packs - batch generator
+
+Builds one personalised v3 pricing/ROI workbook per prospect firm in a CSV
+or JSONL file, spread across all CPU cores.
+
+Usage: create-pricing-packs-batch.py prospects.csv --output-dir packs/
+           [--workers N] [--mode memory|streaming] [--report timings.csv]
+           [--cached-values] [--cache-dir DIR] [--cache-max-mb N] [--tables arrow|parquet]
+           [--name-index]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.batch import read_prospects, run_batch, write_report
+from ifa_workbooks.cache import CACHE_ENV, DEFAULT_MAX_BYTES, OutputCache
+from ifa_workbooks.columnar import TABLE_FORMATS, require_pyarrow
+
+parser = argparse.ArgumentParser(description='Generate one pricing pack per prospect firm')
+parser.add_argument('prospects', help='CSV or JSONL file of prospect firms')
+parser.add_argument('--output-dir', required=True)
+parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+parser.add_argument('--mode', choices=['memory', 'streaming'], default='streaming')
+parser.add_argument('--report', help='write per-file timings to this CSV')
+parser.add_argument('--cached-values', action='store_true',
+                    help='store evaluated formula results so files read without Excel')
+parser.add_argument('--cache-dir', default=os.environ.get(CACHE_ENV),
+                    help=f'copy packs whose inputs are unchanged from this cache (default: ${CACHE_ENV})')
+parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                    help='evict least recently used cache entries above this size')
+parser.add_argument('--tables', choices=sorted(TABLE_FORMATS),
+                    help="also write each pack's tables as memory-mappable Arrow (or Parquet) files beside it")
+parser.add_argument('--name-index', action='store_true',
+                    help="also write each pack's defined names (inputs and key outputs) as a .names.json index")
+args = parser.parse_args()
+if args.tables:
+    try:
+        require_pyarrow(args.tables)
+    except ImportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+cache = OutputCache(args.cache_dir, int(args.cache_max_mb * 1024 * 1024)) if args.cache_dir else None
+
+try:
+    prospects, indexes, rejected = read_prospects(args.prospects)
+except (OSError, ValueError) as e:
+    print(f"❌ {e}")
+    sys.exit(1)
+# Bad records are skipped and reported; the other packs are still built
+for result in rejected:
+    print(f"❌ {result.firm_name or result.index}: {result.error}")
+print(f"Generating {len(prospects)} packs into {args.output_dir}")
+
+start = time.perf_counter()
+results = list(rejected)
+for result in run_batch(prospects, args.output_dir, workers=args.workers,
+                        streaming=args.mode == 'streaming', cached_values=args.cached_values, cache=cache,
+                        tables=args.tables, name_index=args.name_index, indexes=indexes):
+    results.append(result)
+    if result.error:
+        print(f"❌ {result.firm_name or result.index}: {result.error}")
+    else:
+        source = '  (cached)' if result.cached else ''
+        print(f"✅ {os.path.basename(result.path)}  {result.seconds * 1000:.0f} ms  {result.size_bytes / 1024:.1f} KB{source}")
+elapsed = time.perf_counter() - start
+
+if args.report:
+    write_report(results, args.report)
+
+failed = sum(1 for r in results if r.error)
+cached = sum(1 for r in results if r.cached)
+built = [r for r in results if r.path]   # not the rejected records
+per_file = sum(r.seconds for r in built) / len(built) if built else 0
+print(f"\nDone: {len(results) - failed} packs ({cached} from cache), {failed} failed, "
+      f"{elapsed:.1f}s wall, {per_file * 1000:.0f} ms avg per file")
+sys.exit(1 if failed else 0)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Plannetic Pricing Packs - harvest edited ROI inputs from returned packs
+
+Reads the yellow ROI Calculator input cells back out of every returned
+pack (see ifa_workbooks/harvest.py) without loading the workbooks, and
+writes them as a prospects CSV that create-pricing-packs-batch.py and
+score-prospects.py --import accept.
+
+Usage: harvest-pack-inputs.py inbox/ [more.xlsx ...] --output returned.csv [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.harvest import harvest_packs, pack_paths, write_inputs
+
+parser = argparse.ArgumentParser(description='Harvest edited ROI Calculator inputs from returned pricing packs')
+parser.add_argument('packs', nargs='+', help='returned .xlsx packs, or directories of them')
+parser.add_argument('--output', required=True, help='prospects CSV to write (batch generator format)')
+parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+args = parser.parse_args()
+
+paths = pack_paths(args.packs)
+print(f"Harvesting {len(paths)} packs")
+
+start = time.perf_counter()
+results = write_inputs(harvest_packs(paths, workers=args.workers), args.output)
+elapsed = time.perf_counter() - start
+
+for result in results:
+    if result.error:
+        print(f"❌ {os.path.basename(result.path)}: {result.error}")
+    for problem in result.problems:
+        print(f"❌ {os.path.basename(result.path)}: {problem}")
+    if result.blank:
+        print(f"   {os.path.basename(result.path)}: {len(result.blank)} input cells left blank, "
+              f"harvested as 0 like the sheet ({', '.join(result.blank)})")
+
+failed = sum(1 for r in results if r.error)
+flagged = sum(1 for r in results if r.problems)
+print(f"\n✅ {len(results) - failed} packs harvested into {args.output} ({flagged} with unreadable inputs), "
+      f"{failed} failed, {elapsed:.2f}s wall")
+sys.exit(1 if failed else 0)
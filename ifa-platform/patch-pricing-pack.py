@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Plannetic Pricing Packs - patch inputs in place
+
+Changes input cells of an already generated pack and updates every formula
+result downstream of them, rewriting only the sheets that changed instead of
+rebuilding the workbook.
+
+Usage: patch-pricing-pack.py PACK.xlsx --set "SHEET!CELL=VALUE" [--set ...] [--output PATH]
+
+CELL is a coordinate (B8), a defined name or the label in column A of the
+row to change. A defined name can also be given on its own, without the
+sheet:
+
+    patch-pricing-pack.py pack.xlsx --set "Competitor Pricing!Voyant AdviserGo=180" \\
+                                    --set "ROI Calculator!Cash Flow (Voyant)=180" \\
+                                    --set roi_plannetic_cost=300
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.names import read_names
+from ifa_workbooks.patch import patch_workbook
+
+
+def parse_value(text):
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_change(text):
+    target, sep, value = text.partition('=')
+    sheet, bang, cell = target.rpartition('!')
+    if not sep or not cell or (bang and not sheet):
+        raise argparse.ArgumentTypeError(f'expected SHEET!CELL=VALUE or NAME=VALUE, got {text!r}')
+    return sheet or None, cell, parse_value(value)
+
+
+parser = argparse.ArgumentParser(description='Patch input cells of a generated pricing pack')
+parser.add_argument('pack', help='.xlsx file to patch')
+parser.add_argument('--set', type=parse_change, action='append', required=True, dest='changes',
+                    metavar='SHEET!CELL=VALUE', help='input to change, or NAME=VALUE for a defined name (repeatable)')
+parser.add_argument('--output', help='write the patched pack here instead of in place')
+args = parser.parse_args()
+
+names = read_names(args.pack)
+changes = {}
+for sheet, cell, value in args.changes:
+    if sheet is None:
+        if cell not in names:
+            print(f"❌ {args.pack} has no defined name {cell!r}")
+            sys.exit(1)
+        sheet = names[cell].sheet
+    changes.setdefault(sheet, {})[cell] = value
+
+try:
+    result = patch_workbook(args.pack, changes, args.output)
+except ValueError as e:
+    print(f"❌ {e}")
+    sys.exit(1)
+
+print(f"✅ Patched {args.output or args.pack}: {result.cell_count} cells in "
+      f"{len(result.parts)} parts ({result.seconds * 1000:.0f} ms)")
+for sheet, cells in result.cells.items():
+    print(f"  {sheet}: {', '.join(sorted(cells, key=lambda c: (len(c), c)))}")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Plannetic Pricing Packs - versioned scenario store
+
+Records pricing scenarios (full input sets) in an append-only SQLite store
+and compares any number of them side by side from their stored outputs
+(see ifa_workbooks/scenarios.py). The generator scripts also record their
+own scenario when IFA_SCENARIO_STORE is set.
+
+Usage: pricing-scenarios.py scenarios.db seed
+       pricing-scenarios.py scenarios.db record NAME inputs.json
+       pricing-scenarios.py scenarios.db history [NAME]
+       pricing-scenarios.py scenarios.db compare REF... [--all] [--outputs a,b] [--changed] [--csv FILE]
+
+A REF is a scenario id, a name (its latest version) or name@version. An
+inputs file is JSON of ScenarioInputs fields; fields left out keep their
+defaults, e.g. {"competitor_stack_cost": 480, "prospect": {"tier": "professional"}}.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.scenarios import (OUTPUT_NAMES, ScenarioInputs, compare_scenarios, connect, create_schema,
+                                     record_generations, record_scenario, scenario_history)
+
+DEFAULT_OUTPUTS = ('net_annual', 'roi_pct', 'break_even_price', 'competitor_saving', 'moderate_arr_y5')
+
+parser = argparse.ArgumentParser(description='Record and compare versioned pricing scenarios')
+parser.add_argument('store', help='SQLite scenario store (created if missing)')
+commands = parser.add_subparsers(dest='command', required=True)
+commands.add_parser('seed', help="record each script generation's literal inputs")
+record = commands.add_parser('record', help='record a new version of a scenario')
+record.add_argument('name')
+record.add_argument('inputs', help='JSON file of ScenarioInputs fields')
+history = commands.add_parser('history', help='list recorded versions')
+history.add_argument('name', nargs='?')
+compare = commands.add_parser('compare', help='compare scenarios side by side')
+compare.add_argument('refs', nargs='*', help='scenario ids, names or name@version')
+compare.add_argument('--all', action='store_true', help='compare every recorded version')
+compare.add_argument('--outputs', help=f"comma-separated outputs to show (default: {','.join(DEFAULT_OUTPUTS)})")
+compare.add_argument('--changed', action='store_true', help='show every output that differs from the first REF')
+compare.add_argument('--csv', help='write all outputs of every compared scenario to this CSV')
+args = parser.parse_args()
+
+conn = connect(args.store)
+create_schema(conn)
+
+try:
+    if args.command == 'seed':
+        for name, scenario_id in record_generations(conn).items():
+            print(f"✅ {name}: scenario {scenario_id}")
+    elif args.command == 'record':
+        with open(args.inputs, encoding='utf-8') as f:
+            fields = json.load(f)
+        scenario_id = record_scenario(conn, args.name, ScenarioInputs(**fields), source=args.inputs)
+        print(f"✅ {args.name}: scenario {scenario_id}")
+    elif args.command == 'history':
+        print(f"{'Id':>5}  {'Scenario':<28} {'Source':<44} {'Version':<16} Recorded")
+        for scenario_id, name, version, source, source_version, recorded_at in scenario_history(conn, args.name):
+            label = f"{name}@{version}"
+            print(f"{scenario_id:>5}  {label[:28]:<28} {(source or '-')[:44]:<44} {source_version or '-':<16} "
+                  f"{recorded_at}")
+    else:
+        refs = [int(ref) if ref.isdigit() else ref for ref in args.refs]
+        if args.all:
+            refs += [row[0] for row in scenario_history(conn)]
+        if not refs:
+            parser.error('compare needs REFs or --all')
+        start = time.perf_counter()
+        comparison = compare_scenarios(conn, refs)
+        elapsed = time.perf_counter() - start
+        if args.changed:
+            outputs = comparison.changed()
+        elif args.outputs:
+            outputs = [name.strip() for name in args.outputs.split(',')]
+            unknown = sorted(set(outputs) - set(OUTPUT_NAMES))
+            if unknown:
+                parser.error(f"unknown outputs {unknown}; choose from {', '.join(OUTPUT_NAMES)}")
+        else:
+            outputs = list(DEFAULT_OUTPUTS)
+        print(f"{'Scenario':<28}" + ''.join(f' {name[:18]:>18}' for name in outputs))
+        columns = [comparison.column(name) for name in outputs]
+        for i, label in enumerate(comparison.labels):
+            print(f"{label[:28]:<28}" + ''.join(f' {column[i]:>18,.2f}' for column in columns))
+        if args.csv:
+            with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['id', 'scenario', *OUTPUT_NAMES])
+                for scenario_id, label, row in zip(comparison.ids, comparison.labels, comparison.outputs.tolist()):
+                    writer.writerow([scenario_id, label, *row])
+        print(f"\nCompared {len(comparison.ids)} scenarios in {elapsed * 1000:.1f} ms")
+except (KeyError, ValueError, TypeError, OSError) as e:
+    print(f"❌ {e.args[0] if isinstance(e, KeyError) else e}")
+    sys.exit(1)
+finally:
+    conn.close()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Plannetic Pricing Packs - render service
+
+Serves personalised v3 pricing packs over HTTP so a pack can be requested
+with a prospect's figures instead of by editing and rerunning
+create-pricing-excel-v3.py. See ifa_workbooks/service.py for the fields.
+
+Usage: pricing-service.py [--host HOST] [--port N] [--workers N] [--max-pending N]
+           [--cache-dir DIR] [--cache-max-mb N]
+
+    curl -o acme.xlsx 'http://127.0.0.1:8080/render/pricing?firm_name=Acme&tier=professional&cash_flow=180'
+    curl -o acme.xlsx -d '{"firm_name": "Acme", "clients_per_month": 6}' http://127.0.0.1:8080/render/pricing
+    curl http://127.0.0.1:8080/metrics
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.cache import CACHE_ENV, DEFAULT_MAX_BYTES, OutputCache
+from ifa_workbooks.service import RenderService
+
+parser = argparse.ArgumentParser(description='Serve pricing packs rendered on demand')
+parser.add_argument('--host', default='127.0.0.1')
+parser.add_argument('--port', type=int, default=8080)
+parser.add_argument('--workers', type=int, default=None, help='render processes (default: all cores)')
+parser.add_argument('--max-pending', type=int, default=None,
+                    help='distinct renders queued or running before answering 503 (default: 2 per worker)')
+parser.add_argument('--cache-dir', default=os.environ.get(CACHE_ENV),
+                    help=f'reuse packs rendered from identical inputs (default: ${CACHE_ENV})')
+parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                    help='evict least recently used cache entries above this size')
+args = parser.parse_args()
+cache = OutputCache(args.cache_dir, int(args.cache_max_mb * 1024 * 1024)) if args.cache_dir else None
+
+service = RenderService(workers=args.workers, max_pending=args.max_pending, cache=cache)
+print(f"✅ Serving pricing packs on http://{args.host}:{args.port} "
+      f"({service.workers} workers, {service.max_pending} pending renders max)")
+try:
+    asyncio.run(service.serve(args.host, args.port))
+except KeyboardInterrupt:
+    pass
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Plannetic Pricing Packs - bulk ROI scoring of a prospect database
+
+Scores every firm in a local SQLite prospect database (a stand-in for the
+platform's firm_profiles table, see ifa_workbooks/scoring.py) with the ROI
+Calculator model and prints the firms with the highest net annual benefit.
+
+Usage: score-prospects.py prospects.db [--import prospects.csv] [--demo N]
+           [--chunk-size N] [--top N]
+
+    score-prospects.py demo.db --demo 1000000 --top 10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from ifa_workbooks.batch import load_prospects
+from ifa_workbooks.scoring import (DEFAULT_CHUNK_SIZE, connect, create_schema, import_prospects,
+                                   insert_demo_prospects, score_prospects, top_prospects)
+
+parser = argparse.ArgumentParser(description='Score and rank every prospect in a SQLite database by ROI')
+parser.add_argument('database', help='SQLite file (created if missing)')
+parser.add_argument('--import', dest='import_path', metavar='FILE',
+                    help='first add the prospects in this CSV or JSONL file (batch generator format)')
+parser.add_argument('--demo', type=int, default=0, metavar='N', help='first add N synthetic prospects')
+parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='rows per fetch/insert round trip')
+parser.add_argument('--top', type=int, default=20, help='prospects to list (0 for none)')
+args = parser.parse_args()
+
+conn = connect(args.database)
+create_schema(conn)
+
+if args.import_path:
+    try:
+        firm_ids = import_prospects(conn, load_prospects(args.import_path))
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"Imported {len(firm_ids)} prospects from {args.import_path}")
+if args.demo:
+    start = time.perf_counter()
+    insert_demo_prospects(conn, args.demo)
+    print(f"Added {args.demo} synthetic prospects ({time.perf_counter() - start:.1f}s)")
+
+result = score_prospects(conn, chunk_size=args.chunk_size)
+print(f"✅ Scored {result.scored} prospects in {result.seconds:.1f}s ({result.rows_per_second:,.0f}/s)")
+for firm_id in result.skipped:
+    print(f"❌ {firm_id}: unknown tier and no plannetic_cost")
+
+if args.top:
+    print(f"\n{'Rank':>6}  {'Firm':<32} {'Net/year':>12} {'ROI %':>8} {'Break-even':>11}")
+    for row in top_prospects(conn, args.top):
+        roi = f"{row['roi_pct']:.0f}" if row['roi_pct'] is not None else '-'
+        net, break_even = f"£{row['net_annual']:,.0f}", f"£{row['break_even_price']:,.0f}"
+        print(f"{row['rank']:>6}  {row['firm_name'][:32]:<32} {net:>12} {roi:>8} {break_even:>11}")
+conn.close()
+sys.exit(1 if result.skipped else 0)
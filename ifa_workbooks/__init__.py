@@ -0,0 +1,91 @@
+"""
+Shared helpers for the Plannetic pricing and Cyber Essentials Excel generators
+
+The builders are plain functions, so a long-lived worker imports this
+package once and calls them as often as it likes:
+
+    from ifa_workbooks import ProspectParams, build_ce_workbook, build_pricing_workbook
+
+    build_pricing_workbook(ProspectParams(firm_name='Acme')).save('acme.xlsx')
+
+Names below are imported from their submodule on first access, so
+importing the package (or one builder) does not load the others.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'build_analysis_workbook': 'analysis',
+    'OutputCache': 'cache',
+    'run_ce_batch': 'ce_batch',
+    'QuestionDiffer': 'ce_diff',
+    'diff_question_sets': 'ce_diff',
+    'put_answers': 'ce_store',
+    'put_firm': 'ce_store',
+    'render_organisation': 'ce_store',
+    'ChartTemplate': 'charts',
+    'chart_template': 'charts',
+    'CohortRevenue': 'cohorts',
+    'ContractPlan': 'cohorts',
+    'cohort_revenue': 'cohorts',
+    'pricing_tables': 'columnar',
+    'read_table': 'columnar',
+    'write_tables': 'columnar',
+    'CENotes': 'cyber_essentials',
+    'NotesSection': 'cyber_essentials',
+    'build_ce_workbook': 'cyber_essentials',
+    'DirectColumn': 'direct',
+    'DirectTable': 'direct',
+    'DirectWorkbook': 'direct',
+    'FormulaEngine': 'formulas',
+    'FormulaError': 'formulas',
+    'write_cached_values': 'formulas',
+    'GrowthBands': 'growth',
+    'simulate_growth': 'growth',
+    'harvest_pack': 'harvest',
+    'harvest_packs': 'harvest',
+    'CompiledLayout': 'layout',
+    'LayoutError': 'layout',
+    'compile_layout': 'layout',
+    'load_layout': 'layout',
+    'MixRevenue': 'mix',
+    'mix_revenue': 'mix',
+    'vary_share': 'mix',
+    'CellName': 'names',
+    'define_name': 'names',
+    'export_name_index': 'names',
+    'read_name_index': 'names',
+    'read_names': 'names',
+    'patch_workbook': 'patch',
+    'ProspectParams': 'pricing',
+    'build_pricing_workbook': 'pricing',
+    'build_pricing_v2_workbook': 'pricing_v2',
+    'RevenueGrid': 'revenue',
+    'revenue_grid': 'revenue',
+    'RoiSurface': 'roi',
+    'roi_surface': 'roi',
+    'ScenarioInputs': 'scenarios',
+    'compare_scenarios': 'scenarios',
+    'record_scenario': 'scenarios',
+    'RenderService': 'service',
+    'score_prospects': 'scoring',
+    'top_prospects': 'scoring',
+    'StreamingWorkbook': 'streaming',
+    'StyleRegistry': 'styles',
+    'style_report': 'styles',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
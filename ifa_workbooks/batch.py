@@ -0,0 +1,215 @@
+"""
+Batch generation of per-prospect pricing packs
+
+Reads prospect firms from a CSV or JSONL file, builds one personalised v3
+pricing workbook per row across a process pool and writes each file
+atomically (temp file in the target directory, then os.replace) so a
+crashed or interrupted run never leaves a half-written .xlsx behind. With
+an OutputCache, packs whose inputs are unchanged since a previous run are
+copied from the cache instead of rebuilt. With tables='arrow' (or
+'parquet') each pack's tables are also written beside it (columnar.py), and
+with name_index the JSON index of its defined names (names.py).
+
+read_prospects() skips records that are not valid prospects and returns
+them as failed PackResults, so one typo in a large file costs one pack,
+not the run.
+
+CSV/JSONL fields (all optional; unnamed firms get prospect-N file names):
+    firm_name, tier, plannetic_cost, hours_per_client, time_saved_pct,
+    hourly_rate, clients_per_month, plus one column per TOOL_STACK key
+    (crm, risk_profiling, cash_flow, ...) holding that tool's monthly cost.
+"""
+
+import csv
+import json
+import math
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from .columnar import pricing_tables, write_tables
+from .formulas import FormulaEngine, write_cached_values
+from .names import export_name_index
+from .pricing import TOOL_STACK, ProspectParams, build_pricing_workbook
+from .xlsx_parts import atomic_path
+
+NUMERIC_FIELDS = ('plannetic_cost', 'hours_per_client', 'time_saved_pct', 'hourly_rate', 'clients_per_month')
+TOOL_KEYS = tuple(key for key, _, _, _ in TOOL_STACK)
+
+
+@dataclass
+class PackResult:
+    """Outcome of rendering one prospect's pack"""
+
+    index: int
+    firm_name: str
+    path: str
+    seconds: float
+    size_bytes: int
+    error: str = None
+    cached: bool = False
+
+
+def _number(value, name):
+    if value is None or value == '':
+        return None
+    number = float(value)
+    # float() also accepts 'nan' and 'inf', which openpyxl writes as empty cells
+    if not math.isfinite(number):
+        raise ValueError(f'{name} must be a finite number, got {value!r}')
+    return number
+
+
+def prospect_from_row(row):
+    """Turn one CSV/JSONL record into ProspectParams"""
+    kwargs = {'firm_name': str(row.get('firm_name') or '').strip()}
+    if row.get('tier'):
+        kwargs['tier'] = str(row['tier']).strip().lower()
+    for name in NUMERIC_FIELDS:
+        value = _number(row.get(name), name)
+        if value is not None:
+            kwargs[name] = value
+    tool_costs = {key: _number(row.get(key), key) for key in TOOL_KEYS}
+    kwargs['tool_costs'] = {key: cost for key, cost in tool_costs.items() if cost is not None}
+    return ProspectParams(**kwargs)
+
+
+def _records(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            return [json.loads(line) for line in f if line.strip()]
+        return list(csv.DictReader(f))
+
+
+def load_prospects(path):
+    """Read prospects from a .csv or .jsonl file; the first bad record raises ValueError"""
+    prospects = []
+    for number, row in enumerate(_records(path), start=1):
+        try:
+            prospects.append(prospect_from_row(row))
+        except ValueError as exc:
+            raise ValueError(f'{path} record {number}: {exc}') from None
+    return prospects
+
+
+def read_prospects(path):
+    """
+    Read prospects from a .csv or .jsonl file, skipping bad records.
+    Returns (prospects, indexes, rejected): indexes holds each prospect's
+    0-based record position (pass it to run_batch), rejected a PackResult
+    with the error for every record that is not a valid prospect.
+    """
+    prospects, indexes, rejected = [], [], []
+    for index, row in enumerate(_records(path)):
+        try:
+            prospects.append(prospect_from_row(row))
+        except ValueError as exc:
+            firm_name = str(row.get('firm_name') or '').strip()
+            rejected.append(PackResult(index, firm_name, '', 0.0, 0, f'record {index + 1}: {exc}'))
+        else:
+            indexes.append(index)
+    return prospects, indexes, rejected
+
+
+def pack_filename(params, index):
+    """Filesystem-safe output name for a prospect's pack"""
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', params.firm_name).strip('-')
+    return f"Plannetic-Pricing-{slug or f'prospect-{index + 1}'}.xlsx"
+
+
+def unique_filenames(names):
+    """
+    names with each repeat renamed name-N.xlsx, N counting up from its
+    1-based position until the name is not taken, so no two outputs share
+    a path. Names are compared ignoring case, as the default macOS and
+    Windows filesystems do ('Acme' and 'acme' are the same file there).
+    """
+    unique, seen = [], set()
+    for index, name in enumerate(names):
+        number = index + 1
+        candidate = name
+        while candidate.casefold() in seen:
+            candidate = f'{name[:-5]}-{number}.xlsx'
+            number += 1
+        seen.add(candidate.casefold())
+        unique.append(candidate)
+    return unique
+
+
+def _assign_filenames(prospects, indexes=None):
+    indexes = range(len(prospects)) if indexes is None else indexes
+    return unique_filenames([pack_filename(params, index) for index, params in zip(indexes, prospects)])
+
+
+def write_atomic(wb, path):
+    """Save wb to path via a temp file in the same directory"""
+    with atomic_path(path) as tmp_path:
+        wb.save(tmp_path)
+
+
+def render_pack(index, params, path, streaming=True, cached_values=False, cache=None, tables=None,
+                name_index=False):
+    """Build and atomically save one pack (runs inside a worker process)"""
+    start = time.perf_counter()
+    try:
+        if tables:
+            # Cheap next to the workbook, so written whether or not the cache hits
+            write_tables(pricing_tables(params), os.path.splitext(path)[0], tables)
+        if cache is not None:
+            # The file name is not an input: renaming a firm's pack still hits
+            key = cache.key({'params': params, 'streaming': streaming, 'cached_values': cached_values})
+            if cache.fetch(key, path):
+                if name_index:
+                    export_name_index(path)
+                return PackResult(index, params.firm_name, path, time.perf_counter() - start,
+                                  os.path.getsize(path), cached=True)
+        wb = build_pricing_workbook(params, streaming=streaming)
+        write_atomic(wb, path)
+        if cached_values:
+            engine = FormulaEngine.from_file(path) if streaming else FormulaEngine.from_workbook(wb)
+            write_cached_values(engine, path)
+        if cache is not None:
+            cache.store(key, path)
+        if name_index:
+            export_name_index(path)
+    except Exception as exc:
+        return PackResult(index, params.firm_name, path, time.perf_counter() - start, 0, f'{type(exc).__name__}: {exc}')
+    return PackResult(index, params.firm_name, path, time.perf_counter() - start, os.path.getsize(path))
+
+
+def run_batch(prospects, output_dir, workers=None, streaming=True, cached_values=False, cache=None, tables=None,
+              name_index=False, indexes=None):
+    """
+    Render every prospect's pack into output_dir using a process pool.
+
+    Yields a PackResult per prospect as each one finishes (completion order,
+    not input order). workers defaults to os.cpu_count(); cached_values
+    stores evaluated formula results in each file (see formulas.py); cache
+    (an OutputCache) reuses packs built from identical inputs; tables
+    ('arrow' or 'parquet') also writes each pack's tables beside it (see
+    columnar.py) and name_index its pack.names.json (see names.py).
+    indexes sets each prospect's PackResult.index (default its position),
+    e.g. its record position from read_prospects.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    indexes = list(range(len(prospects))) if indexes is None else list(indexes)
+    names = _assign_filenames(prospects, indexes)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [
+            pool.submit(render_pack, index, params, os.path.join(output_dir, name), streaming, cached_values, cache,
+                        tables, name_index)
+            for index, params, name in zip(indexes, prospects, names)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def write_report(results, path):
+    """Write per-file timings to a CSV report, in input order"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['index', 'firm_name', 'path', 'seconds', 'size_bytes', 'cached', 'error'])
+        for r in sorted(results, key=lambda r: r.index):
+            writer.writerow([r.index, r.firm_name, r.path, f'{r.seconds:.4f}', r.size_bytes, int(r.cached), r.error or ''])
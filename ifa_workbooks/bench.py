@@ -0,0 +1,250 @@
+"""
+Benchmarks for workbook generation throughput and memory
+
+Each case builds one workbook type at one scale and saves it:
+
+    pricing-memory / pricing-streaming   firms = Revenue Calculator rows
+    pricing-direct                       firms, table written as raw XML rows
+    growth                               years = Monte Carlo fan chart months / 12
+    ce                                   questions = Cyber Essentials answer rows
+    charts                               charts = bar charts on one layout sheet
+
+run_case() runs a case in a fresh spawned process, so peak RSS belongs to
+that case alone. It records:
+
+    seconds         best wall time of `repeat` build+save runs
+    peak_rss_mb     peak resident set size of the process
+    traced_peak_mb  peak Python allocation size during one build+save (tracemalloc)
+    blocks          Python memory blocks held by the built workbook before saving
+    size_bytes      size of the saved .xlsx
+
+Results are written as JSON ({"meta": ..., "cases": {name: metrics}}).
+compare() flags every metric that grew by more than its threshold against
+a stored baseline, so batch-run slowdowns show up in review instead of in
+the nightly job.
+"""
+
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+import openpyxl
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, peak RSS is not recorded
+    resource = None
+
+# Scales per case kind; --quick uses the first two of each
+SCALES = {
+    'pricing-memory': ('firms', (16, 1_000, 10_000)),
+    'pricing-streaming': ('firms', (16, 1_000, 10_000)),
+    'pricing-direct': ('firms', (16, 1_000, 10_000)),
+    'growth': ('years', (5, 10, 25)),
+    'ce': ('questions', (100, 1_000, 10_000)),
+    'charts': ('charts', (1, 10, 50)),
+}
+
+# Relative growth over the baseline that counts as a regression
+DEFAULT_THRESHOLDS = {
+    'seconds': 0.20,
+    'peak_rss_mb': 0.10,
+    'traced_peak_mb': 0.10,
+    'blocks': 0.10,
+    'size_bytes': 0.05,
+}
+
+GROWTH_BENCH_PATHS = 20_000
+
+
+def _pricing(scale, streaming, direct=False):
+    from .pricing import build_pricing_workbook
+
+    return build_pricing_workbook(streaming=streaming, firm_counts=range(1, scale + 1), direct=direct)
+
+
+def _growth(scale):
+    from .growth import simulate_growth
+    from .pricing import build_pricing_workbook
+
+    bands = simulate_growth('Moderate', paths=GROWTH_BENCH_PATHS, months=12 * scale, seed=0)
+    return build_pricing_workbook(growth_bands=bands)
+
+
+def _ce(scale):
+    from .cyber_essentials import CENotes, NotesSection, build_ce_workbook, status_legend
+
+    statuses = ('Ready', 'Pending', 'Confirm', 'Partial', 'N/A')
+    answers = [
+        (f'A{i // 25 + 1} - Section', f'A{i // 25 + 1}.{i % 25 + 1}', f'Question {i}?',
+         'Guidance text for the question', 'Notes', f'Draft answer {i}', statuses[i % len(statuses)])
+        for i in range(scale)
+    ]
+    notes = CENotes('Summary', 'Benchmark', [status_legend(), NotesSection('Items:', ['one', 'two'])])
+    return build_ce_workbook(answers, notes=notes)
+
+
+def _charts(scale):
+    from openpyxl import Workbook
+
+    from .layout import compile_layout
+    from .styles import PLANNETIC_STYLES, StyleRegistry
+
+    rows = [{'key': f'r{i}', 'values': [f'Item {i}', i * 10, i * 12]} for i in range(1, 13)]
+    blocks = [{
+        'id': 'data', 'type': 'table', 'at': 'A1',
+        'header_style': ['header', 'border'], 'style': ['border'],
+        'columns': [{'key': 'label', 'header': 'Label'},
+                    {'key': 'a', 'header': 'A', 'format': 'money'},
+                    {'key': 'b', 'header': 'B', 'format': 'money'}],
+        'rows': rows,
+    }]
+    for i in range(scale):
+        blocks.append({
+            'type': 'chart', 'kind': 'bar', 'at': f'E{1 + 18 * i}',
+            'data': '{data.header.a}:{data.r12.b}', 'categories': '{data.label}',
+            'titles_from_data': True, 'options': {'title': f'Chart {i + 1}', 'width': 12, 'height': 8},
+        })
+    wb = Workbook()
+    compile_layout({'sheet': 'Charts', 'blocks': blocks}).render(wb, StyleRegistry(wb, PLANNETIC_STYLES, 'Bench'),
+                                                                 ws=wb.active)
+    return wb
+
+
+BUILDERS = {
+    'pricing-memory': lambda scale: _pricing(scale, streaming=False),
+    'pricing-streaming': lambda scale: _pricing(scale, streaming=True),
+    'pricing-direct': lambda scale: _pricing(scale, streaming=False, direct=True),
+    'growth': _growth,
+    'ce': _ce,
+    'charts': _charts,
+}
+
+
+def case_name(kind, scale):
+    unit = SCALES[kind][0]
+    return f'{kind}-{scale}' if unit == kind else f'{kind}-{unit}-{scale}'
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _measure(kind, scale, repeat):
+    """Run one case in this (fresh) process and return its metrics"""
+    build = BUILDERS[kind]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.xlsx')
+
+        # Untraced runs first: tracemalloc slows allocation-heavy code
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            build(scale).save(path)
+            times.append(time.perf_counter() - start)
+        size = os.path.getsize(path)
+        peak_rss = _peak_rss_mb()
+
+        tracemalloc.start()
+        baseline = tracemalloc.take_snapshot()
+        wb = build(scale)
+        held = tracemalloc.take_snapshot().compare_to(baseline, 'filename')
+        wb.save(path)
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del wb
+
+    return {
+        'seconds': round(min(times), 4),
+        'peak_rss_mb': None if peak_rss is None else round(peak_rss, 1),
+        'traced_peak_mb': round(traced_peak / (1024 * 1024), 2),
+        'blocks': sum(stat.count_diff for stat in held),
+        'size_bytes': size,
+    }
+
+
+def run_case(kind, scale, repeat=3):
+    """Metrics for one case, measured in a separate spawned process"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+        return pool.submit(_measure, kind, scale, repeat).result()
+
+
+def run_suite(kinds=None, quick=False, repeat=3, progress=None):
+    """Run every selected case; progress(name, metrics) is called after each"""
+    results = {'meta': environment(), 'cases': {}}
+    for kind in kinds or SCALES:
+        _, scales = SCALES[kind]
+        for scale in scales[:2] if quick else scales:
+            name = case_name(kind, scale)
+            metrics = run_case(kind, scale, repeat)
+            results['cases'][name] = metrics
+            if progress:
+                progress(name, metrics)
+    return results
+
+
+def environment():
+    """Versions and machine details stored alongside results"""
+    return {
+        'python': platform.python_version(),
+        'openpyxl': openpyxl.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def save_results(results, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_results(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(results, baseline, thresholds=None):
+    """
+    Regressions of results against baseline.
+
+    Returns (case, metric, baseline value, new value, relative change) for
+    every metric that grew by more than its threshold. Cases or metrics
+    missing on either side are skipped.
+    """
+    thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    regressions = []
+    for name, metrics in results['cases'].items():
+        base = baseline.get('cases', {}).get(name)
+        if base is None:
+            continue
+        for metric, limit in thresholds.items():
+            old, new = base.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > limit:
+                regressions.append((name, metric, old, new, change))
+    return regressions
+
+
+def format_metrics(metrics):
+    rss = metrics['peak_rss_mb']
+    return (f"{metrics['seconds'] * 1000:9.1f} ms  "
+            f"{'-' if rss is None else f'{rss:.1f}':>7} MB RSS  "
+            f"{metrics['traced_peak_mb']:8.2f} MB traced  "
+            f"{metrics['blocks']:>9,} blocks  "
+            f"{metrics['size_bytes'] / 1024:9.1f} KB")
@@ -0,0 +1,162 @@
+"""
+Content-addressed cache of generated .xlsx files
+
+Every generator is a pure function of its inputs (the data literals in the
+script, the ifa_workbooks templates and layouts, and any CLI options), so a
+file built from the same inputs is the same file. OutputCache hashes those
+inputs into a key and keeps one .xlsx per key in a cache directory:
+
+    cache = OutputCache('~/.cache/ifa-workbooks')
+    key = cache.key({'mode': 'memory', 'seed': 2025}, sources=[__file__])
+    if not cache.fetch(key, output_path):
+        build_and_save(output_path)
+        cache.store(key, output_path)
+
+A hit is a file copy. The directory is bounded by size: every hit or store
+touches the entry, and store() evicts least recently used entries until the
+total is back under max_bytes. Writes go through a temp file + os.replace,
+so concurrent batch workers sharing one cache never see partial files.
+
+Scripts without a command line enable the cache from the environment
+(OutputCache.from_env): IFA_WORKBOOK_CACHE names the directory and
+IFA_WORKBOOK_CACHE_MAX_MB optionally overrides the size bound.
+"""
+
+import dataclasses
+import glob
+import hashlib
+import json
+import os
+import shutil
+from functools import lru_cache
+
+import openpyxl
+
+from .xlsx_parts import atomic_path
+
+# Bump when the key recipe changes so old entries stop matching
+CACHE_FORMAT = 1
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+CACHE_ENV = 'IFA_WORKBOOK_CACHE'
+CACHE_MAX_MB_ENV = 'IFA_WORKBOOK_CACHE_MAX_MB'
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _jsonable(value):
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, 'tolist'):  # NumPy arrays and scalars
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f'cannot hash {type(value).__name__} into a cache key')
+
+
+@lru_cache(maxsize=None)
+def _file_digest(path, mtime_ns, size):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def source_fingerprint(paths):
+    """Digest of the contents of the given files (order-independent)"""
+    digest = hashlib.sha256()
+    for path in sorted(os.path.abspath(p) for p in paths):
+        stat = os.stat(path)
+        digest.update(os.path.relpath(path, PACKAGE_DIR).encode())
+        digest.update(_file_digest(path, stat.st_mtime_ns, stat.st_size).encode())
+    return digest.hexdigest()
+
+
+def template_sources():
+    """The ifa_workbooks modules and layouts every generator depends on"""
+    return (glob.glob(os.path.join(PACKAGE_DIR, '*.py'))
+            + glob.glob(os.path.join(PACKAGE_DIR, 'layouts', '*')))
+
+
+def copy_atomic(src, dest):
+    """Copy src to dest via a temp file in dest's directory"""
+    with atomic_path(dest) as tmp_path:
+        shutil.copyfile(src, tmp_path)
+
+
+class OutputCache:
+    """Directory of generated workbooks keyed by a hash of their inputs"""
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls):
+        """Cache configured by IFA_WORKBOOK_CACHE, or None when it is unset"""
+        directory = os.environ.get(CACHE_ENV)
+        if not directory:
+            return None
+        max_mb = os.environ.get(CACHE_MAX_MB_ENV)
+        return cls(directory, int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES)
+
+    def key(self, inputs=None, sources=()):
+        """
+        Cache key for a build.
+
+        inputs is any JSON-able description of the build's parameters
+        (dataclasses and NumPy arrays are converted); sources are extra
+        files whose contents feed the build, typically the calling script.
+        The ifa_workbooks templates and the openpyxl version are always
+        included.
+        """
+        digest = hashlib.sha256()
+        digest.update(f'{CACHE_FORMAT}:{openpyxl.__version__}'.encode())
+        digest.update(source_fingerprint(template_sources() + list(sources)).encode())
+        digest.update(json.dumps(inputs, sort_keys=True, default=_jsonable).encode())
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, f'{key}.xlsx')
+
+    def fetch(self, key, output_path):
+        """Copy the cached file for key to output_path; False on a miss"""
+        cached = self.path(key)
+        try:
+            os.utime(cached)  # mark as recently used
+            copy_atomic(cached, output_path)
+        except FileNotFoundError:
+            # Missing, or evicted by another process between the two calls
+            return False
+        return True
+
+    def store(self, key, output_path):
+        """Add a freshly built file to the cache, then evict down to max_bytes"""
+        copy_atomic(output_path, self.path(key))
+        self.evict(keep=key)
+
+    def entries(self):
+        """(path, size, last used) for every cached file, oldest first"""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*.xlsx')):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda e: e[2])
+
+    def evict(self, keep=None):
+        """Delete least recently used files until the cache fits max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        keep_path = self.path(keep) if keep else None
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep_path:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        return total
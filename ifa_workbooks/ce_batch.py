@@ -0,0 +1,178 @@
+"""
+Batch generation of per-firm Cyber Essentials workbooks
+
+Firms going through certification answer most questions the same way, so
+a batch starts from one base answer set - an exported CE workbook or an
+organisation already in the answer store - and a small override file per
+firm holding only the answers that differ. The base is stored once and
+each firm as its overrides (ce_store.put_firm), so loading hundreds of
+firms writes a few rows each. Every firm's workbook is then rendered from
+the store across a process pool and written atomically, like the pricing
+packs (batch.py).
+
+Override files are JSON:
+
+    {
+      "organisation": "Acme Wealth Ltd",
+      "answers": {
+        "A1.1": "Acme Wealth Ltd",
+        "A1.3": "12345678",
+        "A4.1.1": {"answer": "Yes - Windows Defender Firewall on all laptops", "status": "Ready"}
+      }
+    }
+
+A string sets the answer and keeps the base status; an object may set
+"answer", "status" or both. "organisation" defaults to the file name.
+"""
+
+import csv
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from .batch import unique_filenames, write_atomic
+from .ce_store import LAYOUTS, action_counts, connect, outstanding, put_answers, put_firm, render_organisation
+from .cyber_essentials import read_ce_workbook
+
+
+@dataclass
+class FirmOverrides:
+    """One firm's answers that differ from the base set"""
+
+    organisation: str
+    answers: dict       # q_no -> (answer or None, status or None)
+
+
+@dataclass
+class FirmResult:
+    """Outcome of rendering one firm's workbook"""
+
+    index: int
+    organisation: str
+    path: str
+    seconds: float
+    size_bytes: int
+    outstanding: int = 0
+    actions: int = 0    # answers whose status asks for an ACTION
+    confirms: int = 0   # answers still to Confirm
+    error: str = None
+
+
+def _override(q_no, value, path):
+    if isinstance(value, str):
+        return value, None
+    if isinstance(value, dict) and value and set(value) <= {'answer', 'status'}:
+        return value.get('answer'), value.get('status')
+    raise ValueError(f'{path}: {q_no} must be an answer string or an object with "answer" and/or "status"')
+
+
+def load_overrides(path):
+    """Read one firm's override file"""
+    with open(path, encoding='utf-8') as f:
+        record = json.load(f)
+    if not isinstance(record, dict) or not isinstance(record.get('answers', {}), dict):
+        raise ValueError(f'{path}: expected an object with an "answers" object')
+    organisation = str(record.get('organisation') or '').strip()
+    organisation = organisation or os.path.splitext(os.path.basename(path))[0]
+    answers = {str(q_no): _override(q_no, value, path) for q_no, value in record.get('answers', {}).items()}
+    return FirmOverrides(organisation, answers)
+
+
+def override_paths(paths):
+    """Expand directories to the .json files in them, sorted"""
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path):
+            expanded.extend(sorted(os.path.join(path, name) for name in os.listdir(path)
+                                   if name.lower().endswith('.json')))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def load_base(conn, base):
+    """
+    Make base available in the store: an exported CE workbook (.xlsx) is
+    stored under its file name; anything else must already be stored.
+    Returns the base's organisation name.
+    """
+    if base.lower().endswith('.xlsx') and os.path.isfile(base):
+        columns, rows = read_ce_workbook(base)
+        name = os.path.splitext(os.path.basename(base))[0]
+        layout = next((key for key, value in LAYOUTS.items() if value.columns == columns), None)
+        if layout is None:
+            raise ValueError(f'{base}: columns {columns} match no known CE layout')
+        put_answers(conn, name, rows, layout=layout)
+        return name
+    if conn.execute('SELECT 1 FROM ce_organisations WHERE organisation = ?', (base,)).fetchone() is None:
+        raise KeyError(f"'{base}' is neither an exported CE workbook nor an organisation in the store")
+    return base
+
+
+def load_firms(conn, base, paths):
+    """Store every override file's firm on top of base; returns the organisation names in file order"""
+    firms = []
+    for path in override_paths(paths):
+        firm = load_overrides(path)
+        if firm.organisation in firms:
+            raise ValueError(f"{path}: '{firm.organisation}' already has an override file in this batch")
+        try:
+            put_firm(conn, firm.organisation, base, firm.answers)
+        except (KeyError, ValueError) as exc:
+            raise ValueError(f'{path}: {exc.args[0]}') from None
+        firms.append(firm.organisation)
+    return firms
+
+
+def firm_filename(organisation, index):
+    """Filesystem-safe output name for a firm's workbook"""
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', organisation).strip('-')
+    return f"{slug or f'firm-{index + 1}'}-Cyber-Essentials-Answers.xlsx"
+
+
+def render_firm(index, store_path, organisation, path):
+    """Render and atomically save one firm's workbook (runs inside a worker process)"""
+    start = time.perf_counter()
+    try:
+        conn = connect(store_path, readonly=True)
+        try:
+            wb = render_organisation(conn, organisation)
+            waiting = len(outstanding(conn, organisation))
+            actions, confirms = action_counts(conn, organisation)
+        finally:
+            conn.close()
+        write_atomic(wb, path)
+    except Exception as exc:
+        return FirmResult(index, organisation, path, time.perf_counter() - start, 0,
+                          error=f'{type(exc).__name__}: {exc}')
+    return FirmResult(index, organisation, path, time.perf_counter() - start, os.path.getsize(path),
+                      waiting, actions, confirms)
+
+
+def run_ce_batch(store_path, organisations, output_dir, workers=None):
+    """
+    Render every organisation's workbook from the store file into
+    output_dir using a process pool. Yields a FirmResult per firm as each
+    one finishes (completion order, not input order).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    names = unique_filenames([firm_filename(organisation, index) for index, organisation in enumerate(organisations)])
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(render_firm, index, store_path, organisation, os.path.join(output_dir, name))
+                   for index, (organisation, name) in enumerate(zip(organisations, names))]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def write_report(results, path):
+    """Write per-firm timings and outstanding counts to a CSV report, in input order"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['index', 'organisation', 'path', 'seconds', 'size_bytes', 'outstanding', 'actions',
+                         'confirms', 'error'])
+        for r in sorted(results, key=lambda r: r.index):
+            writer.writerow([r.index, r.organisation, r.path, f'{r.seconds:.4f}', r.size_bytes, r.outstanding,
+                             r.actions, r.confirms, r.error or ''])
@@ -0,0 +1,263 @@
+"""
+Differences between Cyber Essentials question-set revisions
+
+IASME revises the question set between rounds, and our own copies drift:
+the draft script has seven columns with Guidance and Answer Type, the
+MEMA script five, with the questions worded more tersely. diff_question_sets()
+compares two revisions on what every copy shares - section, Q No. and
+question text - and classifies each question:
+
+    unchanged    same Q No., same text (up to case, punctuation, spacing)
+    reworded     same Q No., different text
+    moved        same Q No. and text, different section
+    renumbered   no longer under its old Q No., but its text (or text close
+                 to it) is under a new one
+    added        only in the new revision
+    removed      only in the old revision
+
+Questions are matched through dictionaries, never pair by pair: first by
+Q No., then leftovers by their normalised text. Only the questions still
+unmatched after that are compared fuzzily, and each only against the few
+new questions it shares the most words with (an inverted word index), so
+a diff stays linear in the size of the question set. A QuestionDiffer
+keeps the new revision's indexes and a memo of text similarities, so
+diffing the question banks of hundreds of firms against one revision
+costs little more than diffing the first:
+
+    differ = QuestionDiffer(load_question_set('new-revision.xlsx'))
+    for organisation in firms:
+        changes = differ.diff(store_question_set(conn, organisation))
+
+build_diff_workbook() lays the changes out as a CE-styled workbook.
+"""
+
+import ast
+import os
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+from .ce_store import answer_rows
+from .cyber_essentials import CENotes, NotesSection, build_ce_workbook, read_ce_workbook
+
+# Lowest similarity at which an unmatched old question counts as renumbered
+RENUMBER_THRESHOLD = 0.6
+# New questions compared against each unmatched old one, by shared words
+FUZZY_CANDIDATES = 8
+# Index entries read per unmatched question, rarest words first: words in
+# almost every question ('your', 'devices') say little and would make the
+# candidate search quadratic
+CANDIDATE_SCAN = 2000
+
+CHANGE_KINDS = ('reworded', 'moved', 'renumbered', 'added', 'removed', 'unchanged')
+CHANGE_FILLS = {'added': 'ready', 'reworded': 'pending', 'renumbered': 'confirm', 'moved': 'confirm',
+                'removed': 'partial'}
+
+# (header, width) for the Changes sheet; the last column carries the fill
+DIFF_COLUMNS = (
+    ('Section', 18),
+    ('Q No.', 8),
+    ('Old Q No.', 9),
+    ('Old Question', 45),
+    ('New Question', 45),
+    ('Similarity', 11),
+    ('Change', 12),
+)
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+@dataclass(frozen=True)
+class Question:
+    """The part of a question every copy of the question set shares"""
+
+    section: str
+    q_no: str
+    text: str
+
+
+@dataclass
+class QuestionChange:
+    """How one question differs between the old and the new revision"""
+
+    kind: str
+    old: Question = None
+    new: Question = None
+    similarity: float = 1.0
+
+
+def normalise(text):
+    """Lower-case words only, so spacing and punctuation edits are not rewordings"""
+    return ' '.join(_WORD_RE.findall(str(text).lower()))
+
+
+def questions_from_rows(rows):
+    """Questions from answer rows of either column set (section, Q No., question lead both)"""
+    return [Question(str(row[0]), str(row[1]), str(row[2])) for row in rows]
+
+
+def script_data(path):
+    """
+    The `data = [...]` rows of a CE generator script, read without running
+    it (the scripts write their workbook when run).
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and node.targets[0].id == 'data'):
+            return ast.literal_eval(node.value)
+    raise ValueError(f'{path} has no top-level `data = [...]` list')
+
+
+def store_question_set(conn, organisation):
+    """Questions of an organisation in the answer store (ce_store.py)"""
+    return questions_from_rows(answer_rows(conn, organisation))
+
+
+def load_question_set(source, conn=None):
+    """
+    Questions from an exported CE workbook (.xlsx), a generator script's
+    data (.py) or, given an answer store connection, an organisation in it
+    """
+    if source.lower().endswith('.py') and os.path.isfile(source):
+        return questions_from_rows(script_data(source))
+    if source.lower().endswith('.xlsx') and os.path.isfile(source):
+        return questions_from_rows(read_ce_workbook(source)[1])
+    if conn is not None:
+        return store_question_set(conn, source)
+    raise ValueError(f'{source}: expected an exported CE workbook (.xlsx) or a CE generator script (.py)')
+
+
+class QuestionDiffer:
+    """One new revision, indexed for diffing any number of old question sets against it"""
+
+    def __init__(self, new_questions):
+        self.new = list(new_questions)
+        self.by_q_no = {}
+        self.by_text = defaultdict(list)
+        self.by_word = defaultdict(list)
+        for i, question in enumerate(self.new):
+            if question.q_no in self.by_q_no:
+                raise ValueError(f'Q No. {question.q_no} appears twice in the new question set')
+            self.by_q_no[question.q_no] = i
+            text = normalise(question.text)
+            self.by_text[text].append(i)
+            for word in set(text.split()):
+                self.by_word[word].append(i)
+        self._normalised = [normalise(q.text) for q in self.new]
+        self._ratios = {}
+
+    def similarity(self, old_text, new_index):
+        """Similarity (0-1) of a normalised old text to a new question, memoised"""
+        key = (old_text, new_index)
+        ratio = self._ratios.get(key)
+        if ratio is None:
+            matcher = SequenceMatcher(None, old_text, self._normalised[new_index], autojunk=False)
+            ratio = self._ratios[key] = matcher.ratio()
+        return ratio
+
+    def _candidates(self, text, free):
+        """The free new questions sharing the most words with text, rarer words weighing more"""
+        shared = Counter()
+        budget = CANDIDATE_SCAN
+        for postings in sorted((self.by_word[word] for word in set(text.split()) if word in self.by_word), key=len):
+            if budget <= 0:
+                break
+            weight = 1 + 1 / len(postings)
+            for i in postings[:budget]:
+                if i in free:
+                    shared[i] += weight
+            budget -= len(postings)
+        return [i for i, _ in shared.most_common(FUZZY_CANDIDATES)]
+
+    def diff(self, old_questions):
+        """QuestionChanges for every question in either revision, in new-revision order then removals"""
+        old_questions = list(old_questions)
+        matched = {}        # new index -> QuestionChange
+        unmatched = []
+        seen = set()
+        for question in old_questions:
+            if question.q_no in seen:
+                raise ValueError(f'Q No. {question.q_no} appears twice in the old question set')
+            seen.add(question.q_no)
+            i = self.by_q_no.get(question.q_no)
+            if i is None:
+                unmatched.append(question)
+                continue
+            new = self.new[i]
+            text = normalise(question.text)
+            if text != self._normalised[i]:
+                matched[i] = QuestionChange('reworded', question, new, self.similarity(text, i))
+            elif normalise(question.section) != normalise(new.section):
+                matched[i] = QuestionChange('moved', question, new)
+            else:
+                matched[i] = QuestionChange('unchanged', question, new)
+
+        free = set(range(len(self.new))) - set(matched)
+        # Renumbered word for word
+        still_unmatched = []
+        for question in unmatched:
+            text = normalise(question.text)
+            i = next((i for i in self.by_text.get(text, ()) if i in free), None)
+            if i is None:
+                still_unmatched.append(question)
+            else:
+                free.discard(i)
+                matched[i] = QuestionChange('renumbered', question, self.new[i])
+
+        # Renumbered and reworded: best candidate pairs first
+        pairs = []
+        for j, question in enumerate(still_unmatched):
+            text = normalise(question.text)
+            for i in self._candidates(text, free):
+                ratio = self.similarity(text, i)
+                if ratio >= RENUMBER_THRESHOLD:
+                    pairs.append((ratio, j, i))
+        removed = set(range(len(still_unmatched)))
+        for ratio, j, i in sorted(pairs, key=lambda p: (-p[0], p[1], p[2])):
+            if j in removed and i in free:
+                removed.discard(j)
+                free.discard(i)
+                matched[i] = QuestionChange('renumbered', still_unmatched[j], self.new[i], ratio)
+
+        changes = [matched[i] if i in matched else QuestionChange('added', new=self.new[i], similarity=0.0)
+                   for i in range(len(self.new))]
+        changes += [QuestionChange('removed', old=still_unmatched[j], similarity=0.0) for j in sorted(removed)]
+        return changes
+
+
+def diff_question_sets(old_questions, new_questions):
+    """QuestionChanges between two revisions (see QuestionDiffer.diff)"""
+    return QuestionDiffer(new_questions).diff(old_questions)
+
+
+def change_counts(changes):
+    """{kind: number of questions} in CHANGE_KINDS order, kinds with none left out"""
+    counts = Counter(change.kind for change in changes)
+    return {kind: counts[kind] for kind in CHANGE_KINDS if counts[kind]}
+
+
+def build_diff_workbook(changes, old_label, new_label, include_unchanged=False):
+    """A Changes sheet (one row per changed question) and a Summary sheet of counts, unsaved"""
+    rows = []
+    for change in changes:
+        if change.kind == 'unchanged' and not include_unchanged:
+            continue
+        old, new = change.old, change.new
+        similarity = f'{change.similarity:.0%}' if old and new and change.similarity < 1 else ''
+        rows.append(((new or old).section, new.q_no if new else '', old.q_no if old else '',
+                     old.text if old else '', new.text if new else '', similarity, change.kind))
+    counts = change_counts(changes)
+    notes = CENotes(
+        title='Summary',
+        heading='Cyber Essentials Question Set - Changes',
+        sections=[
+            NotesSection('Compared:', [f'Old: {old_label}', f'New: {new_label}']),
+            NotesSection('Questions by Change:', [(kind.title(), count, CHANGE_FILLS.get(kind, 'bold'))
+                                                  for kind, count in counts.items()]),
+        ],
+        widths={'A': 40, 'B': 40},
+    )
+    return build_ce_workbook(rows, columns=DIFF_COLUMNS, title='Changes', status=CHANGE_FILLS.get, notes=notes)
@@ -0,0 +1,309 @@
+"""
+Shared Cyber Essentials answer store
+
+The CE scripts each carried one organisation's answers as a list of
+tuples, with the Summary / Actions sheet's pending items typed out again
+by hand beside them. This module keeps every organisation's answers in
+one SQLite table keyed by (organisation, question number), indexed on
+section and status, and derives the notes sheet from it: status counts
+and outstanding items are aggregate queries over the rows, so they can
+never disagree with the answers.
+
+    conn = connect('ce-answers.db')
+    create_schema(conn)
+    put_answers(conn, 'MEMA Financial Services Ltd', data, layout='answers')
+    status_counts(conn, 'MEMA Financial Services Ltd')   # {'Ready': 80, ...}
+    render_organisation(conn, 'MEMA Financial Services Ltd').save('mema.xlsx')
+
+A layout says which cyber_essentials column set the rows use:
+'question_set' (the draft with guidance, draft_status colours) or
+'answers' (a completed answer set, action_status colours). Every query
+is one organisation's slice of an index, so rendering any one of
+hundreds of firms costs the same as rendering the only one.
+
+Firms certified from a common answer set need not repeat it. The set is
+stored once as an organisation of its own, and each firm stores only the
+answers it changes (ce_overrides), on top of that base:
+
+    put_firm(conn, 'Acme Wealth Ltd', base='IFA base answers',
+             overrides={'A1.1': ('Acme Wealth Ltd', None), 'A3.3': (None, 'Ready')})
+
+The ce_firm_answers view lays the overrides over the base rows, and all
+the queries below read it, so a firm looks the same as any organisation
+whose rows were stored in full.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+
+from .cyber_essentials import (ANSWER_COLUMNS, QUESTION_SET_COLUMNS, CENotes, NotesSection, action_status,
+                               build_ce_workbook, draft_status, status_legend)
+
+# SQLite file the CE scripts add their organisation to (in-memory when unset)
+CE_STORE_ENV = 'IFA_CE_STORE'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ce_organisations (
+    organisation TEXT PRIMARY KEY,
+    layout TEXT NOT NULL CHECK (layout IN ('question_set', 'answers')),
+    base TEXT,                   -- organisation whose rows this one overrides; NULL for full rows
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS ce_answers (
+    organisation TEXT NOT NULL,
+    q_no TEXT NOT NULL,
+    position INTEGER NOT NULL,   -- order in the question set
+    section TEXT NOT NULL,
+    question TEXT NOT NULL,
+    guidance TEXT,               -- question_set layout only
+    answer_type TEXT,            -- question_set layout only
+    answer TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL,
+    PRIMARY KEY (organisation, q_no)
+);
+
+CREATE TABLE IF NOT EXISTS ce_overrides (
+    organisation TEXT NOT NULL,
+    q_no TEXT NOT NULL,
+    answer TEXT,                 -- NULL keeps the base answer
+    status TEXT,                 -- NULL keeps the base status
+    PRIMARY KEY (organisation, q_no)
+);
+
+CREATE INDEX IF NOT EXISTS idx_ce_answers_section ON ce_answers (organisation, section);
+CREATE INDEX IF NOT EXISTS idx_ce_answers_status ON ce_answers (organisation, status);
+"""
+
+# Run once ce_organisations has its base column. ce_firm_answers holds every
+# organisation's effective rows: its own, or its base's with its overrides applied
+FIRM_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_ce_organisations_base ON ce_organisations (base);
+
+CREATE VIEW IF NOT EXISTS ce_firm_answers AS
+SELECT o.organisation, a.q_no, a.position, a.section, a.question, a.guidance, a.answer_type,
+       COALESCE(v.answer, a.answer) AS answer, COALESCE(v.status, a.status) AS status
+FROM ce_organisations o
+JOIN ce_answers a ON a.organisation = COALESCE(o.base, o.organisation)
+LEFT JOIN ce_overrides v ON v.organisation = o.organisation AND v.q_no = a.q_no;
+"""
+
+
+@dataclass(frozen=True)
+class Layout:
+    """How one kind of answer set maps onto ce_answers and build_ce_workbook"""
+
+    columns: tuple
+    fields: tuple       # ce_answers column per workbook column
+    status: object      # status value -> fill part
+    outstanding: str    # SQL condition for an answer still waiting on the firm
+    title: str
+    header_color: str
+
+
+LAYOUTS = {
+    'question_set': Layout(QUESTION_SET_COLUMNS,
+                           ('section', 'q_no', 'question', 'guidance', 'answer_type', 'answer', 'status'),
+                           draft_status, "status = 'Pending'", 'CE Question Set', '4472C4'),
+    # Same test as action_status(), kept case-sensitive with instr()
+    'answers': Layout(ANSWER_COLUMNS, ('section', 'q_no', 'question', 'answer', 'status'), action_status,
+                      "(instr(status, 'ACTION') > 0 OR instr(status, 'Confirm') > 0)", 'CE Answers', '2F5496'),
+}
+
+# Checks listed after a firm's outstanding answers on every Actions sheet
+SUBMISSION_CHECKS = (
+    "All devices have auto-updates enabled",
+    "MFA is enforced on all cloud services",
+)
+
+# (label, q_no) of the answers repeated under Company Details Confirmed
+COMPANY_DETAILS = (('', 'A1.1'), ('Company Number: ', 'A1.3'), ('', 'A1.4'), ('IT Contact: ', 'A2.10'))
+
+
+def connect(path=':memory:', readonly=False):
+    """Open an answer store (WAL, so renders read while another process writes)"""
+    if readonly:
+        return sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    return conn
+
+
+def create_schema(conn):
+    conn.executescript(SCHEMA)
+    # Stores written before firms could share a base set
+    if 'base' not in {row[1] for row in conn.execute('PRAGMA table_info(ce_organisations)')}:
+        conn.execute('ALTER TABLE ce_organisations ADD COLUMN base TEXT')
+    conn.executescript(FIRM_SCHEMA)
+    conn.commit()
+
+
+def _layout(conn, organisation):
+    row = conn.execute('SELECT layout FROM ce_organisations WHERE organisation = ?', (organisation,)).fetchone()
+    if row is None:
+        raise KeyError(f"no CE answers stored for '{organisation}'")
+    return LAYOUTS[row[0]]
+
+
+def put_answers(conn, organisation, rows, layout='question_set'):
+    """
+    Store an organisation's answer rows (tuples matching the layout's
+    columns, in question order), replacing any it had. One transaction.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"unknown layout '{layout}' (expected one of {', '.join(LAYOUTS)})")
+    fields = LAYOUTS[layout].fields
+    rows = list(rows)
+    for i, row in enumerate(rows, 1):
+        if len(row) != len(fields):
+            raise ValueError(f'answer row {i} has {len(row)} values, expected {len(fields)}')
+    insert = (f"INSERT INTO ce_answers (organisation, position, {', '.join(fields)}) "
+              f"VALUES (?, ?, {', '.join('?' * len(fields))})")
+    with conn:
+        _check_no_firms(conn, organisation, layout)
+        conn.execute('DELETE FROM ce_answers WHERE organisation = ?', (organisation,))
+        conn.execute('DELETE FROM ce_overrides WHERE organisation = ?', (organisation,))
+        conn.execute('INSERT OR REPLACE INTO ce_organisations (organisation, layout) VALUES (?, ?)',
+                     (organisation, layout))
+        conn.executemany(insert, ((organisation, position, *row) for position, row in enumerate(rows)))
+
+
+def put_firm(conn, organisation, base, overrides):
+    """
+    Store a firm as base's answers with overrides ({q_no: (answer, status)},
+    None keeping the base value) applied, replacing whatever the firm had.
+    base must hold full rows, and every overridden q_no must be in it.
+    """
+    row = conn.execute('SELECT layout, base FROM ce_organisations WHERE organisation = ?', (base,)).fetchone()
+    if row is None:
+        raise KeyError(f"no CE answers stored for '{base}'")
+    if row[1] is not None:
+        raise ValueError(f"'{base}' is itself based on '{row[1]}'; a base must hold full answer rows")
+    if organisation == base:
+        raise ValueError(f"'{organisation}' cannot be based on itself")
+    known = {q_no for q_no, in conn.execute('SELECT q_no FROM ce_answers WHERE organisation = ?', (base,))}
+    unknown = sorted(set(overrides) - known)
+    if unknown:
+        raise ValueError(f"'{organisation}' overrides questions not in '{base}': {', '.join(unknown)}")
+    with conn:
+        _check_no_firms(conn, organisation)
+        conn.execute('DELETE FROM ce_answers WHERE organisation = ?', (organisation,))
+        conn.execute('DELETE FROM ce_overrides WHERE organisation = ?', (organisation,))
+        conn.execute('INSERT OR REPLACE INTO ce_organisations (organisation, layout, base) VALUES (?, ?, ?)',
+                     (organisation, row[0], base))
+        conn.executemany('INSERT INTO ce_overrides (organisation, q_no, answer, status) VALUES (?, ?, ?, ?)',
+                         ((organisation, q_no, answer, status) for q_no, (answer, status) in overrides.items()))
+
+
+def _check_no_firms(conn, organisation, layout=None):
+    """Refuse to turn a base into a firm, or change its layout under its firms"""
+    firms = [name for name, in conn.execute('SELECT organisation FROM ce_organisations WHERE base = ? '
+                                            'AND (? IS NULL OR layout != ?)', (organisation, layout, layout))]
+    if firms:
+        raise ValueError(f"'{organisation}' is the base of {len(firms)} firm(s), e.g. '{firms[0]}'")
+
+
+def delete_organisation(conn, organisation):
+    with conn:
+        _check_no_firms(conn, organisation)
+        conn.execute('DELETE FROM ce_answers WHERE organisation = ?', (organisation,))
+        conn.execute('DELETE FROM ce_overrides WHERE organisation = ?', (organisation,))
+        conn.execute('DELETE FROM ce_organisations WHERE organisation = ?', (organisation,))
+
+
+def answer_rows(conn, organisation, section=None, status=None):
+    """An organisation's rows in question order, as tuples matching its layout's columns"""
+    layout = _layout(conn, organisation)
+    where, params = ['organisation = ?'], [organisation]
+    if section is not None:
+        where.append('section = ?')
+        params.append(section)
+    if status is not None:
+        where.append('status = ?')
+        params.append(status)
+    return conn.execute(f"SELECT {', '.join(layout.fields)} FROM ce_firm_answers WHERE {' AND '.join(where)} "
+                        f"ORDER BY position", params).fetchall()
+
+
+def status_counts(conn, organisation):
+    """{status: number of questions} for one organisation, most common first"""
+    _layout(conn, organisation)
+    return dict(conn.execute('SELECT status, COUNT(*) FROM ce_firm_answers WHERE organisation = ? '
+                             'GROUP BY status ORDER BY COUNT(*) DESC, status', (organisation,)))
+
+
+def section_status(conn, organisation):
+    """(section, questions, ready, outstanding) per section, in question order"""
+    layout = _layout(conn, organisation)
+    return conn.execute(
+        f"SELECT section, COUNT(*), SUM(status = 'Ready'), SUM({layout.outstanding}) FROM ce_firm_answers "
+        f"WHERE organisation = ? GROUP BY section ORDER BY MIN(position)", (organisation,)).fetchall()
+
+
+def outstanding(conn, organisation):
+    """(q_no, question, status) of the answers still waiting on the firm, in question order"""
+    layout = _layout(conn, organisation)
+    return conn.execute(f"SELECT q_no, question, status FROM ce_firm_answers WHERE organisation = ? "
+                        f"AND {layout.outstanding} ORDER BY position", (organisation,)).fetchall()
+
+
+def action_counts(conn, organisation):
+    """(answers whose status asks for an ACTION, answers still to Confirm) for one organisation"""
+    _layout(conn, organisation)
+    return conn.execute("SELECT COALESCE(SUM(instr(status, 'ACTION') > 0), 0), "
+                        "COALESCE(SUM(instr(status, 'Confirm') > 0), 0) FROM ce_firm_answers "
+                        "WHERE organisation = ?", (organisation,)).fetchone()
+
+
+def organisations(conn):
+    """(organisation, layout, base, questions, outstanding) for every stored organisation"""
+    rules = ' '.join(f"WHEN '{name}' THEN {layout.outstanding}" for name, layout in LAYOUTS.items())
+    return conn.execute(
+        f"SELECT o.organisation, o.layout, o.base, COUNT(a.q_no), COALESCE(SUM(CASE o.layout {rules} END), 0) "
+        f"FROM ce_organisations o LEFT JOIN ce_firm_answers a USING (organisation) "
+        f"GROUP BY o.organisation ORDER BY o.organisation").fetchall()
+
+
+def _status_summary(conn, organisation):
+    return NotesSection('Answers by Status:', [f'{status}: {count}' for status, count
+                                               in status_counts(conn, organisation).items()])
+
+
+def organisation_notes(conn, organisation):
+    """The notes sheet for an organisation, built from its stored answers"""
+    layout = _layout(conn, organisation)
+    if layout is LAYOUTS['question_set']:
+        pending = [f'{q_no} - {question}' for q_no, question, _ in outstanding(conn, organisation)]
+        return CENotes(
+            title='Summary',
+            heading='Cyber Essentials Certification - Status Summary',
+            sections=[status_legend(), NotesSection('Items Requiring Your Input:', pending),
+                      _status_summary(conn, organisation)],
+            widths={'A': 40, 'B': 40},
+        )
+
+    checks = [f'{q_no} {question} - {status}' for q_no, question, status in outstanding(conn, organisation)]
+    checks += SUBMISSION_CHECKS
+    answers = dict(conn.execute(
+        f"SELECT q_no, answer FROM ce_firm_answers WHERE organisation = ? "
+        f"AND q_no IN ({', '.join('?' * len(COMPANY_DETAILS))})",
+        (organisation, *(q_no for _, q_no in COMPANY_DETAILS))))
+    details = [f'{label}{answers[q_no]}' for label, q_no in COMPANY_DETAILS if answers.get(q_no)]
+    return CENotes(
+        title='Actions Required',
+        heading=f'{answers.get("A1.1") or organisation} - Cyber Essentials Actions',
+        sections=[
+            NotesSection('Before Submission - Verify:', [f'{i}. {check}' for i, check in enumerate(checks, 1)]),
+            NotesSection('Company Details Confirmed:', details),
+            _status_summary(conn, organisation),
+        ],
+        widths={'A': 80},
+    )
+
+
+def render_organisation(conn, organisation):
+    """Build an organisation's CE workbook from the store and return it unsaved"""
+    layout = _layout(conn, organisation)
+    rows = answer_rows(conn, organisation)
+    return build_ce_workbook(rows, columns=layout.columns, title=layout.title, header_color=layout.header_color,
+                             status=layout.status, notes=organisation_notes(conn, organisation))
@@ -0,0 +1,181 @@
+"""
+Chart templates serialised once per process
+
+Most charts in the packs share their settings and differ only in ranges
+and titles: a '£#,##0' column chart with style 10 and no legend, a
+'£#,##0' line chart with a legend, a pie with percentage labels. Building
+each one as an openpyxl chart and serialising its object tree costs about
+a millisecond per chart, every pack. A ChartTemplate holds the shared
+settings instead. The first chart of each shape (series count, which
+titles it has) is built and serialised once with placeholder ranges and
+titles; every later chart of that shape is the cached XML with its own
+ranges and titles substituted:
+
+    chart = MONEY_COLUMNS_NO_LEGEND.new("Monthly Software Costs", y_title="£ per month", width=14, height=10)
+    chart.add_data(Reference(ws, min_col=2, min_row=6, max_row=12), titles_from_data=True)
+    chart.set_categories(Reference(ws, min_col=1, min_row=7, max_row=12))
+    ws.add_chart(chart, "A15")
+
+The XML is what openpyxl writes for the equivalent chart. Charts with
+per-series formatting or combined charts (the Monte Carlo fan) are still
+built with openpyxl directly.
+"""
+
+import re
+from xml.sax.saxutils import escape
+
+from openpyxl import chart as charts
+from openpyxl.chart import Reference
+from openpyxl.chart._chart import ChartBase
+from openpyxl.chart.data_source import AxDataSource, NumRef
+from openpyxl.chart.label import DataLabelList
+from openpyxl.chart.series_factory import SeriesFactory
+from openpyxl.xml.constants import CHART_NS
+from openpyxl.xml.functions import fromstring, tostring
+
+# Chart kind -> openpyxl.chart class name
+CHART_TYPES = {
+    'area': 'AreaChart',
+    'bar': 'BarChart',
+    'doughnut': 'DoughnutChart',
+    'line': 'LineChart',
+    'pie': 'PieChart',
+}
+
+CHART_TAG_PREFIX = f'{{{CHART_NS}}}'
+TOKEN_RE = re.compile(r'@@(\w+)@@')
+# Attribute paths a chart sets itself rather than taking from its template
+PER_CHART_OPTIONS = ('title', 'x_axis.title', 'y_axis.title', 'width', 'height')
+
+
+def set_option(chart, path, value):
+    """Set a dotted attribute path ('y_axis.numFmt') on an openpyxl chart"""
+    *owners, name = path.split('.')
+    target = chart
+    for owner in owners:
+        target = getattr(target, owner)
+    setattr(target, name, value)
+
+
+def _token(path, line):
+    return f"{path.replace('.', '_')}_{line}"
+
+
+class ChartTemplate:
+    """Settings shared by a family of charts, and their cached XML skeletons"""
+
+    def __init__(self, kind, options=None):
+        if kind not in CHART_TYPES:
+            raise ValueError(f"unknown chart kind '{kind}'")
+        clash = set(options or ()) & set(PER_CHART_OPTIONS)
+        if clash:
+            raise ValueError(f'{sorted(clash)} are set per chart, not in a template')
+        self.kind = kind
+        self.options = dict(options or {})
+        self._skeletons = {}
+
+    def new(self, title=None, x_title=None, y_title=None, width=None, height=None):
+        """A chart of this template, ready for add_data() and ws.add_chart()"""
+        return TemplateChart(self, title, x_title, y_title, width, height)
+
+    def _skeleton(self, shape):
+        """Serialised chart of one shape with @@token@@ placeholders, built on first use"""
+        skeleton = self._skeletons.get(shape)
+        if skeleton is None:
+            series_count, titled, categories, title_lines = shape
+            chart = getattr(charts, CHART_TYPES[self.kind])()
+            for path, value in self.options.items():
+                set_option(chart, path, value)
+            for path, lines in title_lines:
+                # openpyxl writes one paragraph per line of a title
+                set_option(chart, path, '\n'.join(f'@@{_token(path, i)}@@' for i in range(lines)))
+            placeholder = Reference(range_string="'T'!$A$1:$A$3")
+            for i in range(series_count):
+                series = SeriesFactory(placeholder, title_from_data=titled)
+                series.val.numRef.f = f'@@val_{i}@@'
+                if titled:
+                    series.tx.strRef.f = f'@@tx_{i}@@'
+                chart.series.append(series)
+            if categories:
+                for series in chart.series:
+                    series.cat = AxDataSource(numRef=NumRef(f='@@cat@@'))
+            skeleton = self._skeletons[shape] = tostring(chart._write()).decode('utf-8')
+        return skeleton
+
+
+class TemplateChart(ChartBase):
+    """
+    A chart written from its ChartTemplate's cached XML. Only the openpyxl
+    chart attributes the drawing writer reads (anchor, width, height) are
+    real; everything else lives in the template.
+    """
+
+    def __init__(self, template, title=None, x_title=None, y_title=None, width=None, height=None):
+        # ChartBase.__init__ would build the object tree this class exists to skip
+        self.template = template
+        self.titles = {path: text for path, text in zip(PER_CHART_OPTIONS, (title, x_title, y_title))
+                       if text is not None}
+        if width is not None:
+            self.width = width
+        if height is not None:
+            self.height = height
+        self.refs = []          # (values range, title cell or None) per series
+        self.categories = None
+        self._titled = None
+
+    def add_data(self, data, from_rows=False, titles_from_data=False):
+        """Add one series per column (or row) of data, like ChartBase.add_data"""
+        if not isinstance(data, Reference):
+            data = Reference(range_string=data)
+        if self._titled is not None and self._titled != titles_from_data:
+            raise ValueError('All series of a template chart must take their titles the same way')
+        self._titled = titles_from_data
+        for ref in (data.rows if from_rows else data.cols):
+            title = f'{ref.sheetname}!{ref.pop()}' if titles_from_data else None
+            self.refs.append((str(ref), title))
+
+    def set_categories(self, labels):
+        if not isinstance(labels, Reference):
+            labels = Reference(range_string=labels)
+        self.categories = str(labels)
+
+    def _write(self):
+        lines = {path: text.split('\n') for path, text in self.titles.items()}
+        shape = (len(self.refs), bool(self._titled), self.categories is not None,
+                 tuple((path, len(text)) for path, text in lines.items()))
+        skeleton = self.template._skeleton(shape)
+        values = {'cat': self.categories}
+        for i, (ref, title) in enumerate(self.refs):
+            values[f'val_{i}'] = ref
+            values[f'tx_{i}'] = title
+        for path, text in lines.items():
+            for i, line in enumerate(text):
+                values[_token(path, i)] = line
+        tree = fromstring(TOKEN_RE.sub(lambda m: escape(values[m.group(1)]), skeleton))
+        # Parsing qualifies the chart elements; openpyxl writes them in the default namespace
+        for element in tree.iter():
+            if element.tag.startswith(CHART_TAG_PREFIX):
+                element.tag = element.tag[len(CHART_TAG_PREFIX):]
+        tree.set('xmlns', CHART_NS)
+        return tree
+
+
+_TEMPLATES = {}
+
+
+def chart_template(kind, options=None):
+    """The process-wide ChartTemplate for a kind and its shared options"""
+    key = (kind, tuple(sorted((options or {}).items())))
+    template = _TEMPLATES.get(key)
+    if template is None:
+        template = _TEMPLATES[key] = ChartTemplate(kind, options)
+    return template
+
+
+# Templates shared by the pricing workbooks
+MONEY_COLUMNS = ChartTemplate('bar', {'type': 'col', 'style': 10, 'y_axis.numFmt': '£#,##0'})
+MONEY_COLUMNS_NO_LEGEND = ChartTemplate('bar', {'type': 'col', 'style': 10, 'y_axis.numFmt': '£#,##0',
+                                                'legend': None})
+MONEY_LINES = ChartTemplate('line', {'style': 10, 'y_axis.numFmt': '£#,##0'})
+PERCENT_PIE = ChartTemplate('pie', {'dataLabels': DataLabelList(showPercent=True, showVal=False,
+                                                                showCatName=False)})
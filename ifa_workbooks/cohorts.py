@@ -0,0 +1,180 @@
+"""
+Monthly cohort revenue model behind the Growth Projections cohort summary
+
+The Growth Projections tables work in whole years: new firms arrive in one
+lump and churn is a yearly percentage. cohort_revenue() works month by
+month instead. Every signing month's new firms form one cohort per plan,
+and each plan keeps its own terms:
+
+    contract plans (Standard, Professional: 24 months; 36-month variants)
+        pay every month of the term; at each term end a renewal_rate share
+        signs another term at the same price and the rest leave
+    rolling plans (the £350 Monthly tier)
+        lose monthly_churn of their firms every month
+
+A cohort's surviving share depends only on its age, so active firms,
+churn and renewals for every month are the arrivals convolved with one
+per-plan age kernel - a few NumPy calls however many cohorts there are.
+Values are expected (fractional) firm counts, not a simulation.
+
+    model = cohort_revenue('Moderate', months=120)
+    model.total(model.arr)          # ARR per month, all plans
+    model.cohort_matrix('standard') # (signing month, month) active firms
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .growth import DEFAULT_ANNUAL_CHURN, GROWTH_SCENARIOS, monthly_arrivals
+from .tiers import TIER_PRICES, tier_terms
+
+
+@dataclass(frozen=True)
+class ContractPlan:
+    """Price and contract terms of one plan; term_months=0 is month to month"""
+
+    name: str
+    monthly_rate: float
+    term_months: int = 0
+    monthly_churn: float = 0.0   # rolling plans only
+    renewal_rate: float = 1.0    # contract plans only: share renewing at each term end
+
+    def __post_init__(self):
+        if self.term_months < 0 or self.monthly_rate < 0:
+            raise ValueError(f'{self.name}: term_months and monthly_rate must not be negative')
+        if not 0 <= self.monthly_churn <= 1 or not 0 <= self.renewal_rate <= 1:
+            raise ValueError(f'{self.name}: monthly_churn and renewal_rate must be between 0 and 1')
+
+    def survival(self, months):
+        """Share of a cohort still active at ages 0..months-1"""
+        age = np.arange(months)
+        if self.term_months:
+            return self.renewal_rate ** (age // self.term_months)
+        return (1 - self.monthly_churn) ** age
+
+    def renewals(self, months):
+        """Share of a cohort renewing at ages 0..months-1 (at each term end)"""
+        kernel = np.zeros(months)
+        if self.term_months:
+            ends = np.arange(self.term_months, months, self.term_months)
+            kernel[ends] = self.survival(months)[ends]
+        return kernel
+
+
+def _contract_plan(name, rate, term_months):
+    """A contract plan whose firms renew at the sheet's default annual churn over each term"""
+    return ContractPlan(name, rate, term_months, renewal_rate=(1 - DEFAULT_ANNUAL_CHURN) ** (term_months / 12))
+
+
+# Prices and commitment terms from tiers.py (Summary pricing, Tier Comparison)
+DEFAULT_PLANS = {
+    'monthly': ContractPlan('Monthly', TIER_PRICES['monthly'], monthly_churn=0.03),
+    'standard': _contract_plan('Standard', TIER_PRICES['standard'], tier_terms()['standard']),
+    'professional': _contract_plan('Professional', TIER_PRICES['professional'], tier_terms()['professional']),
+    # The Revenue Calculator's 3-year Standard contract
+    'standard_3yr': _contract_plan('Standard (3yr)', TIER_PRICES['standard'], 36),
+}
+# Share of new firms signing each plan
+DEFAULT_MIX = {'monthly': 0.2, 'standard': 0.4, 'professional': 0.3, 'standard_3yr': 0.1}
+
+
+@dataclass
+class CohortRevenue:
+    """Expected firms and revenue per plan and month from cohort_revenue()"""
+
+    plans: dict              # key -> ContractPlan, in row order
+    months: np.ndarray       # 1..M
+    new: np.ndarray          # (plans, months) firms signing
+    active: np.ndarray       # (plans, months) firms paying that month
+    renewed: np.ndarray      # (plans, months) firms starting another term
+    churned: np.ndarray      # (plans, months) firms leaving
+
+    @property
+    def rates(self):
+        return np.array([plan.monthly_rate for plan in self.plans.values()], dtype=np.float64)
+
+    @property
+    def terms(self):
+        return np.array([plan.term_months for plan in self.plans.values()])
+
+    @property
+    def mrr(self):
+        return self.active * self.rates[:, None]
+
+    @property
+    def arr(self):
+        return self.mrr * 12
+
+    @property
+    def booked_tcv(self):
+        """Contract value signed each month: new and renewed terms; rolling plans book one month at a time"""
+        terms = self.terms[:, None]
+        return np.where(terms > 0, (self.new + self.renewed) * self.rates[:, None] * terms, self.mrr)
+
+    @property
+    def mix(self):
+        """Share of all new firms that signed each plan"""
+        totals = self.new.sum(axis=1)
+        return totals / totals.sum() if totals.sum() else totals
+
+    def total(self, values):
+        """Sum a (plans, months) array over plans"""
+        return values.sum(axis=0)
+
+    def _year_ends(self):
+        years = -(-len(self.months) // 12)
+        return np.minimum(np.arange(1, years + 1) * 12, len(self.months)) - 1
+
+    def year_end(self, values):
+        """Values at the last month of each year (a partial last year included)"""
+        return values[..., self._year_ends()]
+
+    def year_sum(self, values):
+        """Values summed over each year"""
+        return np.add.reduceat(values, np.arange(0, len(self.months), 12), axis=-1)
+
+    def cohort_matrix(self, plan):
+        """(signing month, month) active firms of one plan's cohorts - allocates months x months"""
+        p = list(self.plans).index(plan)
+        count = len(self.months)
+        age = np.arange(count)[None, :] - np.arange(count)[:, None]
+        survival = self.plans[plan].survival(count)
+        return np.where(age >= 0, self.new[p][:, None] * survival[np.maximum(age, 0)], 0.0)
+
+
+def cohort_revenue(scenario='Moderate', months=120, new_per_year=None, mix=None, plans=None, arrivals=None):
+    """
+    Run the cohort model and return CohortRevenue.
+
+    New firms per month come from new_per_year (default
+    GROWTH_SCENARIOS[scenario], the last year repeating) split across plans
+    by mix; or pass arrivals, a (plans, months) array of firms signing each
+    plan in each month, to model any set of cohorts directly.
+    """
+    plans = dict(DEFAULT_PLANS if plans is None else plans)
+    if arrivals is None:
+        mix = DEFAULT_MIX if mix is None else mix
+        unknown = set(mix) - set(plans)
+        if unknown:
+            raise ValueError(f'Unknown plans in mix: {sorted(unknown)}')
+        shares = np.array([mix.get(key, 0.0) for key in plans], dtype=np.float64)
+        if shares.sum() <= 0:
+            raise ValueError('mix must give at least one plan a positive share')
+        per_month = monthly_arrivals(GROWTH_SCENARIOS[scenario] if new_per_year is None else new_per_year, months)
+        arrivals = np.outer(shares / shares.sum(), per_month)
+    else:
+        arrivals = np.asarray(arrivals, dtype=np.float64)
+        if arrivals.shape != (len(plans), months):
+            raise ValueError(f'arrivals must have shape {(len(plans), months)}, got {arrivals.shape}')
+
+    active = np.empty_like(arrivals)
+    renewed = np.empty_like(arrivals)
+    churned = np.empty_like(arrivals)
+    for p, plan in enumerate(plans.values()):
+        survival = plan.survival(months)
+        lost = np.concatenate([[0.0], survival[:-1] - survival[1:]])
+        active[p] = np.convolve(arrivals[p], survival)[:months]
+        renewed[p] = np.convolve(arrivals[p], plan.renewals(months))[:months]
+        churned[p] = np.convolve(arrivals[p], lost)[:months]
+    return CohortRevenue(plans, np.arange(1, months + 1), arrivals, active, renewed, churned)
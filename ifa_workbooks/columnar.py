@@ -0,0 +1,309 @@
+"""
+Columnar (Arrow/Parquet) copies of a pricing pack's tables
+
+BI jobs want the numbers behind a pack - the Revenue Calculator grid and
+customer-mix sweep, the Growth Projections series, the ROI breakdown, the tier feature matrix and
+the competitor prices - for thousands of packs at once, and re-parsing
+each .xlsx with openpyxl is by far the slowest way to get them. The
+generators already hold every one of these numbers before a cell is
+written, so pricing_tables() computes them straight from the same model
+the sheets use (revenue.py, mix.py, growth.py, the ROI layout's formulas,
+the Tier Comparison layout) and write_tables() saves each table beside the
+workbook:
+
+    tables = pricing_tables(params, growth_bands=bands)
+    write_tables(tables, 'packs/Plannetic-Pricing-Acme')
+    # -> packs/Plannetic-Pricing-Acme.revenue_grid.arrow, ...growth.arrow, ...
+
+Arrow files are written in the IPC file format, uncompressed, so
+read_table() memory-maps them: loading a pack's tables reads no more than
+the pages a query touches. Parquet (fmt='parquet') is smaller on disk but
+is decoded on read. Every table carries the firm name and has a fixed
+schema (TABLE_COLUMNS), so one table's files from a whole batch open as a
+single dataset:
+
+    pyarrow.dataset.dataset(glob.glob('packs/*.roi.arrow'), format='ipc')
+
+pyarrow is only needed to write or read the files; pricing_tables()
+returns plain NumPy arrays and lists.
+"""
+
+import math
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from .growth import DEFAULT_ANNUAL_CHURN, DEFAULT_MONTHLY_RATE, GROWTH_SCENARIOS, year_end_firms
+from .layout import LAYOUT_DIR, read_layout
+from .mix import mix_revenue, tier_plans, vary_share
+from .pricing import (COMPETITORS, MIX_FIRM_COUNTS, MIX_SWEEP_SHARES, MIX_SWEEP_TIER, RATE_INPUTS, REVENUE_RATES,
+                      REVENUE_TERMS, TOOL_STACK, ProspectParams)
+from .revenue import DEFAULT_FIRM_COUNTS, revenue_grid
+from .roi import net_benefit, value_per_client
+from .xlsx_parts import atomic_path
+
+TABLE_FORMATS = {'arrow': 'arrow', 'parquet': 'parquet'}   # fmt -> file extension
+
+# (column, type) of every table, in column order; growth_bands only with a simulation
+TABLE_COLUMNS = {
+    'revenue_grid': (('firm', 'string'), ('firms', 'int64'), ('monthly_rate', 'float64'),
+                     ('term_months', 'int64'), ('tcv', 'float64'), ('mrr', 'float64')),
+    'revenue_mix': (('firm', 'string'), ('tier', 'string'), ('share', 'float64'), ('firms', 'int64'),
+                    ('mrr', 'float64'), ('committed_tcv', 'float64'), ('tcv', 'float64')),
+    'growth': (('firm', 'string'), ('scenario', 'string'), ('year', 'int64'), ('new_firms', 'int64'),
+               ('churned', 'int64'), ('total_firms', 'int64'), ('mrr', 'float64'), ('arr', 'float64')),
+    'growth_bands': (('firm', 'string'), ('scenario', 'string'), ('percentile', 'int64'), ('month', 'int64'),
+                     ('firms', 'float64'), ('arr', 'float64')),
+    'roi': (('firm', 'string'), ('section', 'string'), ('key', 'string'), ('label', 'string'),
+            ('monthly', 'float64'), ('annual', 'float64')),
+    'tiers': (('firm', 'string'), ('section', 'string'), ('feature', 'string'), ('tier', 'string'),
+              ('value', 'string'), ('included', 'bool')),
+    'competitors': (('firm', 'string'), ('software', 'string'), ('monthly_price', 'float64'),
+                    ('price_type', 'string'), ('offer', 'string'), ('source', 'string')),
+}
+
+# Tier Comparison values meaning "not in this tier"
+NOT_INCLUDED = ('—', '')
+
+_PRODUCT_RE = re.compile(r'^=(\d+(?:\.\d+)?(?:\*\d+(?:\.\d+)?)*)$')
+
+
+@lru_cache(maxsize=8)
+def _layout_tables(name):
+    """{table id: table block} of a layout in LAYOUT_DIR"""
+    spec = read_layout(os.path.join(LAYOUT_DIR, f'{name}.json'))
+    return {block['id']: block for block in spec['blocks'] if block.get('type') == 'table' and 'id' in block}
+
+
+def _labels(table):
+    """{row key: first-column label} of a layout table"""
+    return {row['key']: row['values'][0] for row in table['rows'] if 'key' in row}
+
+
+def revenue_grid_table(firm, firm_counts=DEFAULT_FIRM_COUNTS):
+    """Revenue Calculator TCV, one row per firm count x term x rate (the sheet's column order)"""
+    grid = revenue_grid(firm_counts, rates=REVENUE_RATES, terms=REVENUE_TERMS)
+    n_firms, n_rates, n_terms = grid.shape
+    firms = np.repeat(grid.firm_counts, n_terms * n_rates)
+    rates = np.tile(grid.rates, n_firms * n_terms)
+    return {
+        'firm': [firm] * len(firms),
+        'firms': firms.astype(np.int64),
+        'monthly_rate': rates,
+        'term_months': np.tile(np.repeat(grid.terms, n_rates), n_firms).astype(np.int64),
+        'tcv': grid.tcv.transpose(0, 2, 1).ravel(),
+        'mrr': firms * rates,
+    }
+
+
+def revenue_mix_table(firm, mix=None):
+    """Revenue Calculator mix sensitivity (mix.py), one row per swept tier share x firm count"""
+    plans = tier_plans({tier: rate for tier, _, rate in RATE_INPUTS})
+    sweep = mix_revenue(vary_share(MIX_SWEEP_TIER, MIX_SWEEP_SHARES, base=mix, plans=plans),
+                        firm_counts=MIX_FIRM_COUNTS, plans=plans)
+    n_firms, n_mixes = sweep.shape
+    return {
+        'firm': [firm] * (n_firms * n_mixes),
+        'tier': [MIX_SWEEP_TIER] * (n_firms * n_mixes),
+        'share': np.repeat(np.asarray(MIX_SWEEP_SHARES, dtype=np.float64), n_firms),
+        'firms': np.tile(sweep.firm_counts, n_mixes).astype(np.int64),
+        'mrr': sweep.mrr.T.ravel(),
+        'committed_tcv': sweep.committed_tcv.T.ravel(),
+        'tcv': sweep.tcv.T.ravel(),
+    }
+
+
+def growth_table(firm, monthly_rate=DEFAULT_MONTHLY_RATE, annual_churn=DEFAULT_ANNUAL_CHURN):
+    """Growth Projections series for every scenario, one row per scenario-year"""
+    columns = {name: [] for name, _ in TABLE_COLUMNS['growth']}
+    for scenario, new_per_year in GROWTH_SCENARIOS.items():
+        churned, total = year_end_firms(new_per_year, annual_churn)
+        columns['scenario'] += [scenario] * len(new_per_year)
+        columns['year'] += range(1, len(new_per_year) + 1)
+        columns['new_firms'] += new_per_year
+        columns['churned'] += churned.astype(np.int64).tolist()
+        columns['total_firms'] += total.astype(np.int64).tolist()
+        columns['mrr'] += (total * monthly_rate).tolist()
+        columns['arr'] += (total * monthly_rate * 12).tolist()
+    columns['firm'] = [firm] * len(columns['year'])
+    return columns
+
+
+def growth_bands_table(firm, bands):
+    """Monte Carlo percentile bands (growth.GrowthBands), one row per percentile-month"""
+    n_percentiles, n_months = bands.firms.shape
+    return {
+        'firm': [firm] * bands.firms.size,
+        'scenario': [bands.scenario] * bands.firms.size,
+        'percentile': np.repeat(np.asarray(bands.percentiles, dtype=np.int64), n_months),
+        'month': np.tile(np.asarray(bands.months, dtype=np.int64), n_percentiles),
+        'firms': bands.firms.ravel().astype(np.float64),
+        'arr': bands.arr.ravel().astype(np.float64),
+    }
+
+
+def roi_table(firm, params):
+    """
+    ROI Calculator breakdown: the tool stack and its total, the time and
+    price inputs, and every result row with the sheet's own labels
+    (layouts/roi_calculator.json). annual is null where the sheet leaves
+    it blank.
+    """
+    layout = _layout_tables('roi_calculator')
+    tools = {key: float(params.tool_costs.get(key, cost)) for key, _, cost, _ in TOOL_STACK}
+    total = sum(tools.values())
+    price = float(params.plannetic_cost)
+    hours_per_client = params.hours_per_client * params.time_saved_pct
+    total_hours = hours_per_client * params.clients_per_month
+    per_client = value_per_client(params.hours_per_client, params.time_saved_pct, params.hourly_rate)
+    time_value = float(per_client * params.clients_per_month)
+    net = float(net_benefit(total, per_client, params.clients_per_month, price))
+    benefit = net + price
+    results = {
+        'software': (total - price, (total - price) * 12),
+        'hours_per_client': (hours_per_client, None),
+        'total_hours': (total_hours, total_hours * 12),
+        'time_value': (time_value, time_value * 12),
+        'benefit': (benefit, benefit * 12),
+        'cost': (price, price * 12),
+        'net': (net, net * 12),
+        'roi': (net / price * 100 if price else None, None),
+    }
+    time_inputs = {
+        'hours_per_client': params.hours_per_client,
+        'time_saved': params.time_saved_pct,
+        'hourly_rate': params.hourly_rate,
+        'clients_per_month': params.clients_per_month,
+    }
+
+    rows = [('tools', key, label, tools[key], None) for key, label in _labels(layout['tools']).items()]
+    rows.append(('tools', 'total', layout['total']['rows'][0]['values'][0], total, None))
+    rows += [('inputs', key, label, float(time_inputs[key]), None) for key, label in _labels(layout['time']).items()]
+    rows.append(('inputs', 'plannetic_cost', layout['plannetic_cost']['rows'][0]['values'][0], price, None))
+    rows += [('results', key, label, *results[key]) for key, label in _labels(layout['results']).items()]
+    columns = dict(zip(('section', 'key', 'label', 'monthly', 'annual'), map(list, zip(*rows))))
+    return {'firm': [firm] * len(rows), **columns}
+
+
+def _tier_value(value):
+    """A Tier Comparison cell as text, with its constant formulas ('=250*24') worked out"""
+    value = str(value)
+    match = _PRODUCT_RE.match(value)
+    if match:
+        return f'{math.prod(float(factor) for factor in match.group(1).split("*")):g}'
+    if value.startswith('='):
+        raise ValueError(f'tier_comparison: cannot export the formula {value}')
+    return value
+
+
+def tiers_table(firm):
+    """Tier feature matrix (layouts/tier_comparison.json), one row per feature x tier"""
+    table = _layout_tables('tier_comparison')['tiers']
+    feature_key, *tiers = [column['key'] for column in table['columns']]
+    columns = {name: [] for name, _ in TABLE_COLUMNS['tiers']}
+    section = ''
+    for row in table['rows']:
+        feature, *values = row['values']
+        if not feature:
+            continue
+        if 'section' in row.get('cell_style', {}).get(feature_key, ()):
+            section = feature
+            continue
+        for tier, value in zip(tiers, values):
+            value = _tier_value(value)
+            columns['section'].append(section)
+            columns['feature'].append(feature)
+            columns['tier'].append(tier)
+            columns['value'].append(value)
+            columns['included'].append(value not in NOT_INCLUDED)
+    columns['firm'] = [firm] * len(columns['feature'])
+    return columns
+
+
+def competitors_table(firm):
+    """Competitor Pricing market table"""
+    software, prices, price_types, offers, sources = map(list, zip(*COMPETITORS))
+    return {'firm': [firm] * len(software), 'software': software, 'monthly_price': [float(p) for p in prices],
+            'price_type': price_types, 'offer': offers, 'source': sources}
+
+
+def pricing_tables(params=None, firm_counts=DEFAULT_FIRM_COUNTS, growth_bands=None, mix=None):
+    """
+    {table name: {column: values}} for one v3 pack, built from the same
+    inputs as build_pricing_workbook(params, firm_counts=..., growth_bands=..., mix=...)
+    """
+    params = params or ProspectParams()
+    firm = params.firm_name
+    tables = {
+        'revenue_grid': revenue_grid_table(firm, firm_counts),
+        'revenue_mix': revenue_mix_table(firm, mix),
+        'growth': growth_table(firm),
+    }
+    if growth_bands is not None:
+        tables['growth_bands'] = growth_bands_table(firm, growth_bands)
+    tables['roi'] = roi_table(firm, params)
+    tables['tiers'] = tiers_table(firm)
+    tables['competitors'] = competitors_table(firm)
+    return tables
+
+
+def _pyarrow(fmt):
+    if fmt not in TABLE_FORMATS:
+        raise ValueError(f"Unknown table format '{fmt}' - use one of {sorted(TABLE_FORMATS)}")
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        if fmt == 'parquet':
+            import pyarrow.parquet
+    except ImportError:
+        raise ImportError(f'{fmt} tables need pyarrow (pip install pyarrow)') from None
+    return pyarrow
+
+
+def require_pyarrow(fmt='arrow'):
+    """Fail early, before a long batch, when fmt cannot be written here"""
+    _pyarrow(fmt)
+
+
+def to_arrow(name, columns):
+    """One table as a pyarrow.Table with its TABLE_COLUMNS schema"""
+    pa = _pyarrow('arrow')
+    schema = pa.schema([(column, pa.type_for_alias(type_name)) for column, type_name in TABLE_COLUMNS[name]],
+                       metadata={'ifa_workbooks.table': name})
+    return pa.Table.from_arrays([pa.array(columns[field.name], type=field.type) for field in schema],
+                                schema=schema)
+
+
+def table_path(stem, name, fmt='arrow'):
+    """Where write_tables() puts one table: <stem>.<name>.<ext>"""
+    return f'{stem}.{name}.{TABLE_FORMATS[fmt]}'
+
+
+def write_tables(tables, stem, fmt='arrow'):
+    """
+    Write every table to table_path(stem, name, fmt), each via a temp file
+    in the same directory, and return the paths in table order
+    """
+    pa = _pyarrow(fmt)
+    paths = []
+    for name, columns in tables.items():
+        table = to_arrow(name, columns)
+        path = table_path(stem, name, fmt)
+        with atomic_path(path, suffix=f'.{TABLE_FORMATS[fmt]}') as tmp_path:
+            if fmt == 'parquet':
+                pa.parquet.write_table(table, tmp_path)
+            else:
+                with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        paths.append(path)
+    return paths
+
+
+def read_table(path):
+    """A table written by write_tables(); .arrow files are memory-mapped, not read"""
+    if path.lower().endswith('.parquet'):
+        return _pyarrow('parquet').parquet.read_table(path, memory_map=True)
+    pa = _pyarrow('arrow')
+    return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
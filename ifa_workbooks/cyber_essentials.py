@@ -0,0 +1,179 @@
+"""
+Cyber Essentials question-set workbooks
+
+build_ce_workbook() lays out one organisation's Cyber Essentials answers:
+an answer sheet (one row per question, status column colour-coded, header
+frozen) and a notes sheet of headed sections. The answers themselves stay
+with the caller - the scripts under cyber-essentials/ hold the draft
+question set and MEMA's submitted answers as data.
+
+    wb = build_ce_workbook(answers, columns=ANSWER_COLUMNS, notes=CENotes(...))
+
+read_ce_workbook() turns a saved workbook back into (columns, rows), so an
+exported answer set can be loaded into the answer store (ce_store.py).
+"""
+
+from dataclasses import dataclass, field
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.utils import get_column_letter
+
+from .styles import StyleRegistry, cyber_essentials_styles
+
+# (header, width) for the draft question set: question text plus guidance
+QUESTION_SET_COLUMNS = (
+    ('Section', 18),
+    ('Q No.', 8),
+    ('Question', 50),
+    ('Guidance', 40),
+    ('Answer Type', 15),
+    ('Draft Answer', 60),
+    ('Status', 12),
+)
+
+# (header, width) for a completed answer set
+ANSWER_COLUMNS = (
+    ('Section', 18),
+    ('Q No.', 8),
+    ('Question', 45),
+    ('Your Answer', 70),
+    ('Status', 25),
+)
+
+DRAFT_STATUS_FILLS = {'Ready': 'ready', 'Pending': 'pending', 'Confirm': 'confirm', 'Partial': 'partial'}
+
+
+def draft_status(value):
+    """Status fill for the draft question set (exact status names)"""
+    return DRAFT_STATUS_FILLS.get(value)
+
+
+def action_status(value):
+    """Status fill for a submitted answer set: ready, or anything still to act on"""
+    if value == 'Ready':
+        return 'ready'
+    if 'ACTION' in value or 'Confirm' in value:
+        return 'pending'
+    return None
+
+
+@dataclass
+class NotesSection:
+    """A heading followed by lines; a line may be (label, description, fill part)"""
+
+    heading: str
+    lines: list
+    bold: bool = True
+
+
+@dataclass
+class CENotes:
+    """The second sheet: a title and sections separated by a blank row"""
+
+    title: str
+    heading: str
+    sections: list
+    widths: dict = field(default_factory=lambda: {'A': 40})
+
+
+def status_legend(heading='Status Legend:'):
+    """Legend section explaining the draft status colours"""
+    return NotesSection(heading, [
+        ('Ready', 'Answer complete and verified', 'ready'),
+        ('Confirm', 'Needs your confirmation', 'confirm'),
+        ('Pending', 'Requires your input (TBC)', 'pending'),
+        ('Partial', 'Partially complete, needs review', 'partial'),
+    ], bold=False)
+
+
+def build_ce_workbook(answers, columns=QUESTION_SET_COLUMNS, title='CE Question Set', header_color='4472C4',
+                      status=draft_status, notes=None):
+    """
+    Build a Cyber Essentials workbook and return it unsaved.
+
+    answers is a sequence of row tuples matching columns (the last column
+    is the status); status maps a status value to a fill part or None.
+    notes (a CENotes) adds the second sheet.
+    """
+    wb = Workbook()
+    style = StyleRegistry(wb, cyber_essentials_styles(header_color=header_color), 'CE')
+    _build_answers(wb, style, answers, columns, title, status)
+    if notes is not None:
+        _build_notes(wb, style, notes)
+    return wb
+
+
+def _build_answers(wb, style, answers, columns, title, status):
+    ws = wb.active
+    ws.title = title
+
+    for col, (header, _) in enumerate(columns, 1):
+        style(ws.cell(row=1, column=col, value=header), 'header', 'wrap', 'border')
+
+    status_col = len(columns)
+    for row_num, row_data in enumerate(answers, 2):
+        if len(row_data) != len(columns):
+            raise ValueError(f'answer row {row_num - 1} has {len(row_data)} values, expected {len(columns)}')
+        for col_num, value in enumerate(row_data, 1):
+            parts = ['wrap', 'border']
+            if col_num == 1:
+                parts.append('section')
+            if col_num == status_col:
+                fill = status(value)
+                if fill:
+                    parts.append(fill)
+            style(ws.cell(row=row_num, column=col_num, value=value), *parts)
+
+    for col, (_, width) in enumerate(columns, 1):
+        ws.column_dimensions[get_column_letter(col)].width = width
+
+    ws.freeze_panes = 'A2'
+
+
+def _build_notes(wb, style, notes):
+    ws = wb.create_sheet(notes.title)
+    ws['A1'] = notes.heading
+    style(ws['A1'], 'heading')
+
+    row = 3
+    for section in notes.sections:
+        ws[f'A{row}'] = section.heading
+        if section.bold:
+            style(ws[f'A{row}'], 'bold')
+        for line in section.lines:
+            row += 1
+            if isinstance(line, str):
+                ws[f'A{row}'] = line
+            else:
+                label, description, fill = line
+                ws[f'A{row}'] = label
+                style(ws[f'A{row}'], fill)
+                ws[f'B{row}'] = description
+        row += 2
+
+    for letter, width in notes.widths.items():
+        ws.column_dimensions[letter].width = width
+
+
+def read_ce_workbook(path):
+    """
+    Read the answer sheet of a workbook built by build_ce_workbook().
+
+    Returns (columns, rows): QUESTION_SET_COLUMNS or ANSWER_COLUMNS, picked
+    by the header row, and the answer rows as tuples (empty cells as '').
+    """
+    wb = load_workbook(path, read_only=True)
+    try:
+        cells = wb.worksheets[0].iter_rows(values_only=True)
+        headers = tuple(value for value in next(cells, ()) if value is not None)
+        for columns in (QUESTION_SET_COLUMNS, ANSWER_COLUMNS):
+            if headers == tuple(header for header, _ in columns):
+                break
+        else:
+            raise ValueError(f'{path} is not a Cyber Essentials answer sheet (headers {list(headers)})')
+        width = len(columns)
+        rows = [tuple('' if value is None else str(value) for value in row[:width])
+                for row in cells if any(value is not None for value in row[:width])]
+    finally:
+        wb.close()
+    return columns, rows
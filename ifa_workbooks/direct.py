@@ -0,0 +1,245 @@
+"""
+Direct XML writer for large numeric and formula tables
+
+openpyxl keeps every cell as a Cell object with its own style array, so a
+10,000-row Revenue Calculator table costs several Python objects and a few
+hundred bytes per cell before anything is written. A DirectTable describes
+the table column by column instead: a NumPy array of literals or a formula
+template, plus cellXfs style indices from StyleRegistry.style_id(). Each
+row is one pre-encoded template filled in with %-formatting, and the rows
+are streamed straight into the sheet's zip entry after openpyxl has saved
+everything else:
+
+    money = style.style_id(ws, 'border', 'money')
+    table = DirectTable(13, [
+        DirectColumn(values=np.arange(1, 10_001), styles=(style.style_id(ws, 'border'),)),
+        DirectColumn(formula='=A{row}*$B$5*24', styles=(money,)),
+    ])
+    wb.direct_tables.add(ws, table)
+    wb.save('pack.xlsx')   # DirectWorkbook and StreamingWorkbook splice the rows in
+
+Cells openpyxl wrote in the same rows (left or right of a table) are merged
+into place; one inside a table's range raises ValueError. The table cells
+are not visible through the workbook object, so read the saved file (e.g.
+FormulaEngine.from_file) to evaluate them.
+"""
+
+import math
+import re
+import zipfile
+from dataclasses import dataclass
+from xml.sax.saxutils import escape
+
+import numpy as np
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter, range_boundaries
+
+from .xlsx_parts import CELL_RE, COORD_ATTR_RE, replace_parts, sheet_parts
+
+# Rows encoded per chunk written to the zip entry
+CHUNK_ROWS = 2048
+
+SHEET_DATA_RE = re.compile(rb'<sheetData\s*/>|<sheetData>(.*?)</sheetData>', re.S)
+ROW_RE = re.compile(rb'<row\b([^>]*?)(?:/>|>(.*?)</row>)', re.S)
+ROW_NUMBER_RE = re.compile(rb'\br="(\d+)"')
+SPANS_ATTR_RE = re.compile(rb'\sspans="[^"]*"')
+DIMENSION_RE = re.compile(rb'<dimension ref="([^"]*)"')
+
+
+@dataclass(frozen=True)
+class DirectColumn:
+    """One table column: literal values or a formula template, and its styles"""
+
+    values: object = None   # 1-D array-like, one literal per row
+    formula: str = None     # '=A{row}*$B$5' - {row} is the sheet row number
+    styles: tuple = (0,)    # cellXfs index per row, cycling from the table's first row
+
+
+def _encode_values(values):
+    """(t attribute, encoded <v> or <is> text per row) for a column of literals"""
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError('DirectColumn values must be 1-D')
+    kind = values.dtype.kind
+    if kind == 'b':
+        return 'b', np.where(values, '1', '0').tolist()
+    if kind in 'iu':
+        return 'n', values.astype(str).tolist()
+    if kind == 'f':
+        if not np.isfinite(values).all():
+            raise ValueError('Cannot store NaN or infinity in a cell')
+        return 'n', values.astype(str).tolist()
+    return 'inlineStr', [escape(str(value)) for value in values.tolist()]
+
+
+class DirectTable:
+    """
+    A block of rows written as raw sheet XML.
+
+    Starts at first_row / first_column (1-based). The row count comes from
+    the value columns, which must agree; a table of formulas only needs
+    rows.
+    """
+
+    def __init__(self, first_row, columns, first_column=1, rows=None):
+        self.first_row = first_row
+        self.first_column = first_column
+        self.columns = list(columns)
+        if not self.columns:
+            raise ValueError('A DirectTable needs at least one column')
+
+        self._values = []
+        lengths = set()
+        for col in self.columns:
+            if (col.values is None) == (col.formula is None):
+                raise ValueError('Each DirectColumn needs exactly one of values or formula')
+            if col.values is not None:
+                cell_type, encoded = _encode_values(col.values)
+                lengths.add(len(encoded))
+                self._values.append((cell_type, encoded))
+            else:
+                self._values.append(None)
+        if rows is not None:
+            lengths.add(rows)
+        if len(lengths) != 1:
+            raise ValueError(f'DirectTable columns disagree on the row count: {sorted(lengths)}')
+        self.rows = lengths.pop()
+        self._templates = self._compile()
+
+    @property
+    def last_row(self):
+        return self.first_row + self.rows - 1
+
+    @property
+    def last_column(self):
+        return self.first_column + len(self.columns) - 1
+
+    def _compile(self):
+        """One %-format template per phase of the style cycles"""
+        period = math.lcm(*(len(col.styles) for col in self.columns))
+        templates = []
+        for phase in range(period):
+            cells = []
+            for i, col in enumerate(self.columns):
+                ref = f'{get_column_letter(self.first_column + i)}%(row)d'
+                s = col.styles[phase % len(col.styles)]
+                if col.formula is not None:
+                    text = escape(col.formula.lstrip('=')).replace('%', '%%').replace('{row}', '%(row)d')
+                    cells.append(f'<c r="{ref}" s="{s}"><f>{text}</f><v /></c>')
+                elif self._values[i][0] == 'inlineStr':
+                    cells.append(f'<c r="{ref}" s="{s}" t="inlineStr"><is><t>%(v{i})s</t></is></c>')
+                else:
+                    cells.append(f'<c r="{ref}" s="{s}" t="{self._values[i][0]}"><v>%(v{i})s</v></c>')
+            templates.append(''.join(cells))
+        return templates
+
+    def cells_xml(self, row):
+        """The encoded <c> elements of one sheet row"""
+        index = row - self.first_row
+        fields = {'row': row}
+        for i, encoded in enumerate(self._values):
+            if encoded is not None:
+                fields[f'v{i}'] = encoded[1][index]
+        return self._templates[index % len(self._templates)] % fields
+
+
+def _merge_dimension(head, tables):
+    match = DIMENSION_RE.search(head)
+    if match is None:
+        return head
+    min_col, min_row, max_col, max_row = range_boundaries(match.group(1).decode())
+    min_col = min([min_col] + [t.first_column for t in tables])
+    min_row = min([min_row] + [t.first_row for t in tables])
+    max_col = max([max_col] + [t.last_column for t in tables])
+    max_row = max([max_row] + [t.last_row for t in tables])
+    ref = f'{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}'
+    return head[:match.start(1)] + ref.encode() + head[match.end(1):]
+
+
+def _merge_row(row, inner, tables):
+    """Existing cells of a row plus the tables' cells, in column order"""
+    pieces = [(t.first_column, t.cells_xml(row)) for t in tables]
+    for match in CELL_RE.finditer(inner):
+        coord = COORD_ATTR_RE.search(match.group(1)).group(1).decode()
+        column = range_boundaries(f'{coord}:{coord}')[0]
+        if any(t.first_column <= column <= t.last_column for t in tables):
+            raise ValueError(f'Cell {coord} lies inside a direct table')
+        pieces.append((column, match.group(0).decode('utf-8')))
+    pieces.sort(key=lambda piece: piece[0])
+    return ''.join(xml for _, xml in pieces)
+
+
+def splice_rows(xml, tables):
+    """
+    Yield a worksheet part with the tables' rows merged into <sheetData>,
+    in chunks of CHUNK_ROWS rows.
+    """
+    for a in tables:
+        for b in tables:
+            if a is not b and a.first_row <= b.last_row and b.first_row <= a.last_row \
+                    and a.first_column <= b.last_column and b.first_column <= a.last_column:
+                raise ValueError('Direct tables on one sheet overlap')
+
+    match = SHEET_DATA_RE.search(xml)
+    existing = {}
+    for row_match in ROW_RE.finditer(match.group(1) or b''):
+        attrs = row_match.group(1)
+        existing[int(ROW_NUMBER_RE.search(attrs).group(1))] = (SPANS_ATTR_RE.sub(b'', attrs), row_match.group(2) or b'')
+
+    yield _merge_dimension(xml[:match.start()], tables) + b'<sheetData>'
+    rows = set(existing)
+    for table in tables:
+        rows.update(range(table.first_row, table.last_row + 1))
+
+    chunk = []
+    for row in sorted(rows):
+        covering = [t for t in tables if t.first_row <= row <= t.last_row]
+        attrs, inner = existing.get(row, (None, b''))
+        if not covering:
+            body = inner.decode('utf-8')
+        elif not inner:
+            body = ''.join(t.cells_xml(row) for t in sorted(covering, key=lambda t: t.first_column))
+        else:
+            body = _merge_row(row, inner, covering)
+        attrs = attrs.decode('utf-8') if attrs is not None else f' r="{row}"'
+        chunk.append(f'<row{attrs}>{body}</row>' if body else f'<row{attrs} />')
+        if len(chunk) >= CHUNK_ROWS:
+            yield ''.join(chunk).encode('utf-8')
+            chunk = []
+    yield ''.join(chunk).encode('utf-8') + b'</sheetData>' + xml[match.end():]
+
+
+class DirectTables:
+    """DirectTables waiting to be written into a saved workbook, by sheet title"""
+
+    def __init__(self):
+        self._tables = {}
+
+    def add(self, ws, table):
+        self._tables.setdefault(ws.title, []).append(table)
+        return table
+
+    def __len__(self):
+        return sum(len(tables) for tables in self._tables.values())
+
+    def write(self, path):
+        """Stream every table's rows into the saved file at path"""
+        if not self._tables:
+            return
+        with zipfile.ZipFile(path) as zf:
+            parts = sheet_parts(zf)
+            replacements = {parts[title]: splice_rows(zf.read(parts[title]), tables)
+                            for title, tables in self._tables.items()}
+        replace_parts(path, replacements)
+
+
+class DirectWorkbook(Workbook):
+    """In-memory Workbook whose save() also writes its direct tables"""
+
+    def __init__(self):
+        super().__init__()
+        self.direct_tables = DirectTables()
+
+    def save(self, filename):
+        super().save(filename)
+        self.direct_tables.write(filename)
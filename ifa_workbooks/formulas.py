@@ -0,0 +1,620 @@
+"""
+In-process evaluation of the formulas the generators write
+
+The generated sheets are mostly formulas ('=A13*$B$5*24',
+'=ROUND(D11*$B$6,0)', '=(B40/B39)*100'), which stay empty until Excel
+recalculates. FormulaEngine parses those formulas, builds a cell
+dependency graph, evaluates cells in topological order and, after an
+input changes, re-evaluates only the cells downstream of it.
+
+Supported: numbers, strings, TRUE/FALSE, cell and range references (with
+$ anchors and 'Sheet'! prefixes), + - * / ^ & % = <> < > <= >=, and the
+functions in FUNCTIONS. Anything else evaluates to #NAME?.
+
+    engine = FormulaEngine.from_file('pack.xlsx')
+    engine.value('ROI Calculator', 'B41')
+    engine.set_cell('ROI Calculator', 'B28', 300)
+    engine.recalculate()                      # only B28's dependents
+    write_cached_values(engine, 'pack.xlsx')  # <v> for every formula cell
+
+The workbook's defined names (names.py) are loaded too, so formulas may
+use them and engine.cell_names['roi_net_benefit_annual'].cell gives the
+cell behind a name without scanning the sheet.
+"""
+
+import math
+import re
+import zipfile
+from collections import defaultdict, deque
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP, ROUND_UP
+
+from openpyxl import load_workbook
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+from .names import read_names, workbook_names
+from .xlsx_parts import ExcelError, read_cells, replace_parts, set_cell_values, shared_strings, sheet_parts
+
+DIV0 = ExcelError('#DIV/0!')
+VALUE = ExcelError('#VALUE!')
+NAME = ExcelError('#NAME?')
+NUM = ExcelError('#NUM!')
+
+
+class FormulaError(ValueError):
+    """A formula could not be parsed, or the cells form a cycle"""
+
+
+# ============================================
+# TOKENIZER / PARSER
+# ============================================
+_REF = r"\$?[A-Za-z]{1,3}\$?[0-9]+"
+TOKEN_RE = re.compile(rf"""
+    \s*(?:
+        (?P<string>"(?:[^"]|"")*")
+      | (?P<func>[A-Za-z_][A-Za-z0-9_.]*)\s*\(
+      | (?P<ref>(?:(?P<sheet>'(?:[^']|'')+'|[A-Za-z_][A-Za-z0-9_.]*)!)?
+                (?P<start>{_REF})(?::(?P<end>{_REF}))?)(?![A-Za-z0-9_.(])
+      | (?P<number>(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)
+      | (?P<name>[A-Za-z_\\][A-Za-z0-9_.]*)
+      | (?P<op><>|<=|>=|[-+*/^&=<>%(),])
+    )""", re.X)
+
+_COMPARISONS = ('=', '<>', '<', '>', '<=', '>=')
+
+
+def split_coordinate(coord):
+    """'$B$5' -> ('B', 5)"""
+    coord = coord.replace('$', '').upper()
+    match = re.fullmatch(r'([A-Z]{1,3})([0-9]+)', coord)
+    if not match:
+        raise FormulaError(f'Bad cell reference {coord!r}')
+    return match.group(1), int(match.group(2))
+
+
+def normalize(coord):
+    column, row = split_coordinate(coord)
+    return f'{column}{row}'
+
+
+def expand_range(start, end):
+    """All coordinates in start:end, row by row"""
+    c1, r1 = split_coordinate(start)
+    c2, r2 = split_coordinate(end)
+    i1, i2 = sorted((column_index_from_string(c1), column_index_from_string(c2)))
+    r1, r2 = sorted((r1, r2))
+    return [f'{get_column_letter(c)}{r}' for r in range(r1, r2 + 1) for c in range(i1, i2 + 1)]
+
+
+def _tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if not match or match.end() == pos:
+            raise FormulaError(f'Cannot parse formula at {text[pos:]!r}')
+        pos = match.end()
+        tokens.append((match.lastgroup, match))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing ('kind', ...) tuples"""
+
+    def __init__(self, text, sheet):
+        self.tokens = _tokenize(text)
+        self.pos = 0
+        self.sheet = sheet
+
+    def peek_op(self):
+        if self.pos < len(self.tokens):
+            kind, match = self.tokens[self.pos]
+            if kind == 'op':
+                return match.group('op')
+        return None
+
+    def take(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def expect(self, op):
+        if self.peek_op() != op:
+            raise FormulaError(f'Expected {op!r}')
+        self.pos += 1
+
+    def parse(self):
+        node = self.comparison()
+        if self.pos != len(self.tokens):
+            raise FormulaError('Unexpected trailing input')
+        return node
+
+    def _binary(self, operand, ops):
+        node = operand()
+        while self.peek_op() in ops:
+            op = self.take()[1].group('op')
+            node = ('binop', op, node, operand())
+        return node
+
+    def comparison(self):
+        return self._binary(self.concat, _COMPARISONS)
+
+    def concat(self):
+        return self._binary(self.additive, ('&',))
+
+    def additive(self):
+        return self._binary(self.multiplicative, ('+', '-'))
+
+    def multiplicative(self):
+        return self._binary(self.power, ('*', '/'))
+
+    def power(self):
+        # Excel binds unary minus tighter than ^ (so -2^2 = 4)
+        return self._binary(self.unary, ('^',))
+
+    def unary(self):
+        op = self.peek_op()
+        if op in ('-', '+'):
+            self.pos += 1
+            operand = self.unary()
+            return ('neg', operand) if op == '-' else operand
+        return self.postfix()
+
+    def postfix(self):
+        node = self.primary()
+        while self.peek_op() == '%':
+            self.pos += 1
+            node = ('binop', '/', node, ('const', 100))
+        return node
+
+    def primary(self):
+        if self.pos >= len(self.tokens):
+            raise FormulaError('Unexpected end of formula')
+        kind, match = self.take()
+        if kind == 'number':
+            return ('const', float(match.group('number')))
+        if kind == 'string':
+            return ('const', match.group('string')[1:-1].replace('""', '"'))
+        if kind == 'ref':
+            sheet = match.group('sheet')
+            if sheet is None:
+                sheet = self.sheet
+            elif sheet.startswith("'"):
+                sheet = sheet[1:-1].replace("''", "'")
+            start = normalize(match.group('start'))
+            if match.group('end'):
+                return ('range', sheet, tuple(expand_range(start, match.group('end'))))
+            return ('ref', sheet, start)
+        if kind == 'name':
+            name = match.group('name')
+            if name.upper() in ('TRUE', 'FALSE'):
+                return ('const', name.upper() == 'TRUE')
+            return ('name', name)
+        if kind == 'func':
+            name = match.group('func').upper()
+            args = []
+            if self.peek_op() != ')':
+                args.append(self.comparison())
+                while self.peek_op() == ',':
+                    self.pos += 1
+                    args.append(self.comparison())
+            self.expect(')')
+            return ('func', name, args)
+        if kind == 'op' and match.group('op') == '(':
+            node = self.comparison()
+            self.expect(')')
+            return node
+        raise FormulaError(f'Unexpected {match.group(0).strip()!r}')
+
+
+# ============================================
+# EVALUATION
+# ============================================
+def _to_number(value):
+    if isinstance(value, ExcelError):
+        return value
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return VALUE
+
+
+def _to_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _arith(op, a, b):
+    a, b = _to_number(a), _to_number(b)
+    if isinstance(a, ExcelError):
+        return a
+    if isinstance(b, ExcelError):
+        return b
+    if op == '+':
+        return a + b
+    if op == '-':
+        return a - b
+    if op == '*':
+        return a * b
+    if op == '/':
+        return DIV0 if b == 0 else a / b
+    try:
+        result = a ** b
+    except (OverflowError, ZeroDivisionError):
+        return NUM
+    return NUM if isinstance(result, complex) else result
+
+
+def _sort_key(value):
+    # Excel orders every number below every string; text compares case-insensitively
+    if isinstance(value, str):
+        return (1, value.lower())
+    return (0, _to_number(value))
+
+
+def _compare(op, a, b):
+    for v in (a, b):
+        if isinstance(v, ExcelError):
+            return v
+    a, b = _sort_key(a), _sort_key(b)
+    return {'=': a == b, '<>': a != b, '<': a < b, '>': a > b, '<=': a <= b, '>=': a >= b}[op]
+
+
+def _round(value, digits, rounding):
+    value, digits = _to_number(value), _to_number(digits)
+    for v in (value, digits):
+        if isinstance(v, ExcelError):
+            return v
+    quantum = Decimal(1).scaleb(-int(digits))
+    return float(Decimal(repr(float(value))).quantize(quantum, rounding=rounding))
+
+
+def _numbers(args):
+    """Flatten arguments to numbers, skipping text/blanks inside ranges"""
+    for arg, from_range in args:
+        values = arg if from_range else [arg]
+        for value in values:
+            if isinstance(value, ExcelError):
+                yield value
+            elif from_range and (value is None or isinstance(value, (str, bool))):
+                continue
+            else:
+                yield _to_number(value)
+
+
+def _aggregate(reduce, empty=0):
+    def fn(args):
+        values = list(_numbers(args))
+        for v in values:
+            if isinstance(v, ExcelError):
+                return v
+        return reduce(values) if values else empty
+    return fn
+
+
+def _if(args):
+    cond = args[0][0]
+    if isinstance(cond, ExcelError):
+        return cond
+    if isinstance(cond, str):
+        return VALUE
+    branch = 1 if cond else 2
+    return args[branch][0] if branch < len(args) else False
+
+
+def _iferror(args):
+    value = args[0][0]
+    return args[1][0] if isinstance(value, ExcelError) else value
+
+
+def _logical(reduce):
+    def fn(args):
+        values = []
+        for value in _numbers(args):
+            if isinstance(value, ExcelError):
+                return value
+            values.append(bool(value))
+        return reduce(values)
+    return fn
+
+
+FUNCTIONS = {
+    'SUM': _aggregate(sum),
+    'AVERAGE': _aggregate(lambda v: sum(v) / len(v), empty=DIV0),
+    'MIN': _aggregate(min),
+    'MAX': _aggregate(max),
+    'COUNT': lambda args: sum(1 for v in _numbers(args) if not isinstance(v, ExcelError)),
+    'ROUND': lambda args: _round(args[0][0], args[1][0] if len(args) > 1 else 0, ROUND_HALF_UP),
+    'ROUNDUP': lambda args: _round(args[0][0], args[1][0] if len(args) > 1 else 0, ROUND_UP),
+    'ROUNDDOWN': lambda args: _round(args[0][0], args[1][0] if len(args) > 1 else 0, ROUND_DOWN),
+    'ABS': lambda args: (lambda v: v if isinstance(v, ExcelError) else abs(v))(_to_number(args[0][0])),
+    'IF': _if,
+    'IFERROR': _iferror,
+    'AND': _logical(all),
+    'OR': _logical(any),
+    'NOT': lambda args: (lambda v: v if isinstance(v, ExcelError) else not v)(_to_number(args[0][0])),
+}
+
+
+def _is_range(node, names):
+    """Whether node is a range, directly or through a defined name"""
+    if node[0] == 'name' and node[1] in names:
+        return _is_range(names[node[1]], names)
+    return node[0] == 'range'
+
+
+def _compile(node, deps, names):
+    """Turn a parse tree into a closure over get(sheet, coord)"""
+    kind = node[0]
+    if kind == 'const':
+        value = node[1]
+        return lambda get: value
+    if kind == 'ref':
+        _, sheet, coord = node
+        deps.add((sheet, coord))
+        return lambda get: get(sheet, coord)
+    if kind == 'range':
+        _, sheet, coords = node
+        deps.update((sheet, c) for c in coords)
+        return lambda get: [get(sheet, c) for c in coords]
+    if kind == 'name':
+        target = names.get(node[1])
+        if target is None:
+            return lambda get: NAME
+        return _compile(target, deps, names)
+    if kind == 'neg':
+        operand = _compile(node[1], deps, names)
+        return lambda get: _arith('-', 0, operand(get))
+    if kind == 'binop':
+        _, op, left, right = node
+        left, right = _compile(left, deps, names), _compile(right, deps, names)
+        if op in _COMPARISONS:
+            return lambda get: _compare(op, left(get), right(get))
+        if op == '&':
+            def concat(get):
+                a, b = left(get), right(get)
+                for v in (a, b):
+                    if isinstance(v, ExcelError):
+                        return v
+                return _to_text(a) + _to_text(b)
+            return concat
+        return lambda get: _arith(op, left(get), right(get))
+    if kind == 'func':
+        _, name, arg_nodes = node
+        fn = FUNCTIONS.get(name)
+        args = [(_compile(arg, deps, names), _is_range(arg, names)) for arg in arg_nodes]
+        if fn is None:
+            return lambda get: NAME
+
+        def call(get):
+            try:
+                return fn([(arg(get), is_range) for arg, is_range in args])
+            except (IndexError, TypeError, ValueError, ArithmeticError):
+                return VALUE
+        return call
+    raise FormulaError(f'Unknown node {kind!r}')
+
+
+def parse_formula(text, sheet, names=None):
+    """
+    Compile '=...' text found on sheet.
+
+    Returns (callable(get) -> value, set of (sheet, coord) dependencies).
+    names maps defined names to parse trees (see FormulaEngine.define_name).
+    """
+    if text.startswith('='):
+        text = text[1:]
+    deps = set()
+    fn = _compile(_Parser(text, sheet).parse(), deps, names or {})
+    return fn, deps
+
+
+# ============================================
+# ENGINE
+# ============================================
+class FormulaEngine:
+    """Dependency-tracking evaluator over (sheet, coordinate) cells"""
+
+    def __init__(self):
+        self._values = {}
+        self._formulas = {}
+        self._deps = {}
+        self._dependents = defaultdict(set)
+        self._dirty = set()
+        self._names = {}
+        self.cell_names = {}
+
+    @classmethod
+    def from_workbook(cls, wb):
+        """Load every non-empty cell of an in-memory openpyxl Workbook"""
+        engine = cls()
+        engine.load_names(workbook_names(wb))
+        for ws in wb.worksheets:
+            for row in ws.iter_rows():
+                for cell in row:
+                    if cell.value is not None:
+                        engine.set_cell(ws.title, cell.coordinate, cell.value)
+        return engine
+
+    @classmethod
+    def from_file(cls, path):
+        return cls.from_workbook(load_workbook(path))
+
+    @classmethod
+    def from_parts(cls, path):
+        """
+        Load every cell straight from the worksheet XML (no openpyxl load).
+
+        Formula cells keep their cached <v> result and are re-evaluated only
+        when something upstream changes; formulas saved without a cached
+        result are evaluated on first use.
+        """
+        engine = cls()
+        with zipfile.ZipFile(path) as zf:
+            engine.load_names(read_names(zf))
+            strings = shared_strings(zf)
+            for sheet, part in sheet_parts(zf).items():
+                for coord, value, formula in read_cells(zf.read(part), strings):
+                    if formula is not None:
+                        engine._load_formula((sheet, coord), formula, value)
+                    elif value is not None and value != '':  # openpyxl loads '' as blank
+                        engine._values[(sheet, coord)] = value
+        return engine
+
+    def define_name(self, name, sheet, ref):
+        """Make name usable in formulas as an alias for sheet!ref"""
+        text = ref if ref.startswith('=') else f'={ref}'
+        self._names[name] = _Parser(text[1:], sheet).parse()
+        # Re-bind formulas that referenced the name before it existed
+        pattern = re.compile(rf'\b{re.escape(name)}\b')
+        for (sheet, coord), (formula, _) in list(self._formulas.items()):
+            if pattern.search(formula):
+                self.set_cell(sheet, coord, formula)
+
+    def load_names(self, names):
+        """define_name() each CellName of {name: CellName} (names.py) and keep it in cell_names"""
+        for cell_name in names.values():
+            self.define_name(cell_name.name, cell_name.sheet, cell_name.formula)
+        self.cell_names.update(names)
+
+    def set_cell(self, sheet, coord, value):
+        """Set an input value or a '=...' formula and mark dependents dirty"""
+        key = (sheet, normalize(coord))
+        self._drop_formula(key)
+        if isinstance(value, str) and value.startswith('=') and len(value) > 1:
+            fn, deps = parse_formula(value, sheet, self._names)
+            self._formulas[key] = (value, fn)
+            self._deps[key] = deps
+            for dep in deps:
+                self._dependents[dep].add(key)
+            self._values.pop(key, None)
+        else:
+            self._values[key] = value
+        self._mark_dirty(key)
+
+    def update(self, sheet, values):
+        """set_cell for each coordinate -> value in values"""
+        for coord, value in values.items():
+            self.set_cell(sheet, coord, value)
+
+    def formula(self, sheet, coord):
+        entry = self._formulas.get((sheet, normalize(coord)))
+        return entry[0] if entry else None
+
+    def formula_cells(self):
+        """All (sheet, coord) keys that hold a formula"""
+        return list(self._formulas)
+
+    def dependents(self, sheet, coord):
+        """Every cell downstream of sheet!coord"""
+        seen = set()
+        stack = [(sheet, normalize(coord))]
+        while stack:
+            for key in self._dependents.get(stack.pop(), ()):
+                if key not in seen:
+                    seen.add(key)
+                    stack.append(key)
+        return seen
+
+    def value(self, sheet, coord):
+        key = (sheet, normalize(coord))
+        if self._dirty:
+            self.recalculate()
+        return self._values.get(key)
+
+    def values(self, sheet):
+        """Current coord -> value map for one sheet"""
+        if self._dirty:
+            self.recalculate()
+        return {coord: v for (s, coord), v in self._values.items() if s == sheet}
+
+    def recalculate(self):
+        """
+        Evaluate dirty formula cells in dependency order.
+
+        Returns the set of (sheet, coord) keys whose value changed.
+        """
+        dirty = {key for key in self._dirty if key in self._formulas}
+        self._dirty.clear()
+        indegree = {key: sum(1 for dep in self._deps[key] if dep in dirty) for key in dirty}
+        ready = deque(key for key, n in indegree.items() if n == 0)
+        changed = set()
+        values = self._values
+
+        def getter(sheet, coord):
+            return values.get((sheet, coord))
+
+        evaluated = 0
+        while ready:
+            key = ready.popleft()
+            evaluated += 1
+            value = self._formulas[key][1](getter)
+            if isinstance(value, float) and not math.isfinite(value):
+                value = NUM
+            if key not in self._values or self._values[key] != value or type(self._values[key]) is not type(value):
+                changed.add(key)
+            self._values[key] = value
+            for dependent in self._dependents.get(key, ()):
+                if dependent in indegree:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        ready.append(dependent)
+        if evaluated != len(dirty):
+            cycle = sorted(f'{s}!{c}' for s, c in dirty if indegree[(s, c)] > 0)
+            raise FormulaError(f"Circular reference between {', '.join(cycle[:5])}")
+        return changed
+
+    def _load_formula(self, key, formula, cached):
+        fn, deps = parse_formula(formula, key[0], self._names)
+        self._formulas[key] = (formula, fn)
+        self._deps[key] = deps
+        for dep in deps:
+            self._dependents[dep].add(key)
+        if cached is None:
+            self._dirty.add(key)
+        else:
+            self._values[key] = cached
+
+    def _drop_formula(self, key):
+        if key in self._formulas:
+            for dep in self._deps.pop(key):
+                self._dependents[dep].discard(key)
+            del self._formulas[key]
+
+    def _mark_dirty(self, key):
+        self._dirty.add(key)
+        self._dirty.update(self.dependents(*key))
+
+
+def write_cached_values(engine, src_path, dest_path=None):
+    """
+    Store the engine's results as cached <v> values in a saved workbook.
+
+    Only the worksheet parts that contain formulas are rewritten; Excel still
+    recalculates on open, but headless readers (openpyxl data_only=True,
+    pandas, PDF renderers) now see numbers instead of empty cells.
+    """
+    if engine._dirty:
+        engine.recalculate()
+    by_sheet = defaultdict(dict)
+    for sheet, coord in engine.formula_cells():
+        by_sheet[sheet][coord] = engine._values.get((sheet, coord))
+
+    with zipfile.ZipFile(src_path) as zf:
+        parts = sheet_parts(zf)
+        replacements = {}
+        for sheet, values in by_sheet.items():
+            part = parts[sheet]
+            replacements[part], _ = set_cell_values(zf.read(part), values)
+    replace_parts(src_path, replacements, dest_path)
@@ -0,0 +1,187 @@
+"""
+Monte Carlo growth simulator behind the Growth Projections fan chart
+
+The Growth Projections tables are deterministic: a fixed list of new firms
+per year and one annual churn rate. simulate_growth() instead draws, for
+every path and month,
+
+    new firms  ~ Poisson(new_per_year / 12 * G)   G ~ Gamma, mean 1, per path-year
+    churned    ~ Binomial(active, h)              h from a per-path annual churn
+                                                  rate ~ Beta(mean = annual_churn)
+
+and reports P10/P50/P90 bands of active firms (and so MRR/ARR) per month.
+
+All paths in a batch advance together as NumPy arrays. Active-firm counts
+are integers, so each batch only returns a per-month histogram of counts;
+histograms from any number of batches or processes add up exactly, so the
+percentiles are exact without ever holding paths x months in memory.
+Batches are seeded from one SeedSequence, so a given seed gives the same
+bands whatever the number of worker processes.
+"""
+
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+# New firms signed per year in each Growth Projections scenario
+GROWTH_SCENARIOS = {
+    'Conservative': (10, 10, 15, 20, 25),
+    'Moderate': (25, 35, 45, 60, 75),
+    'Aggressive': (50, 70, 100, 130, 150),
+}
+DEFAULT_ANNUAL_CHURN = 0.05
+DEFAULT_MONTHLY_RATE = 250
+DEFAULT_PERCENTILES = (10, 50, 90)
+# Paths per batch: batches are what workers share, so the default 100,000 paths make 10
+DEFAULT_BATCH_SIZE = 10_000
+
+
+@dataclass
+class GrowthBands:
+    """Percentile bands of active firms per month from a simulation run"""
+
+    scenario: str
+    paths: int
+    monthly_rate: float
+    percentiles: tuple
+    months: np.ndarray
+    firms: np.ndarray  # (len(percentiles), months)
+
+    @property
+    def mrr(self):
+        return self.firms * self.monthly_rate
+
+    @property
+    def arr(self):
+        return self.mrr * 12
+
+    def band(self, percentile, values=None):
+        """One percentile row of firms (or of values, e.g. bands.arr)"""
+        values = self.firms if values is None else values
+        return values[self.percentiles.index(percentile)]
+
+    def year_end(self, values=None):
+        """Columns for months 12, 24, ... (the sheet's Year 1..N)"""
+        values = self.firms if values is None else values
+        return values[:, 11::12]
+
+
+def monthly_arrivals(new_per_year, months):
+    """Expected new firms per month: each year's count spread evenly, the last year repeating"""
+    per_month = np.repeat(np.asarray(new_per_year, dtype=np.float64) / 12, 12)
+    if months > len(per_month):
+        per_month = np.concatenate([per_month, np.full(months - len(per_month), per_month[-1])])
+    return per_month[:months]
+
+
+def year_end_firms(new_per_year, annual_churn=DEFAULT_ANNUAL_CHURN):
+    """
+    (churned, total firms) per year as the deterministic Growth Projections
+    tables compute them: no churn in year 1, then ROUND(previous total * churn, 0)
+    """
+    churned = np.zeros(len(new_per_year))
+    firms = np.zeros(len(new_per_year))
+    total = 0.0
+    for year, new in enumerate(new_per_year):
+        # ROUND(D*churn, 0): Excel rounds halves away from zero
+        churned[year] = np.floor(total * annual_churn + 0.5) if year else 0.0
+        total = total + new - churned[year]
+        firms[year] = total
+    return churned, firms
+
+
+def _simulate_batch(seed, paths, arrivals, annual_churn, churn_concentration, acquisition_dispersion):
+    """Run one batch of paths; returns a list of per-month count histograms"""
+    rng = np.random.default_rng(seed)
+    months = len(arrivals)
+    years = (months + 11) // 12
+
+    if acquisition_dispersion > 0:
+        shape = 1 / acquisition_dispersion
+        year_factor = rng.gamma(shape, acquisition_dispersion, size=(years, paths))
+    else:
+        year_factor = None
+
+    # Beta needs 0 < churn < 1; at either end every path has the same rate
+    if churn_concentration and 0 < annual_churn < 1:
+        a = annual_churn * churn_concentration
+        b = (1 - annual_churn) * churn_concentration
+        churn = rng.beta(a, b, size=paths)
+    else:
+        churn = np.full(paths, annual_churn)
+    hazard = 1 - (1 - churn) ** (1 / 12)
+
+    active = np.zeros(paths, dtype=np.int64)
+    histograms = []
+    for month in range(months):
+        rate = arrivals[month] if year_factor is None else arrivals[month] * year_factor[month // 12]
+        active -= rng.binomial(active, hazard)
+        active += rng.poisson(rate, size=paths)
+        histograms.append(np.bincount(active))
+    return histograms
+
+
+def _merge(total, histograms):
+    for month, hist in enumerate(histograms):
+        if len(hist) > len(total[month]):
+            hist = hist.copy()
+            hist[:len(total[month])] += total[month]
+            total[month] = hist
+        else:
+            total[month][:len(hist)] += hist
+
+
+def _percentiles_from_histogram(hist, percentiles):
+    cdf = np.cumsum(hist)
+    targets = np.asarray(percentiles, dtype=np.float64) / 100 * cdf[-1]
+    # Smallest count whose cumulative share reaches the target (inverted CDF)
+    return np.searchsorted(cdf, targets, side='left')
+
+
+def simulate_growth(scenario='Moderate', new_per_year=None, annual_churn=DEFAULT_ANNUAL_CHURN,
+                    monthly_rate=DEFAULT_MONTHLY_RATE, paths=100_000, months=None, seed=None,
+                    percentiles=DEFAULT_PERCENTILES, batch_size=DEFAULT_BATCH_SIZE, workers=1,
+                    acquisition_dispersion=0.1, churn_concentration=50):
+    """
+    Simulate paths of firm growth and return GrowthBands.
+
+    new_per_year defaults to GROWTH_SCENARIOS[scenario]; months defaults to
+    12 per listed year. acquisition_dispersion is the variance of the
+    per-year acquisition multiplier (0 = plain Poisson) and
+    churn_concentration the Beta concentration around annual_churn
+    (None = same churn rate on every path). workers > 1 spreads the
+    batches of batch_size paths over a process pool, so at most
+    ceil(paths / batch_size) workers are used; the result does not depend
+    on workers.
+    """
+    if not 0 <= annual_churn <= 1:
+        raise ValueError(f'annual_churn must be between 0 and 1, got {annual_churn}')
+    if new_per_year is None:
+        new_per_year = GROWTH_SCENARIOS[scenario]
+    months = months or 12 * len(new_per_year)
+    arrivals = monthly_arrivals(new_per_year, months)
+
+    sizes = [batch_size] * (paths // batch_size)
+    if paths % batch_size:
+        sizes.append(paths % batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(s, n, arrivals, annual_churn, churn_concentration, acquisition_dispersion)
+            for s, n in zip(seeds, sizes)]
+
+    if workers > max(len(jobs), 1):
+        warnings.warn(f'{paths} paths make {len(jobs)} batch(es) of up to {batch_size}; '
+                      f'only {len(jobs)} of {workers} workers can be used', stacklevel=2)
+
+    totals = [np.zeros(1, dtype=np.int64) for _ in range(months)]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for histograms in pool.map(_simulate_batch, *zip(*jobs)):
+                _merge(totals, histograms)
+    else:
+        for job in jobs:
+            _merge(totals, _simulate_batch(*job))
+
+    firms = np.stack([_percentiles_from_histogram(h, percentiles) for h in totals], axis=1)
+    return GrowthBands(scenario, paths, monthly_rate, tuple(percentiles), np.arange(1, months + 1), firms)
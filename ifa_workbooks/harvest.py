@@ -0,0 +1,270 @@
+"""
+Harvesting the ROI Calculator inputs back out of returned pricing packs
+
+Sales reps edit the yellow input cells of a pack's ROI Calculator (tool
+costs, time savings, Plannetic cost) and send the file back. Only those
+twelve cells and the tier written beside the Plannetic cost matter, so
+harvest_pack() never loads the workbook: it reads workbook.xml to find the
+ROI Calculator's worksheet part, then streams that one part with
+iterparse, keeps the input cells and stops at the last input row. Styles,
+drawings, charts and every other sheet stay compressed in the zip; the
+shared string table is only read if an input cell holds text, and the firm
+name comes from the Summary sheet's "Prepared for" line, read the same way
+up to its row.
+
+Which cells are inputs is not hard-coded here: INPUT_CELLS comes from the
+generator's own ROI layout (layouts/roi_calculator.json), keyed by the
+ProspectParams field each cell was rendered from, so a harvested pack maps
+straight back onto the batch CSV fields (batch.py). A blank input cell
+counts as 0 in the sheet's formulas, so it is harvested as 0 (and listed
+in HarvestResult.blank) rather than left to the ProspectParams default,
+which would describe a different workbook. Packs that carry the
+layout's defined names (roi_plannetic_cost, ...; see names.py) are read at
+the cells those names point to, so a pack with rows inserted above the
+inputs still harvests correctly:
+
+    result = harvest_pack('returned/Plannetic-Pricing-Acme.xlsx')
+    result.inputs         # {'crm': 50, ..., 'plannetic_cost': 300}
+    result.tier           # 'professional'
+    write_inputs(harvest_packs(paths, workers=8), 'returned.csv')
+    load_prospects('returned.csv')    # -> ProspectParams, ready to regenerate or score
+
+harvest_packs() spreads files over a process pool in chunks, since each
+file takes only a few milliseconds.
+"""
+
+import csv
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from xml.etree import ElementTree
+
+from .batch import NUMERIC_FIELDS, TOOL_KEYS
+from .formulas import split_coordinate
+from .layout import load_layout
+from .names import read_names
+from .xlsx_parts import MAIN_NS, sheet_parts
+
+_ROI_LAYOUT = load_layout('roi_calculator')
+ROI_SHEET = _ROI_LAYOUT.sheet
+# Batch CSV field (ProspectParams field, or tool key) -> ROI Calculator input cell
+INPUT_CELLS = {path.rsplit('.', 1)[-1]: coord for path, coord in _ROI_LAYOUT.input_cells().items()}
+INPUT_FIELDS = tuple(INPUT_CELLS)
+# Defined name -> batch CSV field, for the names the layout gives its inputs
+NAME_FIELDS = {name: field_name for field_name, coord in INPUT_CELLS.items()
+               for name, ref in _ROI_LAYOUT.names.items() if ref == coord}
+# The pack's tier ('Professional tier'), written beside the Plannetic cost
+TIER_NAME = 'roi_tier'
+TIER_CELL = _ROI_LAYOUT.names[TIER_NAME]
+TIER_RE = re.compile(r'^(.+) tier$', re.I)
+
+SUMMARY_SHEET = 'Summary'
+FIRM_NAME_CELL = 'A2'
+FIRM_NAME_RE = re.compile(r'^Prepared for (.*) - Verified')
+
+CSV_FIELDS = ('firm_name', 'tier') + NUMERIC_FIELDS + TOOL_KEYS
+
+_CELL_TAG = f'{{{MAIN_NS}}}c'
+_ROW_TAG = f'{{{MAIN_NS}}}row'
+_VALUE_TAG = f'{{{MAIN_NS}}}v'
+_TEXT_TAG = f'{{{MAIN_NS}}}t'
+_SHARED_ITEM_TAG = f'{{{MAIN_NS}}}si'
+
+
+@dataclass
+class HarvestResult:
+    """The input values read back from one returned pack"""
+
+    path: str
+    firm_name: str = ''
+    tier: str = ''
+    inputs: dict = field(default_factory=dict)     # field -> number; blank cells are 0, as in the sheet
+    blank: list = field(default_factory=list)      # fields whose cell was blank
+    problems: list = field(default_factory=list)   # cells that hold something other than a number
+    seconds: float = 0.0
+    error: str = None
+
+    def row(self):
+        """The result as a batch CSV record (see batch.load_prospects)"""
+        return {'firm_name': self.firm_name, 'tier': self.tier, **self.inputs}
+
+
+def stream_cells(zf, part, coords):
+    """
+    {coordinate: (cell type, raw value text)} for the given cells of one
+    worksheet part, streamed with iterparse and stopped after the last
+    row that holds one of them
+    """
+    wanted = set(coords)
+    last_row = max(split_coordinate(coord)[1] for coord in wanted)
+    found = {}
+    with zf.open(part) as f:
+        for _, elem in ElementTree.iterparse(f):
+            if elem.tag == _CELL_TAG:
+                coord = elem.get('r')
+                if coord in wanted:
+                    if elem.get('t') == 'inlineStr':
+                        text = ''.join(t.text or '' for t in elem.iter(_TEXT_TAG))
+                    else:
+                        text = elem.findtext(_VALUE_TAG)
+                    found[coord] = (elem.get('t', 'n'), text)
+            elif elem.tag == _ROW_TAG:
+                row = elem.get('r')
+                elem.clear()
+                if len(found) == len(wanted) or (row is not None and int(row) >= last_row):
+                    break
+    return found
+
+
+def shared_string_items(zf, indexes):
+    """{index: text} for a few shared strings, streamed up to the largest index"""
+    wanted = set(indexes)
+    strings = {}
+    if not wanted:
+        return strings
+    with zf.open('xl/sharedStrings.xml') as f:
+        index = 0
+        for _, elem in ElementTree.iterparse(f):
+            if elem.tag != _SHARED_ITEM_TAG:
+                continue
+            if index in wanted:
+                strings[index] = ''.join(t.text or '' for t in elem.iter(_TEXT_TAG))
+                if len(strings) == len(wanted):
+                    break
+            elem.clear()
+            index += 1
+    return strings
+
+
+def _resolve(zf, cells):
+    """{coordinate: value} with numbers parsed and shared strings looked up"""
+    shared = shared_string_items(zf, {int(text) for cell_type, text in cells.values() if cell_type == 's' and text})
+    values = {}
+    for coord, (cell_type, text) in cells.items():
+        if text is None or text == '':
+            continue
+        if cell_type == 's':
+            values[coord] = shared[int(text)]
+        elif cell_type == 'n':
+            values[coord] = float(text)
+        elif cell_type == 'b':
+            values[coord] = text == '1'
+        else:   # str, inlineStr, or an error such as #VALUE!
+            values[coord] = text
+    return values
+
+
+def _number(value):
+    """A typed-in value as a number: '£1,250', '60%' and ' 4 ' are all accepted; None if it is not one"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    text = str(value).strip().replace(',', '').lstrip('£').strip()
+    scale = 1
+    if text.endswith('%'):
+        text, scale = text[:-1], 100
+    try:
+        number = float(text) / scale
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def input_cells(zf):
+    """
+    Field -> ROI Calculator input cell, plus 'tier' -> the tier cell, taken
+    from the pack's defined names where it has them
+    """
+    cells = {**INPUT_CELLS, 'tier': TIER_CELL}
+    fields = {**NAME_FIELDS, TIER_NAME: 'tier'}
+    for name, cell_name in read_names(zf).items():
+        field_name = fields.get(name)
+        if field_name is not None and cell_name.sheet == ROI_SHEET and not cell_name.is_range:
+            cells[field_name] = cell_name.ref
+    return cells
+
+
+def harvest_pack(path):
+    """Read one returned pack's ROI Calculator inputs (and firm name) without loading the workbook"""
+    start = time.perf_counter()
+    result = HarvestResult(path)
+    try:
+        with zipfile.ZipFile(path) as zf:
+            parts = sheet_parts(zf)
+            if ROI_SHEET not in parts:
+                raise KeyError(f'no {ROI_SHEET} sheet')
+            inputs = input_cells(zf)
+            cells = {ROI_SHEET: stream_cells(zf, parts[ROI_SHEET], inputs.values())}
+            if SUMMARY_SHEET in parts:
+                cells[SUMMARY_SHEET] = stream_cells(zf, parts[SUMMARY_SHEET], [FIRM_NAME_CELL])
+            values = {sheet: _resolve(zf, sheet_cells) for sheet, sheet_cells in cells.items()}
+    except (KeyError, OSError, zipfile.BadZipFile, ElementTree.ParseError) as exc:
+        result.error = f'{type(exc).__name__}: {exc}'
+        result.seconds = time.perf_counter() - start
+        return result
+
+    match = FIRM_NAME_RE.match(str(values.get(SUMMARY_SHEET, {}).get(FIRM_NAME_CELL, '')))
+    result.firm_name = match.group(1) if match else ''
+    tier_coord = inputs.pop('tier')
+    match = TIER_RE.match(str(values[ROI_SHEET].get(tier_coord, '')).strip())
+    result.tier = match.group(1).strip().lower() if match else ''
+    for name, coord in inputs.items():
+        value = values[ROI_SHEET].get(coord)
+        if value is None:
+            result.inputs[name] = 0
+            result.blank.append(name)
+            continue
+        number = _number(value)
+        if number is None:
+            result.problems.append(f'{coord} ({name}): {value!r} is not a number')
+        else:
+            result.inputs[name] = number
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def pack_paths(paths):
+    """Expand directories to the .xlsx files in them (not Excel's ~$ lock files), sorted"""
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path):
+            expanded.extend(sorted(os.path.join(path, name) for name in os.listdir(path)
+                                   if name.lower().endswith('.xlsx') and not name.startswith('~$')))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def harvest_packs(paths, workers=None):
+    """
+    harvest_pack() every file across a process pool, yielding HarvestResults
+    in input order. Files go to the workers in chunks, so thousands of
+    small packs cost a few round trips per worker rather than one each.
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count()
+    if workers == 1 or len(paths) < 2:
+        yield from map(harvest_pack, paths)
+        return
+    chunk_size = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(harvest_pack, paths, chunksize=chunk_size)
+
+
+def write_inputs(results, path):
+    """
+    Write harvested inputs as a batch CSV (batch.load_prospects reads it
+    back), plus the source file and any problems; returns the results
+    """
+    results = list(results)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS + ('source', 'problems'))
+        writer.writeheader()
+        for r in results:
+            if r.error is None:
+                writer.writerow({**r.row(), 'source': r.path, 'problems': '; '.join(r.problems)})
+    return results
@@ -0,0 +1,430 @@
+"""
+Declarative sheet layouts and the compiler that turns them into cells
+
+A layout (JSON, or YAML when PyYAML is installed) describes one sheet as a
+list of blocks - text cells, tables and charts - instead of hand-placed
+coordinates. Blocks are positioned absolutely ("at": "A6") or relative to
+an earlier block ("below": "tools", "gap": 2), and cell values refer to
+other cells symbolically:
+
+    {tools.cost}             body range of a table column      -> B7:B13
+    {tools.crm.cost}         one cell (table, row key, column) -> B7
+    {tools.header.cost}      a column's header cell            -> B6
+    {total.amount}           column of a single-row table      -> B14
+    {intro}                  a text block                      -> A2
+    {@monthly}               same row of the current table     -> B34
+
+compile_layout() resolves every reference to an address once and returns a
+CompiledLayout: a flat, picklable list of cells, merges, column widths and
+charts. Values that depend on the prospect are left as parameters - "$name"
+for a whole value or "${name:fmt}" inside text - and are filled in by
+CompiledLayout.render(wb, style, context), so rendering another variant
+never re-parses or re-resolves the layout. load_layout() caches compiled
+layouts per file.
+
+Table cells are styled from parts (see styles.py):
+
+    table "style" + column "style" + row "style" (default table "row_style")
+    + the number format part (column "format", overridden per row by a
+    string or a {column: part} "format"), for non-empty values only.
+
+A row's "cell_style" ({column: parts}) or a table's "value_styles"
+({value: parts}) replaces the row style for individual cells.
+
+A layout's "names" ({name: reference}) become workbook-level defined names
+when it is rendered (see names.py); a name is an input when it points at
+an "input"-styled parameter cell, and is labelled with the text to the
+left of it in its row:
+
+    "names": {"roi_plannetic_cost": "{plannetic_cost.amount}",
+              "roi_net_benefit_annual": "{results.net.annual}"}
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from openpyxl.utils import column_index_from_string, coordinate_to_tuple, get_column_letter, quote_sheetname
+
+from .charts import CHART_TYPES, PER_CHART_OPTIONS, chart_template
+from .names import define_name
+
+LAYOUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'layouts')
+
+REF_RE = re.compile(r'(?<!\$)\{([^{}]+)\}')
+PARAM_RE = re.compile(r'\$\{([^{}:]+)(?::([^{}]*))?\}')
+WHOLE_PARAM_RE = re.compile(r'^\$([A-Za-z_][\w.]*)$')
+ADDRESS_RE = re.compile(r'^[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?$')
+
+
+class LayoutError(ValueError):
+    """A layout that cannot be compiled (bad block, unknown reference, ...)"""
+
+
+@dataclass(frozen=True)
+class Param:
+    """A whole cell value taken from the render context"""
+
+    path: str
+
+    def render(self, context):
+        return _lookup(context, self.path)
+
+
+@dataclass(frozen=True)
+class Template:
+    """Text with ${name} / ${name:fmt} placeholders filled from the render context"""
+
+    text: str
+
+    def render(self, context):
+        return PARAM_RE.sub(lambda m: format(_lookup(context, m.group(1)), m.group(2) or ''), self.text)
+
+
+@dataclass
+class ChartSpec:
+    """A chart with its data and category ranges already resolved"""
+
+    kind: str
+    anchor: str
+    data: str
+    categories: str = None
+    titles_from_data: bool = False
+    options: dict = field(default_factory=dict)
+
+
+@dataclass
+class CompiledLayout:
+    """One sheet's cells, merges, widths and charts at fixed addresses"""
+
+    sheet: str
+    cells: list  # (row, column, value, parts) in row order
+    merges: list
+    widths: dict
+    charts: list
+    anchors: dict  # block id -> (first row, last row)
+    names: dict = field(default_factory=dict)  # defined name -> cell or range
+
+    def render(self, wb, style, context=None, ws=None):
+        """
+        Write the layout into wb and return the worksheet.
+
+        style is a StyleRegistry for wb; context (a mapping or object)
+        supplies the layout's parameters. ws reuses an existing sheet (e.g.
+        wb.active) instead of creating a new one.
+        """
+        if ws is None:
+            ws = wb.create_sheet(self.sheet)
+        else:
+            ws.title = self.sheet
+        for row, column, value, parts in self.cells:
+            if isinstance(value, (Param, Template)):
+                value = value.render(context)
+            cell = ws.cell(row=row, column=column, value=value)
+            if parts:
+                style(cell, *parts)
+        for range_string in self.merges:
+            ws.merge_cells(range_string)
+        for spec in self.charts:
+            ws.add_chart(_build_chart(ws, spec), spec.anchor)
+        for letter, width in self.widths.items():
+            ws.column_dimensions[letter].width = width
+        for name, ref, kind, label in self.defined_names():
+            define_name(wb, name, ws.title, ref, kind, label)
+        return ws
+
+    def input_cells(self, part='input'):
+        """{parameter path: coordinate} of the parameter cells styled with part (the yellow inputs)"""
+        return {value.path: f'{get_column_letter(column)}{row}' for row, column, value, parts in self.cells
+                if isinstance(value, Param) and part in parts}
+
+    def defined_names(self):
+        """(name, ref, kind, label) for each of the layout's names"""
+        inputs = set(self.input_cells().values())
+        texts = {}
+        for row, column, value, _ in self.cells:
+            if isinstance(value, str) and value and not value.startswith('='):
+                texts.setdefault(row, []).append((column, value))
+        described = []
+        for name, ref in self.names.items():
+            row, column = coordinate_to_tuple(ref.split(':')[0])
+            labels = [text for text_column, text in texts.get(row, ()) if text_column < column]
+            described.append((name, ref, 'input' if ref in inputs else 'output', labels[0] if labels else ''))
+        return described
+
+
+def _lookup(context, path):
+    value = context
+    for name in path.split('.'):
+        value = value[name] if isinstance(value, dict) else getattr(value, name)
+    return value
+
+
+def _dedupe(parts):
+    return tuple(dict.fromkeys(parts))
+
+
+def _build_chart(ws, spec):
+    from openpyxl.chart import Reference
+
+    options = dict(spec.options)
+    per_chart = {path: options.pop(path) for path in PER_CHART_OPTIONS if path in options}
+    chart = chart_template(spec.kind, options).new(
+        per_chart.get('title'), per_chart.get('x_axis.title'), per_chart.get('y_axis.title'),
+        per_chart.get('width'), per_chart.get('height'))
+    sheet = quote_sheetname(ws.title)
+    chart.add_data(Reference(range_string=f'{sheet}!{spec.data}'), titles_from_data=spec.titles_from_data)
+    if spec.categories:
+        chart.set_categories(Reference(range_string=f'{sheet}!{spec.categories}'))
+    return chart
+
+
+class _Table:
+    """Compile-time geometry of a placed table"""
+
+    def __init__(self, row, column, keys, row_keys, has_header):
+        self.header_row = row if has_header else None
+        self.first_row = row + 1 if has_header else row
+        self.columns = {key: column + i for i, key in enumerate(keys)}
+        self.rows = {key: self.first_row + i for i, key in enumerate(row_keys) if key is not None}
+        self.last_row = self.first_row + len(row_keys) - 1
+
+    def address(self, parts, current_row=None):
+        if len(parts) == 1:
+            column = self._column(parts[0])
+            if current_row is not None:
+                return f'{column}{current_row}'
+            if self.first_row == self.last_row:
+                return f'{column}{self.first_row}'
+            return f'{column}{self.first_row}:{column}{self.last_row}'
+        if len(parts) == 2:
+            row_key, column_key = parts
+            if row_key == 'header' and self.header_row is not None:
+                return f'{self._column(column_key)}{self.header_row}'
+            if row_key not in self.rows:
+                raise LayoutError(f"unknown row '{row_key}'")
+            return f'{self._column(column_key)}{self.rows[row_key]}'
+        raise LayoutError('expected table.column or table.row.column')
+
+    def _column(self, key):
+        if key not in self.columns:
+            raise LayoutError(f"unknown column '{key}'")
+        return get_column_letter(self.columns[key])
+
+
+class _Compiler:
+    def __init__(self, spec):
+        self.spec = spec
+        self.blocks = {}  # id -> _Table or (row, column) of a text block
+        self.extents = {}  # id -> (first row, last row, column)
+        self.cells = []
+        self.merges = []
+        self.charts = []
+        self.last = None
+
+    def compile(self):
+        for index, block in enumerate(self.spec.get('blocks', [])):
+            kind = block.get('type')
+            try:
+                if kind == 'text':
+                    self._text(block)
+                elif kind == 'table':
+                    self._table(block)
+                elif kind == 'chart':
+                    self._chart(block)
+                else:
+                    raise LayoutError(f"unknown block type '{kind}'")
+            except LayoutError as exc:
+                raise LayoutError(f"{self.spec.get('sheet')} block {block.get('id', index)}: {exc}") from None
+        self.cells.sort(key=lambda c: (c[0], c[1]))
+        names = {}
+        for name, ref in self.spec.get('names', {}).items():
+            try:
+                names[name] = self._resolve(ref)
+            except LayoutError as exc:
+                raise LayoutError(f"{self.spec.get('sheet')} name {name}: {exc}") from None
+            if not ADDRESS_RE.match(names[name]):
+                raise LayoutError(f"{self.spec.get('sheet')} name {name}: {ref} is not one cell or range")
+        return CompiledLayout(
+            sheet=self.spec['sheet'],
+            cells=self.cells,
+            merges=self.merges,
+            widths=dict(self.spec.get('column_widths', {})),
+            charts=self.charts,
+            anchors={key: (first, last) for key, (first, last, _) in self.extents.items()},
+            names=names,
+        )
+
+    def _place(self, block):
+        """(row, column) of a block's top-left cell"""
+        if 'at' in block:
+            return coordinate_to_tuple(block['at'])
+        below = block.get('below', self.last)
+        if below is None:
+            raise LayoutError("needs 'at' or 'below'")
+        if below not in self.extents:
+            raise LayoutError(f"unknown block '{below}'")
+        _, last_row, column = self.extents[below]
+        if 'column' in block:
+            column = column_index_from_string(block['column'])
+        return last_row + 1 + block.get('gap', 0), column
+
+    def _record(self, block, first_row, last_row, column):
+        key = block.get('id', f'_{len(self.extents)}')
+        if key in self.extents:
+            raise LayoutError(f"duplicate block id '{key}'")
+        self.extents[key] = (first_row, last_row, column)
+        self.last = key
+        return key
+
+    def _resolve(self, text, table=None, current_row=None):
+        def address(match):
+            ref = match.group(1)
+            if ref.startswith('@'):
+                if table is None:
+                    raise LayoutError(f"'{{{ref}}}' used outside a table")
+                return table.address([ref[1:]], current_row)
+            name, *rest = ref.split('.')
+            target = self.blocks.get(name)
+            if target is None:
+                raise LayoutError(f"unknown reference '{{{ref}}}'")
+            if isinstance(target, _Table):
+                try:
+                    return target.address(rest)
+                except LayoutError as exc:
+                    raise LayoutError(f"'{{{ref}}}': {exc}") from None
+            if rest:
+                raise LayoutError(f"'{{{ref}}}': text blocks have no columns")
+            return f'{get_column_letter(target[1])}{target[0]}'
+
+        return REF_RE.sub(address, text)
+
+    def _value(self, value, table=None, current_row=None):
+        """Resolve references now and turn parameters into Param/Template"""
+        if not isinstance(value, str):
+            return value
+        match = WHOLE_PARAM_RE.match(value)
+        if match:
+            return Param(match.group(1))
+        value = self._resolve(value, table, current_row)
+        return Template(value) if PARAM_RE.search(value) else value
+
+    def _text(self, block):
+        row, column = self._place(block)
+        key = self._record(block, row, row, column)
+        self.blocks[key] = (row, column)
+        self.cells.append((row, column, self._value(block.get('value')), _dedupe(block.get('style', ()))))
+        if 'merge_to' in block:
+            self.merges.append(f"{get_column_letter(column)}{row}:{block['merge_to']}{row}")
+
+    def _table(self, block):
+        columns = block['columns']
+        keys = [c['key'] for c in columns]
+        rows = block.get('rows', [])
+        has_header = any('header' in c for c in columns)
+        row, column = self._place(block)
+        table = _Table(row, column, keys, [r.get('key') for r in rows], has_header)
+        key = self._record(block, row, table.last_row, column)
+        # Registered before the cells so rows can refer to each other
+        self.blocks[key] = table
+
+        if has_header:
+            header_style = _dedupe(block.get('header_style', ()))
+            for i, c in enumerate(columns):
+                if 'header' in c:
+                    self.cells.append((row, column + i, c['header'], header_style))
+
+        table_style = block.get('style', [])
+        value_styles = block.get('value_styles', {})
+        for offset, spec in enumerate(rows):
+            current_row = table.first_row + offset
+            values = spec.get('values', [])
+            if len(values) > len(columns):
+                raise LayoutError(f"row {spec.get('key', offset)} has more values than columns")
+            row_style = spec.get('style', block.get('row_style', []))
+            row_format = spec.get('format', ...)
+            cell_styles = spec.get('cell_style', {})
+            for i, raw in enumerate(values):
+                c = columns[i]
+                if c['key'] in cell_styles:
+                    extra = cell_styles[c['key']]
+                elif isinstance(raw, str) and raw in value_styles:
+                    extra = value_styles[raw]
+                else:
+                    extra = row_style
+                parts = [*table_style, *c.get('style', ()), *extra]
+                number_format = _number_format(row_format, c)
+                if number_format and raw not in ('', None):
+                    parts.append(number_format)
+                value = self._value(raw, table, current_row)
+                self.cells.append((current_row, column + i, value, _dedupe(parts)))
+
+    def _chart(self, block):
+        if block.get('kind') not in CHART_TYPES:
+            raise LayoutError(f"unknown chart kind '{block.get('kind')}'")
+        row, column = self._place(block)
+        self._record(block, row, row, column)
+        categories = block.get('categories')
+        self.charts.append(ChartSpec(
+            kind=block['kind'],
+            anchor=f'{get_column_letter(column)}{row}',
+            data=self._resolve(block['data']),
+            categories=self._resolve(categories) if categories else None,
+            titles_from_data=block.get('titles_from_data', False),
+            options=dict(block.get('options', {})),
+        ))
+
+
+def _number_format(row_format, column):
+    if row_format is ...:
+        return column.get('format')
+    if isinstance(row_format, dict):
+        return row_format.get(column['key'], column.get('format'))
+    # A plain string (or null) applies to the columns that carry a format
+    return row_format if 'format' in column else None
+
+
+def compile_layout(spec):
+    """Compile a layout spec (already-parsed dict) into a CompiledLayout"""
+    if 'sheet' not in spec:
+        raise LayoutError("layout has no 'sheet' title")
+    return _Compiler(spec).compile()
+
+
+def read_layout(path):
+    """Parse a .json or .yaml/.yml layout file into a spec dict"""
+    with open(path, encoding='utf-8') as f:
+        if path.lower().endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise LayoutError(f'{path}: YAML layouts need PyYAML (pip install pyyaml)') from None
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+@lru_cache(maxsize=64)
+def _load_compiled(path, mtime_ns):
+    return compile_layout(read_layout(path))
+
+
+def load_layout(name):
+    """
+    Compiled layout by file path or by name in LAYOUT_DIR (e.g. 'roi_calculator').
+
+    Results are cached per file and modification time, so repeated renders
+    (and edits to the file between them) cost one compile each.
+    """
+    path = name
+    if not os.path.exists(path):
+        for suffix in ('.json', '.yaml', '.yml'):
+            candidate = os.path.join(LAYOUT_DIR, name + suffix)
+            if os.path.exists(candidate):
+                path = candidate
+                break
+        else:
+            raise LayoutError(f"no layout '{name}' in {LAYOUT_DIR}")
+    path = os.path.abspath(path)
+    return _load_compiled(path, os.stat(path).st_mtime_ns)
@@ -0,0 +1,202 @@
+"""
+Customer-mix revenue model behind the Revenue Calculator's mix tables
+
+The Revenue Calculator's TCV columns price every firm on one tier. A real
+book is a mix: some firms on the £350 Monthly tier, most on Standard or
+Professional, a few on custom Enterprise deals, and each tier has its own
+commitment length and churn. mix_revenue() takes one or many mix vectors
+(share of firms per tier) and returns blended MRR and contract value for
+every firm count at once:
+
+    per-firm blended MRR    = mix . rates
+    committed TCV per firm  = mix . (rates * term)     (Monthly: one month)
+    expected value per firm = mix . (rates * expected paid months over the horizon)
+
+Expected paid months come from each tier's ContractPlan survival curve
+(cohorts.py): contract tiers renew or leave at each term end, the Monthly
+tier churns every month. Everything is a dot product per mix and an outer
+product with the firm counts, so sweeping hundreds of mixes over firm
+counts up to 100,000 is a few NumPy calls:
+
+    sweep = vary_share('professional', np.linspace(0, 1, 101))
+    model = mix_revenue(sweep, firm_counts=np.arange(1, 100_001))
+    model.mrr                       # (firm counts, mixes)
+    model.firms_needed(1_000_000)   # firms to reach £1m expected value, per mix
+
+Prices and commitment lengths come from tiers.py (the Tier Comparison
+layout's "Minimum Commitment" row); the Monthly tier is month to month.
+Enterprise deals are custom-priced, so their rate is an estimate.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .cohorts import DEFAULT_PLANS, ContractPlan
+from .growth import DEFAULT_ANNUAL_CHURN
+from .revenue import DEFAULT_FIRM_COUNTS
+from .tiers import TIER_PRICES, tier_terms
+
+# Enterprise deals are custom; the mix tables price them at this estimate
+ENTERPRISE_MONTHLY_RATE = 500
+
+# Tier key -> (name, monthly rate), in table order
+MIX_TIERS = {
+    'monthly': ('Monthly', TIER_PRICES['monthly']),
+    'standard': ('Standard', TIER_PRICES['standard']),
+    'professional': ('Professional', TIER_PRICES['professional']),
+    'enterprise': ('Enterprise', ENTERPRISE_MONTHLY_RATE),
+}
+# Annual churn per tier; the Monthly tier's is its monthly churn compounded
+TIER_CHURN = {
+    'monthly': 1 - (1 - DEFAULT_PLANS['monthly'].monthly_churn) ** 12,
+    'standard': DEFAULT_ANNUAL_CHURN,
+    'professional': DEFAULT_ANNUAL_CHURN,
+    'enterprise': DEFAULT_ANNUAL_CHURN,
+}
+# Share of firms on each tier
+DEFAULT_TIER_MIX = {'monthly': 0.2, 'standard': 0.4, 'professional': 0.3, 'enterprise': 0.1}
+# Months of contract value counted by MixRevenue.tcv (the sheet's 3-year TCV)
+DEFAULT_HORIZON = 36
+
+def tier_plans(rates=None, churn=None):
+    """
+    {tier: ContractPlan} for the mix tiers. rates and churn ({tier: value})
+    override MIX_TIERS' rates and TIER_CHURN's annual churn; contract tiers
+    renew at (1 - churn) over each term, the Monthly tier loses the monthly
+    equivalent every month.
+    """
+    rates = {**{key: rate for key, (_, rate) in MIX_TIERS.items()}, **(rates or {})}
+    churn = {**TIER_CHURN, **(churn or {})}
+    unknown = (set(rates) | set(churn)) - set(MIX_TIERS)
+    if unknown:
+        raise ValueError(f'Unknown tiers: {sorted(unknown)}')
+    terms = tier_terms()
+    plans = {}
+    for key, (name, _) in MIX_TIERS.items():
+        term = terms.get(key, 0)
+        if term:
+            plans[key] = ContractPlan(name, rates[key], term, renewal_rate=(1 - churn[key]) ** (term / 12))
+        else:
+            plans[key] = ContractPlan(name, rates[key], monthly_churn=1 - (1 - churn[key]) ** (1 / 12))
+    return plans
+
+
+def mix_shares(mixes, plans):
+    """(mixes, plans) shares summing to 1 per row from a {tier: share} dict, a list of them, or an array"""
+    if isinstance(mixes, dict):
+        mixes = [mixes]
+    if len(mixes) and isinstance(mixes[0], dict):
+        unknown = set().union(*mixes) - set(plans)
+        if unknown:
+            raise ValueError(f'Unknown tiers in mix: {sorted(unknown)}')
+        mixes = [[mix.get(key, 0.0) for key in plans] for mix in mixes]
+    shares = np.atleast_2d(np.asarray(mixes, dtype=np.float64))
+    if shares.ndim != 2 or shares.shape[1] != len(plans):
+        raise ValueError(f'mixes must have one share per tier ({len(plans)}), got shape {shares.shape}')
+    totals = shares.sum(axis=1, keepdims=True)
+    if (shares < 0).any() or (totals <= 0).any():
+        raise ValueError('every mix needs non-negative shares and at least one positive share')
+    return shares / totals
+
+
+def vary_share(tier, shares, base=None, plans=None):
+    """
+    (len(shares), plans) mixes giving tier each of shares, the other tiers
+    splitting the rest in base's proportions (default DEFAULT_TIER_MIX)
+    """
+    plans = tier_plans() if plans is None else plans
+    keys = list(plans)
+    if tier not in keys:
+        raise ValueError(f"Unknown tier '{tier}'")
+    shares = np.asarray(shares, dtype=np.float64)
+    if shares.ndim != 1 or (shares < 0).any() or (shares > 1).any():
+        raise ValueError('shares must be a 1-D array of values between 0 and 1')
+    index = keys.index(tier)
+    rest = mix_shares(DEFAULT_TIER_MIX if base is None else base, plans)[0]
+    rest[index] = 0.0
+    if rest.sum() <= 0:
+        raise ValueError(f"base mix has no tiers other than '{tier}' to share the rest")
+    target = np.zeros(len(keys))
+    target[index] = 1.0
+    return np.outer(1 - shares, rest / rest.sum()) + np.outer(shares, target)
+
+
+@dataclass
+class MixRevenue:
+    """Blended MRR and contract value for every firm count x tier mix"""
+
+    plans: dict               # tier -> ContractPlan, in column order
+    shares: np.ndarray        # (mixes, plans), rows summing to 1
+    firm_counts: np.ndarray   # (firms,)
+    horizon: int              # months of value counted by tcv
+    paid_months: np.ndarray   # (plans,) expected months a firm pays within the horizon
+
+    @property
+    def shape(self):
+        return (len(self.firm_counts), len(self.shares))
+
+    @property
+    def rates(self):
+        return np.array([plan.monthly_rate for plan in self.plans.values()], dtype=np.float64)
+
+    @property
+    def terms(self):
+        return np.array([plan.term_months for plan in self.plans.values()])
+
+    @property
+    def per_firm_mrr(self):
+        """(mixes,) blended monthly rate of one firm"""
+        return self.shares @ self.rates
+
+    @property
+    def per_firm_committed(self):
+        """(mixes,) contract value one firm commits to on signing; rolling tiers commit one month"""
+        return self.shares @ (self.rates * np.maximum(self.terms, 1))
+
+    @property
+    def per_firm_value(self):
+        """(mixes,) expected value of one firm over the horizon, after churn and renewals"""
+        return self.shares @ (self.rates * self.paid_months)
+
+    @property
+    def mrr(self):
+        """(firms, mixes) MRR of the whole book at signing"""
+        return np.multiply.outer(self.firm_counts, self.per_firm_mrr)
+
+    @property
+    def committed_tcv(self):
+        """(firms, mixes) contract value committed on signing"""
+        return np.multiply.outer(self.firm_counts, self.per_firm_committed)
+
+    @property
+    def tcv(self):
+        """(firms, mixes) expected contract value over the horizon"""
+        return np.multiply.outer(self.firm_counts, self.per_firm_value)
+
+    def firms_needed(self, target_tcv):
+        """
+        (mixes,) smallest firm count whose expected value over the horizon
+        reaches target_tcv; inf where a firm on that mix is worth nothing
+        """
+        value = self.per_firm_value
+        with np.errstate(divide='ignore', invalid='ignore'):
+            needed = np.ceil(target_tcv / value)
+        return np.where(value > 0, needed, np.where(target_tcv <= 0, 0, np.inf))
+
+
+def mix_revenue(mixes=None, firm_counts=DEFAULT_FIRM_COUNTS, plans=None, horizon=DEFAULT_HORIZON):
+    """
+    Build a MixRevenue. mixes is a {tier: share} dict, a list of them or a
+    (mixes, tiers) array (default DEFAULT_TIER_MIX); shares are normalised
+    to sum to 1. plans defaults to tier_plans().
+    """
+    plans = tier_plans() if plans is None else dict(plans)
+    shares = mix_shares(DEFAULT_TIER_MIX if mixes is None else mixes, plans)
+    firm_counts = np.asarray(firm_counts, dtype=np.float64)
+    if firm_counts.ndim != 1:
+        raise ValueError('firm_counts must be 1-D')
+    if horizon < 1:
+        raise ValueError('horizon must be at least one month')
+    paid_months = np.array([plan.survival(horizon).sum() for plan in plans.values()])
+    return MixRevenue(plans, shares, firm_counts, horizon, paid_months)
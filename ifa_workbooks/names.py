@@ -0,0 +1,162 @@
+"""
+Workbook-level defined names for a pack's inputs and key outputs
+
+Without names, anything reading a pack has to know that the Standard rate
+is Revenue Calculator!B5 or scan column A for "Plannetic Monthly Cost".
+The generators instead register a defined name for every input and key
+output (roi_plannetic_cost, roi_net_benefit_annual, growth_moderate_arr,
+...), so readers jump straight to the cell, Excel users can pick them from
+the Name Box, and references survive rows being inserted above them.
+
+Each name's comment records whether it is an input or an output and the
+row's label ("Input: Plannetic Monthly Cost"), so the workbook alone is a
+complete index. read_names() gets it back from xl/workbook.xml without
+loading any sheet, and write_name_index() exports the same index as a
+JSON sidecar for consumers that never open the .xlsx:
+
+    define_name(wb, 'roi_plannetic_cost', 'ROI Calculator', 'B28', 'input', 'Plannetic Monthly Cost')
+    wb.save('pack.xlsx')
+    names = read_names('pack.xlsx')
+    names['roi_plannetic_cost'].cell          # ('ROI Calculator', 'B28')
+    export_name_index('pack.xlsx')            # pack.names.json
+
+Layouts declare their names in the layout file (see layout.py); the hand-
+written sheets call define_name() directly.
+"""
+
+import json
+import os
+import re
+import zipfile
+from dataclasses import dataclass
+from xml.etree import ElementTree
+
+from openpyxl.utils import quote_sheetname
+from openpyxl.workbook.defined_name import DefinedName
+
+from .xlsx_parts import MAIN_NS
+
+NAME_KINDS = ('input', 'output')
+INDEX_VERSION = 1
+
+NAME_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_.]*$')
+# Names Excel would read as a cell reference (A1 or R1C1 style)
+CELL_LIKE_RE = re.compile(r'^(?:[A-Za-z]{1,3}[0-9]+|[Rr][0-9]*[Cc][0-9]*|[RrCc])$')
+REF_RE = re.compile(r"^(?:'((?:[^']|'')+)'|([^!]+))!(\$?[A-Z]+\$?[0-9]+(?::\$?[A-Z]+\$?[0-9]+)?)$")
+COMMENT_RE = re.compile(r'^(Input|Output)(?:: (.*))?$', re.S)
+
+
+@dataclass(frozen=True)
+class CellName:
+    """One defined name: the cell or range it points at and what it holds"""
+
+    name: str
+    sheet: str
+    ref: str            # 'B28' or 'B7:B13', without $ signs
+    kind: str = 'output'
+    label: str = ''
+
+    @property
+    def cell(self):
+        """(sheet, coordinate) of a single-cell name; the top-left cell of a range"""
+        return self.sheet, self.ref.split(':')[0]
+
+    @property
+    def is_range(self):
+        return ':' in self.ref
+
+    @property
+    def formula(self):
+        """The name's definition as written in workbook.xml"""
+        absolute = ':'.join(re.sub(r'([A-Z]+)([0-9]+)', r'$\1$\2', part) for part in self.ref.split(':'))
+        return f'{quote_sheetname(self.sheet)}!{absolute}'
+
+    @property
+    def comment(self):
+        return f'{self.kind.title()}: {self.label}' if self.label else self.kind.title()
+
+
+def parse_name(name, formula, comment=None):
+    """A CellName from a definedName's text and comment; None for names that are not a plain cell or range"""
+    match = REF_RE.match((formula or '').strip())
+    if match is None:
+        return None
+    sheet = match.group(1).replace("''", "'") if match.group(1) else match.group(2)
+    kind, label = 'output', ''
+    described = COMMENT_RE.match(comment or '')
+    if described:
+        kind, label = described.group(1).lower(), described.group(2) or ''
+    return CellName(name, sheet, match.group(3).replace('$', ''), kind, label)
+
+
+def define_name(wb, name, sheet, ref, kind='output', label=''):
+    """Register a workbook-level name for sheet!ref (a cell or range) and return its CellName"""
+    if not NAME_RE.match(name) or CELL_LIKE_RE.match(name):
+        raise ValueError(f"'{name}' is not a valid Excel name")
+    if kind not in NAME_KINDS:
+        raise ValueError(f"Unknown name kind '{kind}' - use one of {NAME_KINDS}")
+    if name in wb.defined_names:
+        raise ValueError(f"'{name}' is already defined")
+    cell_name = CellName(name, sheet, ref.replace('$', ''), kind, label)
+    wb.defined_names[name] = DefinedName(name, attr_text=cell_name.formula, comment=cell_name.comment)
+    return cell_name
+
+
+def workbook_names(wb):
+    """{name: CellName} for the cell and range names of an in-memory workbook"""
+    names = {}
+    for name, defined in wb.defined_names.items():
+        cell_name = parse_name(name, defined.attr_text, defined.comment)
+        if cell_name is not None:
+            names[name] = cell_name
+    return names
+
+
+def read_names(source):
+    """{name: CellName} from a saved .xlsx (path or open ZipFile), reading only xl/workbook.xml"""
+    if not isinstance(source, zipfile.ZipFile):
+        with zipfile.ZipFile(source) as zf:
+            return read_names(zf)
+    names = {}
+    root = ElementTree.fromstring(source.read('xl/workbook.xml'))
+    for defined in root.iter(f'{{{MAIN_NS}}}definedName'):
+        if defined.get('localSheetId') is not None:
+            continue
+        cell_name = parse_name(defined.get('name'), defined.text, defined.get('comment'))
+        if cell_name is not None:
+            names[cell_name.name] = cell_name
+    return names
+
+
+def name_index_path(workbook_path):
+    """The sidecar beside a workbook: pack.xlsx -> pack.names.json"""
+    return f'{os.path.splitext(workbook_path)[0]}.names.json'
+
+
+def write_name_index(names, path):
+    """Write {name: CellName} as the JSON sidecar index"""
+    index = {
+        'version': INDEX_VERSION,
+        'names': {name: {'sheet': n.sheet, 'ref': n.ref, 'kind': n.kind, 'label': n.label}
+                  for name, n in sorted(names.items())},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1, ensure_ascii=False)
+        f.write('\n')
+
+
+def export_name_index(workbook_path):
+    """Write the sidecar index of a saved workbook's own names beside it; returns the sidecar's path"""
+    path = name_index_path(workbook_path)
+    write_name_index(read_names(workbook_path), path)
+    return path
+
+
+def read_name_index(path):
+    """{name: CellName} from a JSON sidecar index"""
+    with open(path, encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get('version') != INDEX_VERSION:
+        raise ValueError(f"{path}: unsupported name index version {index.get('version')!r}")
+    return {name: CellName(name, entry['sheet'], entry['ref'], entry.get('kind', 'output'), entry.get('label', ''))
+            for name, entry in index['names'].items()}
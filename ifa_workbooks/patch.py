@@ -0,0 +1,181 @@
+"""
+Incremental patching of saved workbooks
+
+When one input changes (a competitor's price, a prospect's tool cost),
+rebuilding the whole pack re-runs the simulation, lays out every sheet
+again and re-serialises every part. patch_workbook() edits the saved .xlsx
+at the XML level instead:
+
+    1. every cell is read with FormulaEngine.from_parts, keeping the
+       cached results already in the file
+    2. the changed inputs are set and only their dependents re-evaluated
+    3. the input cells and every downstream cell whose value changed are
+       rewritten, in the worksheet parts that hold them
+    4. chart caches (<c:numCache>/<c:strCache>) whose series range covers
+       a changed cell are refreshed
+
+Every other part is copied byte for byte.
+
+    patch_workbook('pack.xlsx', {'Competitor Pricing': {'Voyant AdviserGo': 180}})
+
+A cell is addressed by coordinate ('B8'), by a defined name on that sheet
+('roi_plannetic_cost', see names.py), or by the label in column A of its
+row, in which case the value column (B) of that row is set. Charts written
+by openpyxl carry no caches, so step 4 only applies to files saved by Excel.
+"""
+
+import re
+import time
+import zipfile
+from collections import defaultdict
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape
+
+from .formulas import FormulaEngine, FormulaError, expand_range, normalize, split_coordinate
+from .xlsx_parts import format_number, replace_parts, set_cell_values, sheet_parts
+
+CHART_PART_RE = re.compile(r'xl/charts/chart\d+\.xml$')
+# <c:f>range</c:f> followed by the cache of the points it held when saved
+CHART_SERIES_RE = re.compile(
+    rb'(<(?:c:)?f>)(.*?)(</(?:c:)?f>\s*<((?:c:)?)(num|str)Cache>)(.*?)(</(?:c:)?(?:num|str)Cache>)', re.S)
+CHART_POINT_RE = re.compile(rb'<(?:c:)?pt\b.*?</(?:c:)?pt>', re.S)
+CHART_COUNT_RE = re.compile(rb'(<(?:c:)?ptCount val=")\d+(")')
+RANGE_RE = re.compile(r"^(?:'((?:[^']|'')+)'|([^!]+))!(\$?[A-Z]+\$?\d+)(?::(\$?[A-Z]+\$?\d+))?$")
+
+
+@dataclass
+class PatchResult:
+    """What patch_workbook() changed"""
+
+    cells: dict                    # sheet -> {coord: value} written, inputs included
+    parts: list                    # zip entries rewritten
+    seconds: float
+    charts: list = field(default_factory=list)  # chart parts whose caches were refreshed
+
+    @property
+    def cell_count(self):
+        return sum(len(cells) for cells in self.cells.values())
+
+
+def resolve_cell(engine, sheet, target, label_column='A', value_column='B'):
+    """Coordinate for target: a coordinate as-is, a defined name's cell, else the row labelled target"""
+    try:
+        return normalize(target)
+    except FormulaError:
+        pass
+    cell_name = engine.cell_names.get(target)
+    if cell_name is not None:
+        if cell_name.sheet != sheet or cell_name.is_range:
+            raise ValueError(f'{target!r} refers to {cell_name.formula}, not a cell on {sheet!r}')
+        return cell_name.ref
+    rows = [split_coordinate(coord)[1] for coord, value in engine.values(sheet).items()
+            if value == target and split_coordinate(coord)[0] == label_column]
+    if not rows:
+        raise ValueError(f'{sheet!r} has no row labelled {target!r} in column {label_column}')
+    if len(rows) > 1:
+        raise ValueError(f'{sheet!r} has {len(rows)} rows labelled {target!r}; use a coordinate')
+    return f'{value_column}{rows[0]}'
+
+
+def _series_range(ref):
+    """'Sheet'!$B$5:$B$9 -> (sheet, [coords]), or None for other references"""
+    match = RANGE_RE.match(ref.strip())
+    if match is None:
+        return None
+    sheet = match.group(1).replace("''", "'") if match.group(1) else match.group(2)
+    start, end = match.group(3), match.group(4) or match.group(3)
+    return sheet, expand_range(start, end)
+
+
+def _chart_point(prefix, index, value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        text = escape('' if value is None else str(value))
+    else:
+        text = format_number(value)
+    return f'<{prefix}pt idx="{index}"><{prefix}v>{text}</{prefix}v></{prefix}pt>'.encode()
+
+
+def refresh_chart_caches(xml, engine, changed):
+    """
+    Rewrite the cached points of every series whose range holds a changed
+    cell. Returns the new XML, or None when no series was affected.
+    """
+    touched = False
+
+    def replace(match):
+        nonlocal touched
+        series = _series_range(match.group(2).decode('utf-8'))
+        if series is None:
+            return match.group(0)
+        sheet, coords = series
+        if not any((sheet, coord) in changed for coord in coords):
+            return match.group(0)
+        touched = True
+        prefix = match.group(4).decode()
+        values = [engine.value(sheet, coord) for coord in coords]
+        points = b''.join(_chart_point(prefix, i, v) for i, v in enumerate(values) if v is not None)
+        body = CHART_POINT_RE.sub(b'', match.group(6))
+        body = CHART_COUNT_RE.sub(lambda m: m.group(1) + str(len(coords)).encode() + m.group(2), body)
+        return match.group(1) + match.group(2) + match.group(3) + body + points + match.group(7)
+
+    new_xml = CHART_SERIES_RE.sub(replace, xml)
+    return new_xml if touched else None
+
+
+def patch_workbook(path, changes, dest_path=None, engine=None):
+    """
+    Apply input changes to a saved workbook without rebuilding it.
+
+    changes maps sheet -> {coordinate, defined name or row label: value}. Targets must be
+    existing input cells; a formula cell raises ValueError. engine may be a
+    FormulaEngine already loaded from path (it is updated in place), which
+    saves re-reading the file when patching it repeatedly. Writes to
+    dest_path (default: in place, atomically).
+    """
+    start = time.perf_counter()
+    if engine is None:
+        engine = FormulaEngine.from_parts(path)
+    engine.recalculate()  # formulas saved without a cached result
+
+    with zipfile.ZipFile(path) as zf:
+        parts = sheet_parts(zf)
+        inputs = defaultdict(dict)
+        for sheet, values in changes.items():
+            if sheet not in parts:
+                raise ValueError(f'No sheet named {sheet!r} in {path}')
+            for target, value in values.items():
+                coord = resolve_cell(engine, sheet, target)
+                if engine.formula(sheet, coord) is not None:
+                    raise ValueError(f'{sheet}!{coord} holds a formula, not an input')
+                inputs[sheet][coord] = value
+
+        for sheet, values in inputs.items():
+            engine.update(sheet, values)
+        changed = engine.recalculate()
+
+        written = defaultdict(dict)
+        for sheet, values in inputs.items():
+            written[sheet].update(values)
+        for sheet, coord in changed:
+            written[sheet][coord] = engine.value(sheet, coord)
+
+        replacements = {}
+        for sheet, values in written.items():
+            part = parts[sheet]
+            replacements[part], missing = set_cell_values(zf.read(part), values)
+            missing_inputs = sorted(missing & set(inputs.get(sheet, ())))
+            if missing_inputs:
+                raise ValueError(f"{sheet}!{', '.join(missing_inputs)} not found in the saved sheet")
+
+        changed_cells = changed | {(sheet, coord) for sheet, values in inputs.items() for coord in values}
+        charts = []
+        for name in zf.namelist():
+            if CHART_PART_RE.match(name):
+                xml = refresh_chart_caches(zf.read(name), engine, changed_cells)
+                if xml is not None:
+                    replacements[name] = xml
+                    charts.append(name)
+
+    replace_parts(path, replacements, dest_path)
+    return PatchResult(cells=dict(written), parts=sorted(replacements), seconds=time.perf_counter() - start,
+                       charts=charts)
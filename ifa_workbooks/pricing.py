@@ -0,0 +1,891 @@
+"""
+Plannetic Pricing Analysis v3 - workbook builder
+
+Builds the six-sheet pricing pack (Summary, Competitor Pricing, Revenue
+Calculator, Growth Projections, ROI Calculator, Tier Comparison). The ROI
+Calculator inputs come from ProspectParams so one pack can be personalised
+per prospect firm, including its price-sensitivity heatmap (see roi.py);
+every other sheet is the same for all prospects.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+from openpyxl import Workbook
+from openpyxl.chart import AreaChart, LineChart, Reference
+from openpyxl.formatting.rule import ColorScaleRule
+from openpyxl.utils import absolute_coordinate, coordinate_to_tuple, get_column_letter
+
+from .charts import MONEY_COLUMNS, MONEY_COLUMNS_NO_LEGEND, MONEY_LINES, PERCENT_PIE
+from .direct import DirectColumn, DirectTable, DirectWorkbook
+from .growth import DEFAULT_ANNUAL_CHURN, DEFAULT_MONTHLY_RATE, GROWTH_SCENARIOS
+from .layout import load_layout
+from .mix import (DEFAULT_HORIZON, DEFAULT_TIER_MIX, ENTERPRISE_MONTHLY_RATE, TIER_CHURN, mix_revenue, tier_plans,
+                  vary_share)
+from .names import define_name
+from .revenue import DEFAULT_FIRM_COUNTS, revenue_grid
+from .streaming import StreamingWorkbook
+from .styles import PLANNETIC_STYLES, StyleRegistry
+from .tiers import TIER_PRICES
+
+# (key, label, default monthly cost, note) for the ROI Calculator tool stack
+TOOL_STACK = [
+    ('crm', 'CRM (generic)', 50, 'Salesforce/HubSpot equivalent'),
+    ('risk_profiling', 'Risk Profiling Tool', 50, 'Dynamic Planner element'),
+    ('cash_flow', 'Cash Flow (Voyant)', 175, 'Verified Dec 2025'),
+    ('monte_carlo', 'Monte Carlo (Timeline)', 162, 'Verified Dec 2025 (£135+VAT)'),
+    ('document_generation', 'Document Generation', 50, 'Word templates/Templafy'),
+    ('e_signatures', 'E-Signatures', 23, 'DocuSign/Adobe Sign'),
+    ('compliance_tracking', 'Compliance Tracking', 50, 'Manual/specialist tool'),
+]
+
+# [software, monthly price, price type, what they offer, source] on the Competitor Pricing sheet
+COMPETITORS = [
+    ['Intelliflo Office', 132, 'Per user', 'Back office + cashflow', 'TrustRadius'],
+    ['Voyant AdviserGo', 175, 'Flat fee', 'Cash flow planning', 'voyant.com'],
+    ['Timeline', 162, 'Flat (+VAT)', 'Monte Carlo simulations', 'timeline.co'],
+    ['FE CashCalc', 90, 'Per adviser (+VAT)', 'Cash flow modelling', 'advisoryai.com'],
+    ['Dynamic Planner', 200, 'Estimated', 'Risk profiling + reports', 'Contact required'],
+    ['Plannetic Standard', 250, 'Flat fee', 'ALL-IN-ONE PLATFORM', 'Your price'],
+]
+
+# (tier, label, rate) Revenue Calculator inputs; the TCV table covers the first two rates over both terms
+RATE_INPUTS = [
+    ('standard', 'Standard Monthly Rate (£)', TIER_PRICES['standard']),
+    ('professional', 'Professional Monthly Rate (£)', TIER_PRICES['professional']),
+    ('monthly', 'Monthly Rate (no commitment) (£)', TIER_PRICES['monthly']),
+    ('enterprise', 'Enterprise Rate (custom, est.) (£)', ENTERPRISE_MONTHLY_RATE),
+]
+REVENUE_RATES = [rate for _, _, rate in RATE_INPUTS[:2]]
+REVENUE_TERMS = (24, 36)
+
+# ROI Calculator price-sensitivity heatmap: Plannetic prices (rows) x new clients per month
+ROI_HEATMAP_PRICES = tuple(range(150, 501, 25))
+ROI_HEATMAP_CLIENTS = tuple(range(1, 13))
+
+# Revenue Calculator mix sensitivity: this tier's share of firms (rows) x firm counts
+MIX_SWEEP_TIER = 'professional'
+MIX_SWEEP_SHARES = tuple(i / 10 for i in range(11))
+MIX_FIRM_COUNTS = (10, 25, 50, 100, 250)
+
+
+@dataclass
+class ProspectParams:
+    """ROI Calculator inputs for one prospect firm"""
+
+    firm_name: str = ''
+    tool_costs: dict = field(default_factory=lambda: {key: cost for key, _, cost, _ in TOOL_STACK})
+    hours_per_client: float = 15
+    time_saved_pct: float = 0.6
+    hourly_rate: float = 100
+    clients_per_month: float = 4
+    tier: str = 'standard'
+    plannetic_cost: float = None
+
+    def __post_init__(self):
+        if self.tier not in TIER_PRICES and self.plannetic_cost is None:
+            raise ValueError(f"Unknown tier '{self.tier}' - use one of {sorted(TIER_PRICES)} "
+                             "or give an explicit plannetic_cost")
+        unknown = set(self.tool_costs) - {key for key, _, _, _ in TOOL_STACK}
+        if unknown:
+            raise ValueError(f"Unknown tool cost keys: {sorted(unknown)}")
+        if self.plannetic_cost is None:
+            self.plannetic_cost = TIER_PRICES[self.tier]
+
+
+def build_pricing_workbook(params=None, streaming=False, firm_counts=DEFAULT_FIRM_COUNTS, growth_bands=None,
+                           direct=False, cohorts=None, mix=None):
+    """
+    Build the v3 pricing workbook and return it unsaved.
+
+    streaming=True uses StreamingWorkbook (sheets written row by row);
+    otherwise a normal in-memory Workbook is returned. firm_counts sets the
+    rows of the Revenue Calculator table; growth_bands (from
+    growth.simulate_growth) adds the Monte Carlo fan chart and cohorts (from
+    cohorts.cohort_revenue) the monthly cohort summary. mix ({tier: share},
+    default mix.DEFAULT_TIER_MIX) is the Revenue Calculator's customer mix.
+    direct=True writes the Revenue Calculator and fan chart tables as raw
+    XML rows on save (see direct.py) instead of as cells.
+    """
+    params = params or ProspectParams()
+    if streaming:
+        wb = StreamingWorkbook()
+    else:
+        wb = DirectWorkbook() if direct else Workbook()
+    style = StyleRegistry(wb, PLANNETIC_STYLES, 'Plannetic')
+    _build_summary(wb, style, params)
+    _build_competitor_pricing(wb, style)
+    _build_revenue_calculator(wb, style, firm_counts, direct, mix)
+    _build_growth_projections(wb, style, growth_bands, direct, cohorts)
+    _build_roi_calculator(wb, style, params)
+    _build_tier_comparison(wb, style)
+    return wb
+
+
+def _build_summary(wb, style, params):
+    """Sheet 1: executive summary with cost comparison chart"""
+    ws_summary = wb.active
+    ws_summary.title = "Summary"
+
+    ws_summary['A1'] = "PLANNETIC PRICING ANALYSIS"
+    style(ws_summary['A1'], 'title')
+    ws_summary.merge_cells('A1:F1')
+
+    ws_summary['A2'] = "Verified December 2025"
+    if params.firm_name:
+        ws_summary['A2'] = f"Prepared for {params.firm_name} - Verified December 2025"
+    style(ws_summary['A2'], 'small')
+
+    ws_summary['A4'] = "What is Plannetic?"
+    style(ws_summary['A4'], 'subheader')
+
+    summary_text = [
+        "Plannetic is a comprehensive, compliance-focused financial advisory platform",
+        "designed specifically for UK-regulated Independent Financial Advisors (IFAs).",
+        "",
+        "Key Value Proposition:",
+        "• Replaces 5-7 separate tools with one integrated platform",
+        "• Saves IFAs £280+/month vs competitor tool stack (£530 → £250)",
+        "• Saves 10-20 hours per client onboarding",
+        "• Built-in FCA compliance and Consumer Duty workflows",
+    ]
+
+    for i, text in enumerate(summary_text, start=6):
+        ws_summary[f'A{i}'] = text
+        style(ws_summary[f'A{i}'], 'normal')
+
+    # Cost Comparison Data for Chart (visible to user)
+    ws_summary['A16'] = "Cost Comparison"
+    style(ws_summary['A16'], 'subheader')
+
+    cost_headers = ['Category', 'Cost (£/mo)']
+    for col, header in enumerate(cost_headers, start=1):
+        style(ws_summary.cell(row=18, column=col, value=header), 'header', 'border')
+
+    cost_data = [
+        ['Competitor Stack', 530],
+        ['Plannetic Standard', 250],
+        ['Plannetic Professional', 300],
+        ['Monthly Savings', 280],
+    ]
+
+    for row_idx, (label, value) in enumerate(cost_data, start=19):
+        fill = ('highlight',) if row_idx == 22 else ()  # Savings row
+        style(ws_summary.cell(row=row_idx, column=1, value=label), 'border', *fill)
+        style(ws_summary.cell(row=row_idx, column=2, value=value), 'border', 'money', *fill)
+
+    # Add bar chart comparing costs
+    chart_summary = MONEY_COLUMNS_NO_LEGEND.new("Monthly Cost: Competitors vs Plannetic", y_title="£ per month",
+                                                width=12, height=8)
+
+    data_summary = Reference(ws_summary, min_col=2, min_row=18, max_row=21)  # Exclude savings row
+    cats_summary = Reference(ws_summary, min_col=1, min_row=19, max_row=21)
+    chart_summary.add_data(data_summary, titles_from_data=True)
+    chart_summary.set_categories(cats_summary)
+
+    ws_summary.add_chart(chart_summary, "D16")
+
+    # Pricing Tiers Table
+    ws_summary['A25'] = "Recommended Pricing Tiers"
+    style(ws_summary['A25'], 'subheader')
+
+    pricing_headers = ['Tier', 'Monthly', 'Commitment', '2-Year TCV', '3-Year TCV', 'Best For']
+    for col, header in enumerate(pricing_headers, start=1):
+        style(ws_summary.cell(row=27, column=col, value=header), 'header', 'border', 'center')
+
+    pricing_data = [
+        ['Monthly', 350, 'Month-to-month', '=B28*24', '=B28*36', 'Trial/uncertain firms'],
+        ['Standard', 250, '2-year', '=B29*24', '=B29*36', 'Solo advisors, small firms'],
+        ['Professional', 300, '2-year', '=B30*24', '=B30*36', 'Growing firms, AI + support'],
+        ['Enterprise', 'Custom', '3-year', 'Custom', 'Custom', '5+ advisors, white-label'],
+    ]
+
+    for row_idx, row_data in enumerate(pricing_data, start=28):
+        for col_idx, value in enumerate(row_data, start=1):
+            parts = ['normal', 'border', 'center']
+            if row_idx % 2 == 1:
+                parts.append('alt')
+            if col_idx == 2 and isinstance(value, int):
+                parts.append('money')
+            if col_idx in [4, 5] and isinstance(value, str) and value.startswith('='):
+                parts.append('money')
+            style(ws_summary.cell(row=row_idx, column=col_idx, value=value), *parts)
+
+    # Column widths
+    ws_summary.column_dimensions['A'].width = 25
+    ws_summary.column_dimensions['B'].width = 12
+    ws_summary.column_dimensions['C'].width = 18
+    ws_summary.column_dimensions['D'].width = 14
+    ws_summary.column_dimensions['E'].width = 14
+    ws_summary.column_dimensions['F'].width = 26
+
+
+def _build_competitor_pricing(wb, style):
+    """Sheet 2: competitor pricing with cost bar chart and tool stack pie"""
+    ws_comp = wb.create_sheet("Competitor Pricing")
+
+    ws_comp['A1'] = "COMPETITOR PRICING ANALYSIS"
+    style(ws_comp['A1'], 'title')
+    ws_comp.merge_cells('A1:E1')
+
+    ws_comp['A2'] = "Verified December 2025 - Sources linked below"
+    style(ws_comp['A2'], 'small')
+
+    ws_comp['A4'] = "UK IFA Software Market - Verified Pricing"
+    style(ws_comp['A4'], 'subheader')
+
+    comp_headers = ['Software', 'Monthly Price', 'Price Type', 'What They Offer', 'Source']
+    for col, header in enumerate(comp_headers, start=1):
+        style(ws_comp.cell(row=6, column=col, value=header), 'header', 'border', 'center')
+
+    for row_idx, row_data in enumerate(COMPETITORS, start=7):
+        for col_idx, value in enumerate(row_data, start=1):
+            parts = ['border']
+            if col_idx == 2:
+                parts.append('money')
+            if row_idx == 12:
+                parts += ['highlight', 'bold']
+            elif row_idx % 2 == 0:
+                parts += ['alt', 'normal']
+            else:
+                parts.append('normal')
+            style(ws_comp.cell(row=row_idx, column=col_idx, value=value), *parts)
+
+    # Bar chart for competitor pricing
+    chart1 = MONEY_COLUMNS_NO_LEGEND.new("Monthly Software Costs Comparison", y_title="£ per month",
+                                         width=14, height=10)
+
+    data = Reference(ws_comp, min_col=2, min_row=6, max_row=12)
+    cats = Reference(ws_comp, min_col=1, min_row=7, max_row=12)
+    chart1.add_data(data, titles_from_data=True)
+    chart1.set_categories(cats)
+
+    ws_comp.add_chart(chart1, "A15")
+
+    # Tool Stack Comparison
+    ws_comp['A32'] = "Typical IFA Tool Stack vs Plannetic"
+    style(ws_comp['A32'], 'subheader')
+
+    stack_headers = ['Tool Category', 'Standalone Cost', 'Plannetic', 'Savings']
+    for col, header in enumerate(stack_headers, start=1):
+        style(ws_comp.cell(row=34, column=col, value=header), 'header', 'border', 'center')
+
+    stack_data = [
+        ['CRM (generic)', 50, 'Included', '=B35'],
+        ['Risk Profiling', 50, 'Included', '=B36'],
+        ['Cash Flow (Voyant)', 175, 'Included', '=B37'],
+        ['Monte Carlo (Timeline)', 162, 'Included', '=B38'],
+        ['Document Generation', 50, 'Included', '=B39'],
+        ['E-Signatures', 23, 'Included', '=B40'],
+        ['Compliance Tracking', 50, 'Included', '=B41'],
+    ]
+
+    for row_idx, row_data in enumerate(stack_data, start=35):
+        for col_idx, value in enumerate(row_data, start=1):
+            money = ('money',) if col_idx in [2, 4] else ()
+            style(ws_comp.cell(row=row_idx, column=col_idx, value=value), 'normal', 'border', *money)
+
+    # Total row
+    ws_comp['A42'] = 'TOTAL'
+    ws_comp['B42'] = '=SUM(B35:B41)'
+    ws_comp['C42'] = '£250/mo'
+    ws_comp['D42'] = '=B42-250'
+
+    for col in range(1, 5):
+        money = ('money',) if col in [2, 4] else ()
+        style(ws_comp.cell(row=42, column=col), 'bold', 'highlight', 'border', *money)
+
+    # Pie chart for tool stack
+    chart2 = PERCENT_PIE.new("Tool Stack Cost Breakdown", width=11, height=9)
+    data2 = Reference(ws_comp, min_col=2, min_row=35, max_row=41)
+    labels2 = Reference(ws_comp, min_col=1, min_row=35, max_row=41)
+    chart2.add_data(data2)
+    chart2.set_categories(labels2)
+
+    ws_comp.add_chart(chart2, "F32")
+
+    # Sources
+    ws_comp['A45'] = "Sources:"
+    style(ws_comp['A45'], 'section')
+    sources = [
+        "• Voyant: planwithvoyant.com/uk/pricing",
+        "• Timeline: timeline.co (£135+VAT = £162)",
+        "• CashCalc: advisoryai.com (£75+VAT = £90)",
+        "• Intelliflo: trustradius.com (£130-135/user)",
+    ]
+    for i, source in enumerate(sources, start=46):
+        ws_comp[f'A{i}'] = source
+        style(ws_comp[f'A{i}'], 'small')
+
+    # Column widths
+    ws_comp.column_dimensions['A'].width = 22
+    ws_comp.column_dimensions['B'].width = 15
+    ws_comp.column_dimensions['C'].width = 18
+    ws_comp.column_dimensions['D'].width = 12
+    ws_comp.column_dimensions['E'].width = 18
+
+
+def _build_revenue_calculator(wb, style, firm_counts, direct=False, mix=None):
+    """Sheet 3: revenue by number of firms with TCV line chart, then the customer mix and its sensitivity"""
+    ws_calc = wb.create_sheet("Revenue Calculator")
+
+    ws_calc['A1'] = "REVENUE CALCULATOR"
+    style(ws_calc['A1'], 'title')
+    ws_calc.merge_cells('A1:G1')
+
+    # Input Section
+    ws_calc['A3'] = "INPUT PARAMETERS (Edit yellow cells)"
+    style(ws_calc['A3'], 'subheader')
+
+    for row, (tier, label, rate) in enumerate(RATE_INPUTS, start=5):
+        ws_calc[f'A{row}'] = label
+        ws_calc[f'B{row}'] = rate
+        style(ws_calc[f'B{row}'], 'input', 'border', 'money')
+        define_name(wb, f'revenue_rate_{tier}', ws_calc.title, f'B{row}', 'input', label)
+
+    # Revenue by Number of Firms
+    ws_calc['A10'] = "REVENUE BY NUMBER OF FIRMS"
+    style(ws_calc['A10'], 'subheader')
+
+    # The table is a view over the revenue grid: one TCV column per
+    # (term, rate) pair, each a live formula on the yellow rate cells
+    grid = revenue_grid(firm_counts, rates=REVENUE_RATES, terms=REVENUE_TERMS)
+    rate_cells = {rate: f'$B${row}' for row, (_, _, rate) in enumerate(RATE_INPUTS[:2], start=5)}
+    rate_tiers = {rate: tier for tier, _, rate in RATE_INPUTS[:2]}
+    tcv_columns = [(rate, term) for term in grid.terms for rate in grid.rates]
+    diff_col = 2 + len(tcv_columns)
+    mrr_col = diff_col + 1
+    base, other = tcv_columns[0], tcv_columns[-1]
+    base_letter = get_column_letter(2)
+    other_letter = get_column_letter(1 + len(tcv_columns))
+
+    calc_headers = ['# Firms'] + [f'£{rate:,.0f}/mo ({term / 12:g}yr)' for rate, term in tcv_columns] + ['Difference', 'Blended MRR']
+    for col, header in enumerate(calc_headers, start=1):
+        style(ws_calc.cell(row=12, column=col, value=header), 'header', 'border', 'center')
+
+    # Blended MRR is per-firm MRR of the customer mix below the table
+    last_row = 12 + len(grid.firm_counts)
+    blended_mrr = f'$B${_add_customer_mix(ws_calc, style, mix, start_row=last_row + 3)}'
+    if direct:
+        # The same cells as the loop below, as raw XML rows; row 13 is odd,
+        # so the banded style comes second in each cycle
+        center = style.style_id(ws_calc, 'border', 'center')
+        money = style.style_id(ws_calc, 'border', 'money')
+        highlight = style.style_id(ws_calc, 'highlight', 'border', 'money')
+        center_alt = style.style_id(ws_calc, 'border', 'center', 'alt')
+        money_alt = style.style_id(ws_calc, 'border', 'money', 'alt')
+        columns = [DirectColumn(values=grid.firm_counts.astype(np.int64), styles=(center, center_alt))]
+        columns += [DirectColumn(formula=f'=A{{row}}*{rate_cells[rate]}*{term:g}', styles=(money, money_alt))
+                    for rate, term in tcv_columns]
+        columns.append(DirectColumn(formula=f'={other_letter}{{row}}-{base_letter}{{row}}', styles=(highlight,)))
+        columns.append(DirectColumn(formula=f'=A{{row}}*{blended_mrr}', styles=(money,)))
+        wb.direct_tables.add(ws_calc, DirectTable(13, columns))
+    else:
+        for row_idx, firms in enumerate(grid.firm_counts.astype(int).tolist(), start=13):
+            # Even rows are banded up to (not including) the highlighted Difference column
+            alt = ('alt',) if row_idx % 2 == 0 else ()
+            style(ws_calc.cell(row=row_idx, column=1, value=firms), 'border', 'center', *alt)
+
+            for col, (rate, term) in enumerate(tcv_columns, start=2):
+                cell = ws_calc.cell(row=row_idx, column=col, value=f'=A{row_idx}*{rate_cells[rate]}*{term:g}')
+                style(cell, 'border', 'money', *alt)
+
+            cell = ws_calc.cell(row=row_idx, column=diff_col, value=f'={other_letter}{row_idx}-{base_letter}{row_idx}')
+            style(cell, 'highlight', 'border', 'money')
+
+            style(ws_calc.cell(row=row_idx, column=mrr_col, value=f'=A{row_idx}*{blended_mrr}'), 'border', 'money')
+
+    table_columns = [('revenue_firm_counts', 1)]
+    table_columns += [(f'revenue_tcv_{rate_tiers[rate]}_{term:g}m', col)
+                      for col, (rate, term) in enumerate(tcv_columns, start=2)]
+    table_columns += [('revenue_difference', diff_col), ('revenue_blended_mrr', mrr_col)]
+    for name, col in table_columns:
+        letter = get_column_letter(col)
+        define_name(wb, name, ws_calc.title, f'{letter}13:{letter}{last_row}', label=calc_headers[col - 1])
+
+    # Data for Revenue Chart (select key milestones)
+    chart_col = mrr_col + 2
+    style(ws_calc.cell(row=10, column=chart_col, value="Revenue Milestones (for chart)"), 'section')
+
+    chart_data_headers = ['Firms', f'{base[1] / 12:g}yr @ £{base[0]:,.0f}', f'{other[1] / 12:g}yr @ £{other[0]:,.0f}']
+    for col, header in enumerate(chart_data_headers, start=chart_col):
+        style(ws_calc.cell(row=11, column=col, value=header), 'header', 'border')
+
+    # Key milestones: 10, 25, 50, 100 firms, where they appear in the table
+    table_rows = {firms: row for row, firms in enumerate(grid.firm_counts.astype(int).tolist(), start=13)}
+    milestones = [(firms, table_rows[firms]) for firms in (10, 25, 50, 100) if firms in table_rows]
+    for i, (firms, src_row) in enumerate(milestones):
+        row = 12 + i
+        style(ws_calc.cell(row=row, column=chart_col, value=firms), 'border')
+        style(ws_calc.cell(row=row, column=chart_col + 1, value=f'={base_letter}{src_row}'), 'border', 'money')
+        style(ws_calc.cell(row=row, column=chart_col + 2, value=f'={other_letter}{src_row}'), 'border', 'money')
+
+    # Add line chart for revenue milestones
+    chart_rev = MONEY_LINES.new("Total Contract Value by # of Firms", x_title="Number of Firms",
+                                y_title="Total Contract Value (£)", width=12, height=9)
+
+    data_rev = Reference(ws_calc, min_col=chart_col + 1, min_row=11, max_col=chart_col + 2, max_row=11 + len(milestones))
+    cats_rev = Reference(ws_calc, min_col=chart_col, min_row=12, max_row=11 + len(milestones))
+    chart_rev.add_data(data_rev, titles_from_data=True)
+    chart_rev.set_categories(cats_rev)
+
+    ws_calc.add_chart(chart_rev, f"{get_column_letter(chart_col)}17")
+
+    # Column widths
+    for col in range(1, chart_col + 3):
+        ws_calc.column_dimensions[get_column_letter(col)].width = 15
+
+
+def _add_customer_mix(ws_calc, style, mix, start_row):
+    """
+    Editable tier mix (shares) with the blended per-firm MRR, then MRR
+    (formulas on the rates and shares) and churn-adjusted contract value
+    (mix.py, fixed at generation) by MIX_SWEEP_TIER share x MIX_FIRM_COUNTS;
+    returns the blended MRR row
+    """
+    mix = DEFAULT_TIER_MIX if mix is None else mix
+    rate_rows = {tier: row for row, (tier, _, _) in enumerate(RATE_INPUTS, start=5)}
+    plans = tier_plans({tier: rate for tier, _, rate in RATE_INPUTS})
+    current = mix_revenue(mix, plans=plans)
+
+    style(ws_calc.cell(row=start_row, column=1, value="CUSTOMER MIX (Edit yellow shares)"), 'subheader')
+    style(ws_calc.cell(row=start_row + 1, column=1,
+                       value="Blended MRR in the table above uses these shares; terms from the Tier Comparison sheet"),
+          'small')
+
+    mix_headers = ['Tier', 'Monthly Rate', 'Term (months)', 'Annual Churn', 'Share of Firms']
+    header_row = start_row + 3
+    for col, header in enumerate(mix_headers, start=1):
+        style(ws_calc.cell(row=header_row, column=col, value=header), 'header', 'border', 'center')
+    first_row = header_row + 1
+    for i, ((tier, plan), share) in enumerate(zip(plans.items(), current.shares[0].tolist())):
+        row = first_row + i
+        style(ws_calc.cell(row=row, column=1, value=plan.name), 'border')
+        style(ws_calc.cell(row=row, column=2, value=f'=$B${rate_rows[tier]}'), 'border', 'money')
+        style(ws_calc.cell(row=row, column=3, value=plan.term_months or 'Rolling'), 'border', 'center')
+        style(ws_calc.cell(row=row, column=4, value=round(TIER_CHURN[tier], 4)), 'border', 'percent_1dp')
+        style(ws_calc.cell(row=row, column=5, value=round(share, 4)), 'input', 'border', 'percent')
+        define_name(ws_calc.parent, f'revenue_mix_share_{tier}', ws_calc.title, f'E{row}', 'input',
+                    f'{plan.name} share of firms')
+    last_row = first_row + len(plans) - 1
+
+    blended_row = last_row + 1
+    products = '+'.join(f'B{row}*E{row}' for row in range(first_row, last_row + 1))
+    style(ws_calc.cell(row=blended_row, column=1, value="Blended MRR per firm"), 'border', 'bold')
+    style(ws_calc.cell(row=blended_row, column=2, value=f'=({products})/SUM(E{first_row}:E{last_row})'),
+          'border', 'highlight', 'money')
+    define_name(ws_calc.parent, 'revenue_blended_mrr_per_firm', ws_calc.title, f'B{blended_row}',
+                label="Blended MRR per firm")
+
+    # Blended MRR of the tiers other than MIX_SWEEP_TIER, which split the rest of the firms in the sweep
+    sweep_name = plans[MIX_SWEEP_TIER].name
+    rest_row = blended_row + 1
+    sweep_row = first_row + list(plans).index(MIX_SWEEP_TIER)
+    rest_rows = [row for row in range(first_row, last_row + 1) if row != sweep_row]
+    rest_products = '+'.join(f'B{row}*E{row}' for row in rest_rows)
+    rest_shares = '+'.join(f'E{row}' for row in rest_rows)
+    style(ws_calc.cell(row=rest_row, column=1, value=f"Blended MRR per firm, tiers other than {sweep_name}"),
+          'border')
+    style(ws_calc.cell(row=rest_row, column=2, value=f'=IFERROR(({rest_products})/({rest_shares}),0)'),
+          'border', 'money')
+
+    sweep = mix_revenue(vary_share(MIX_SWEEP_TIER, MIX_SWEEP_SHARES, base=mix, plans=plans),
+                        firm_counts=MIX_FIRM_COUNTS, plans=plans)
+    title_row = blended_row + 3
+    style(ws_calc.cell(row=title_row, column=1, value="MIX SENSITIVITY"), 'subheader')
+    style(ws_calc.cell(row=title_row + 1, column=1,
+                      value=f"{sweep_name} share varied, other tiers splitting the rest in the proportions above"),
+          'small')
+
+    # MRR follows the rates and shares above; the churn-adjusted value needs the survival
+    # curves of mix.py, so it is computed once for the rates and shares the pack was built with
+    tables = [
+        (f"MRR by {sweep_name} share of firms (rows) and number of firms (columns)", None, None),
+        (f"Expected {DEFAULT_HORIZON}-month contract value after churn and renewals",
+         sweep.per_firm_value.round(2).tolist(), sweep.tcv.T.round(2).tolist()),
+    ]
+    table_row = title_row + 3
+    for title, per_firm, values in tables:
+        style(ws_calc.cell(row=table_row, column=1, value=title), 'section')
+        headers = [f'{sweep_name} Share', 'Per Firm'] + [f'{count} firms' for count in MIX_FIRM_COUNTS]
+        for col, header in enumerate(headers, start=1):
+            style(ws_calc.cell(row=table_row + 1, column=col, value=header), 'header', 'border', 'center')
+        for i, share in enumerate(MIX_SWEEP_SHARES):
+            row = table_row + 2 + i
+            alt = ('alt',) if row % 2 == 0 else ()
+            if values is None:
+                firm_value = f'=$A{row}*$B${sweep_row}+(1-$A{row})*$B${rest_row}'
+                row_values = [f'={count}*$B{row}' for count in MIX_FIRM_COUNTS]
+            else:
+                firm_value, row_values = per_firm[i], values[i]
+            style(ws_calc.cell(row=row, column=1, value=share), 'border', 'center', 'percent', *alt)
+            style(ws_calc.cell(row=row, column=2, value=firm_value), 'border', 'bold', 'money', *alt)
+            for col, value in enumerate(row_values, start=3):
+                style(ws_calc.cell(row=row, column=col, value=value), 'border', 'money', *alt)
+        if values is not None:
+            style(ws_calc.cell(row=row + 1, column=1,
+                               value="Fixed at the rates and shares this pack was generated with; "
+                                     "does not follow edits above"), 'small')
+        table_row += len(MIX_SWEEP_SHARES) + 3
+    return blended_row
+
+
+def _build_growth_projections(wb, style, growth_bands=None, direct=False, cohorts=None):
+    """
+    Sheet 4: conservative/moderate/aggressive growth with ARR chart, plus a
+    Monte Carlo ARR fan chart when growth_bands (see growth.py) is given and
+    a monthly cohort summary when cohorts (see cohorts.py) is given
+    """
+    ws_growth = wb.create_sheet("Growth Projections")
+
+    ws_growth['A1'] = "GROWTH PROJECTIONS"
+    style(ws_growth['A1'], 'title')
+    ws_growth.merge_cells('A1:F1')
+
+    # Input parameters
+    ws_growth['A3'] = "SCENARIO INPUTS (Edit yellow cells)"
+    style(ws_growth['A3'], 'subheader')
+
+    ws_growth['A5'] = "Monthly Rate (£)"
+    ws_growth['B5'] = DEFAULT_MONTHLY_RATE
+    style(ws_growth['B5'], 'input', 'border', 'money')
+
+    ws_growth['A6'] = "Annual Churn Rate (%)"
+    ws_growth['B6'] = DEFAULT_ANNUAL_CHURN
+    style(ws_growth['B6'], 'input', 'border', 'percent')
+    define_name(wb, 'growth_monthly_rate', ws_growth.title, 'B5', 'input', "Monthly Rate (£)")
+    define_name(wb, 'growth_annual_churn', ws_growth.title, 'B6', 'input', "Annual Churn Rate (%)")
+
+    growth_headers = ['Year', 'New Firms', 'Churn', 'Total Firms', 'MRR', 'ARR']
+
+    # Conservative Growth
+    ws_growth['A9'] = "CONSERVATIVE (10 new firms/year)"
+    style(ws_growth['A9'], 'section')
+
+    for col, header in enumerate(growth_headers, start=1):
+        style(ws_growth.cell(row=10, column=col, value=header), 'header', 'border', 'center')
+
+    conservative_new = GROWTH_SCENARIOS['Conservative']
+    for i, new_firms in enumerate(conservative_new):
+        row = 11 + i
+        style(ws_growth.cell(row=row, column=1, value=i+1), 'border', 'center')
+        style(ws_growth.cell(row=row, column=2, value=new_firms), 'border', 'center')
+        if i == 0:
+            style(ws_growth.cell(row=row, column=3, value=0), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=B{row}'), 'border', 'center')
+        else:
+            style(ws_growth.cell(row=row, column=3, value=f'=ROUND(D{row-1}*$B$6,0)'), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=D{row-1}+B{row}-C{row}'), 'border', 'center')
+        style(ws_growth.cell(row=row, column=5, value=f'=D{row}*$B$5'), 'border', 'center', 'money')
+        style(ws_growth.cell(row=row, column=6, value=f'=E{row}*12'), 'border', 'center', 'money')
+
+    # Moderate Growth
+    ws_growth['A18'] = "MODERATE (25 new firms/year)"
+    style(ws_growth['A18'], 'section')
+
+    for col, header in enumerate(growth_headers, start=1):
+        style(ws_growth.cell(row=19, column=col, value=header), 'header', 'border', 'center')
+
+    moderate_new = GROWTH_SCENARIOS['Moderate']
+    for i, new_firms in enumerate(moderate_new):
+        row = 20 + i
+        style(ws_growth.cell(row=row, column=1, value=i+1), 'border', 'center')
+        style(ws_growth.cell(row=row, column=2, value=new_firms), 'border', 'center')
+        if i == 0:
+            style(ws_growth.cell(row=row, column=3, value=0), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=B{row}'), 'border', 'center')
+        else:
+            style(ws_growth.cell(row=row, column=3, value=f'=ROUND(D{row-1}*$B$6,0)'), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=D{row-1}+B{row}-C{row}'), 'border', 'center')
+        style(ws_growth.cell(row=row, column=5, value=f'=D{row}*$B$5'), 'border', 'center', 'money')
+        style(ws_growth.cell(row=row, column=6, value=f'=E{row}*12'), 'border', 'center', 'money')
+
+    # Aggressive Growth
+    ws_growth['A27'] = "AGGRESSIVE (50 new firms/year)"
+    style(ws_growth['A27'], 'section')
+
+    for col, header in enumerate(growth_headers, start=1):
+        style(ws_growth.cell(row=28, column=col, value=header), 'header', 'border', 'center')
+
+    aggressive_new = GROWTH_SCENARIOS['Aggressive']
+    for i, new_firms in enumerate(aggressive_new):
+        row = 29 + i
+        style(ws_growth.cell(row=row, column=1, value=i+1), 'border', 'center')
+        style(ws_growth.cell(row=row, column=2, value=new_firms), 'border', 'center')
+        if i == 0:
+            style(ws_growth.cell(row=row, column=3, value=0), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=B{row}'), 'border', 'center')
+        else:
+            style(ws_growth.cell(row=row, column=3, value=f'=ROUND(D{row-1}*$B$6,0)'), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=D{row-1}+B{row}-C{row}'), 'border', 'center')
+        style(ws_growth.cell(row=row, column=5, value=f'=D{row}*$B$5'), 'border', 'center', 'money')
+        style(ws_growth.cell(row=row, column=6, value=f'=E{row}*12'), 'border', 'center', 'money')
+
+    for scenario, first_row in (('Conservative', 11), ('Moderate', 20), ('Aggressive', 29)):
+        last_row = first_row + len(GROWTH_SCENARIOS[scenario]) - 1
+        for measure, letter, header in (('total_firms', 'D', 'Total Firms'), ('mrr', 'E', 'MRR'), ('arr', 'F', 'ARR')):
+            define_name(wb, f'growth_{scenario.lower()}_{measure}', ws_growth.title,
+                        f'{letter}{first_row}:{letter}{last_row}', label=f'{scenario} {header}')
+
+    # Chart data table
+    ws_growth['H3'] = "ARR Comparison (for chart)"
+    style(ws_growth['H3'], 'section')
+
+    chart_headers = ['Year', 'Conservative', 'Moderate', 'Aggressive']
+    for col, header in enumerate(chart_headers, start=8):
+        style(ws_growth.cell(row=4, column=col, value=header), 'header', 'border')
+
+    for i in range(5):
+        row = 5 + i
+        style(ws_growth.cell(row=row, column=8, value=i+1), 'border')
+        style(ws_growth.cell(row=row, column=9, value=f'=F{11+i}'), 'border', 'money')
+        style(ws_growth.cell(row=row, column=10, value=f'=F{20+i}'), 'border', 'money')
+        style(ws_growth.cell(row=row, column=11, value=f'=F{29+i}'), 'border', 'money')
+
+    # Line chart for ARR
+    chart3 = MONEY_LINES.new("ARR Growth Projections", x_title="Year", y_title="Annual Recurring Revenue (£)",
+                             width=14, height=10)
+
+    data3 = Reference(ws_growth, min_col=9, min_row=4, max_col=11, max_row=9)
+    cats3 = Reference(ws_growth, min_col=8, min_row=5, max_row=9)
+    chart3.add_data(data3, titles_from_data=True)
+    chart3.set_categories(cats3)
+
+    ws_growth.add_chart(chart3, "H12")
+
+    next_row = 36
+    if growth_bands is not None:
+        next_row = _add_growth_fan_chart(ws_growth, style, growth_bands, start_row=next_row,
+                                         direct_tables=wb.direct_tables if direct else None) + 3
+    if cohorts is not None:
+        _add_cohort_summary(ws_growth, style, cohorts, start_row=next_row)
+
+    # Column widths
+    for col in range(1, 12):
+        ws_growth.column_dimensions[get_column_letter(col)].width = 14
+
+
+def _add_growth_fan_chart(ws_growth, style, bands, start_row, direct_tables=None):
+    """
+    Monthly simulated ARR percentile table and fan chart below the scenarios;
+    with direct_tables the table rows are written as raw XML on save.
+    Returns the last table row.
+    """
+    style(ws_growth.cell(row=start_row, column=1,
+                         value=f"MONTE CARLO ARR BANDS - {bands.scenario.upper()} ({bands.paths:,} paths)"), 'section')
+    style(ws_growth.cell(row=start_row + 1, column=1,
+                         value="Simulated values: new firms vary month to month and year to year, churn varies by path"), 'small')
+
+    labels = [f'P{p}' for p in bands.percentiles]
+    band_headers = [f'{lo}-{hi}' for lo, hi in zip(labels, labels[1:])]
+    headers = ['Month'] + [f'{label} ARR' for label in labels] + band_headers
+    header_row = start_row + 3
+    for col, header in enumerate(headers, start=1):
+        style(ws_growth.cell(row=header_row, column=col, value=header), 'header', 'border', 'center')
+
+    first_band_col = 2 + len(labels)
+    band_formulas = [f'={get_column_letter(3 + j)}{{row}}-{get_column_letter(2 + j)}{{row}}'
+                     for j in range(len(band_headers))]
+    if direct_tables is not None:
+        border = style.style_id(ws_growth, 'border')
+        money = style.style_id(ws_growth, 'border', 'money')
+        columns = [DirectColumn(values=bands.months, styles=(border,))]
+        columns += [DirectColumn(values=series, styles=(money,)) for series in bands.arr]
+        columns += [DirectColumn(formula=formula, styles=(money,)) for formula in band_formulas]
+        direct_tables.add(ws_growth, DirectTable(header_row + 1, columns))
+    else:
+        arr = bands.arr.tolist()
+        for i, month in enumerate(bands.months.tolist()):
+            row = header_row + 1 + i
+            style(ws_growth.cell(row=row, column=1, value=month), 'border')
+            for j, series in enumerate(arr):
+                style(ws_growth.cell(row=row, column=2 + j, value=series[i]), 'border', 'money')
+            # Band widths feed the stacked area chart
+            for j, formula in enumerate(band_formulas):
+                style(ws_growth.cell(row=row, column=first_band_col + j, value=formula.format(row=row)),
+                      'border', 'money')
+    last_row = header_row + len(bands.months)
+
+    # Fan: invisible lowest band, stacked band widths, median line on top
+    fan = AreaChart()
+    fan.grouping = 'stacked'
+    fan.title = f"Simulated ARR ({'/'.join(labels)})"
+    fan.style = 10
+    fan.y_axis.title = "Annual Recurring Revenue (£)"
+    fan.x_axis.title = "Month"
+    fan.y_axis.numFmt = '£#,##0'
+    for col in [2] + list(range(first_band_col, first_band_col + len(band_headers))):
+        fan.add_data(Reference(ws_growth, min_col=col, min_row=header_row, max_row=last_row), titles_from_data=True)
+    fan.series[0].graphicalProperties.noFill = True
+    fan.series[0].graphicalProperties.line.noFill = True
+    for series in fan.series[1:]:
+        series.graphicalProperties.line.noFill = True
+    fan.set_categories(Reference(ws_growth, min_col=1, min_row=header_row + 1, max_row=last_row))
+
+    median = LineChart()
+    median_col = 2 + len(labels) // 2
+    median.add_data(Reference(ws_growth, min_col=median_col, min_row=header_row, max_row=last_row), titles_from_data=True)
+    median.series[0].smooth = False
+    fan += median
+
+    fan.width = 16
+    fan.height = 10
+    ws_growth.add_chart(fan, f"{get_column_letter(first_band_col + len(band_headers) + 1)}{start_row}")
+    return last_row
+
+
+def _add_cohort_summary(ws_growth, style, cohorts, start_row):
+    """Plan assumptions and yearly totals from the monthly cohort model, with ARR chart"""
+    years = len(cohorts.year_end(cohorts.months))
+    style(ws_growth.cell(row=start_row, column=1,
+                         value=f"MONTHLY COHORT MODEL - {years} YEARS ({len(cohorts.months)} monthly cohorts per plan)"),
+          'section')
+    style(ws_growth.cell(row=start_row + 1, column=1,
+                         value="Modelled values: contract firms renew or leave at term end, Monthly firms churn every month"),
+          'small')
+
+    plan_headers = ['Plan', 'Monthly Rate', 'Term (months)', 'Share of New', 'Monthly Churn', 'Renewal Rate']
+    header_row = start_row + 3
+    for col, header in enumerate(plan_headers, start=1):
+        style(ws_growth.cell(row=header_row, column=col, value=header), 'header', 'border', 'center')
+    for i, (plan, share) in enumerate(zip(cohorts.plans.values(), cohorts.mix.tolist())):
+        row = header_row + 1 + i
+        style(ws_growth.cell(row=row, column=1, value=plan.name), 'border')
+        style(ws_growth.cell(row=row, column=2, value=plan.monthly_rate), 'border', 'money')
+        style(ws_growth.cell(row=row, column=3, value=plan.term_months or 'Rolling'), 'border', 'center')
+        style(ws_growth.cell(row=row, column=4, value=share), 'border', 'percent')
+        if plan.term_months:
+            style(ws_growth.cell(row=row, column=5, value='—'), 'border', 'center')
+            style(ws_growth.cell(row=row, column=6, value=plan.renewal_rate), 'border', 'percent_1dp')
+        else:
+            style(ws_growth.cell(row=row, column=5, value=plan.monthly_churn), 'border', 'percent_1dp')
+            style(ws_growth.cell(row=row, column=6, value='—'), 'border', 'center')
+
+    summary = [
+        ('New Firms', cohorts.year_sum(cohorts.total(cohorts.new)), 'decimal'),
+        ('Renewals', cohorts.year_sum(cohorts.total(cohorts.renewed)), 'decimal'),
+        ('Churned', cohorts.year_sum(cohorts.total(cohorts.churned)), 'decimal'),
+        ('Active Firms', cohorts.year_end(cohorts.total(cohorts.active)), 'decimal'),
+        ('MRR', cohorts.year_end(cohorts.total(cohorts.mrr)), 'money'),
+        ('ARR', cohorts.year_end(cohorts.total(cohorts.arr)), 'money'),
+        ('TCV Booked', cohorts.year_sum(cohorts.total(cohorts.booked_tcv)), 'money'),
+    ]
+    table_row = header_row + len(cohorts.plans) + 2
+    for col, header in enumerate(['Year'] + [name for name, _, _ in summary], start=1):
+        style(ws_growth.cell(row=table_row, column=col, value=header), 'header', 'border', 'center')
+    columns = [values.tolist() for _, values, _ in summary]
+    for year in range(years):
+        row = table_row + 1 + year
+        style(ws_growth.cell(row=row, column=1, value=year + 1), 'border', 'center')
+        for col, (values, (_, _, number_format)) in enumerate(zip(columns, summary), start=2):
+            style(ws_growth.cell(row=row, column=col, value=values[year]), 'border', number_format)
+    last_row = table_row + years
+
+    arr_col = 2 + [name for name, _, _ in summary].index('ARR')
+    chart = MONEY_COLUMNS.new("Cohort Model: Year-end ARR", x_title="Year", y_title="Annual Recurring Revenue (£)",
+                              width=14, height=8)
+    chart.add_data(Reference(ws_growth, min_col=arr_col, min_row=table_row, max_row=last_row), titles_from_data=True)
+    chart.set_categories(Reference(ws_growth, min_col=1, min_row=table_row + 1, max_row=last_row))
+    ws_growth.add_chart(chart, f"{get_column_letter(len(summary) + 3)}{start_row}")
+    return last_row
+
+
+def _roi_context(params):
+    """Render context for the ROI Calculator layout"""
+    tool_costs = {key: params.tool_costs.get(key, default_cost) for key, _, default_cost, _ in TOOL_STACK}
+    return {
+        'tool_costs': tool_costs,
+        'hours_per_client': params.hours_per_client,
+        'time_saved_pct': params.time_saved_pct,
+        'hourly_rate': params.hourly_rate,
+        'clients_per_month': params.clients_per_month,
+        'plannetic_cost': params.plannetic_cost,
+        'tier': f'{params.tier.capitalize()} tier',
+    }
+
+
+def _build_roi_calculator(wb, style, params):
+    """
+    Sheet 5: client ROI calculator with monthly value chart
+    (layouts/roi_calculator.json), then the price sensitivity of its inputs
+    """
+    layout = load_layout('roi_calculator')
+    ws_roi = layout.render(wb, style, _roi_context(params))
+    # Below the Monthly Value Analysis chart, which is about 18 rows tall
+    chart_row, _ = coordinate_to_tuple(layout.charts[-1].anchor)
+    cells = {name: absolute_coordinate(ref) for name, ref in layout.names.items()}
+    _add_roi_sensitivity(ws_roi, style, cells, start_row=chart_row + 20)
+
+
+def _add_roi_sensitivity(ws_roi, style, cells, start_row):
+    """
+    Break-even figures, ROI % heatmap over price x clients, and break-even
+    price chart, all formulas on the calculator's input cells (cells maps
+    the layout's names to absolute references), following roi.py:
+
+        net benefit = tool costs + value per client * clients - 2 * price
+    """
+    tools, price, clients = cells['roi_tool_costs_total'], cells['roi_plannetic_cost'], cells['roi_clients_per_month']
+    per_client = f"{cells['roi_hours_saved_per_client']}*{cells['roi_hourly_rate']}"
+    shortfall = f'(2*{price}-{tools})'
+
+    style(ws_roi.cell(row=start_row, column=1, value="PRICE SENSITIVITY"), 'subheader')
+    style(ws_roi.cell(row=start_row + 1, column=1,
+                      value="Recalculated from the inputs above: net benefit = tool costs + time value - 2 x price"),
+          'small')
+
+    key_figures = [
+        ('roi_break_even_price', 'Break-even Plannetic price', f'" ("&{clients}&" clients/month)"',
+         f"=({tools}+{cells['roi_time_value_monthly']})/2", 'money'),
+        ('roi_min_clients', 'Minimum clients/month for positive ROI', f'" (at £"&{price}&")"',
+         f'=IF({shortfall}<0,0,IF({per_client}>0,ROUNDDOWN({shortfall}/({per_client}),0)+1,"Not reachable"))',
+         'integer'),
+    ]
+    for row, (name, label, suffix, value, number_format) in enumerate(key_figures, start=start_row + 3):
+        style(ws_roi.cell(row=row, column=1, value=f'="{label}"&{suffix}'), 'border', 'bold')
+        style(ws_roi.cell(row=row, column=2, value=value), 'border', 'highlight', number_format)
+        define_name(ws_roi.parent, name, ws_roi.title, f'B{row}', label=label)
+
+    title_row = start_row + 6
+    style(ws_roi.cell(row=title_row, column=1,
+                      value="ROI % by Plannetic price (rows) and new clients per month (columns)"), 'section')
+    header_row = title_row + 1
+    style(ws_roi.cell(row=header_row, column=1, value="Price / Clients"), 'header', 'border')
+    for col, count in enumerate(ROI_HEATMAP_CLIENTS, start=2):
+        style(ws_roi.cell(row=header_row, column=col, value=count), 'header', 'border', 'center')
+
+    for i, grid_price in enumerate(ROI_HEATMAP_PRICES):
+        row = header_row + 1 + i
+        style(ws_roi.cell(row=row, column=1, value=grid_price), 'border', 'bold', 'money')
+        for col in range(2, 2 + len(ROI_HEATMAP_CLIENTS)):
+            count = f'{get_column_letter(col)}${header_row}'
+            roi = f'=({tools}+{per_client}*{count}-2*$A{row})/$A{row}*100'
+            style(ws_roi.cell(row=row, column=col, value=roi), 'border', 'points')
+    last_row = header_row + len(ROI_HEATMAP_PRICES)
+    last_col = get_column_letter(1 + len(ROI_HEATMAP_CLIENTS))
+    # Red below break-even, white at 0%, green above
+    ws_roi.conditional_formatting.add(
+        f'B{header_row + 1}:{last_col}{last_row}',
+        ColorScaleRule(start_type='min', start_color='F8696B', mid_type='num', mid_value=0, mid_color='FFFFFF',
+                       end_type='max', end_color='63BE7B'))
+
+    break_even_row = last_row + 1
+    style(ws_roi.cell(row=break_even_row, column=1, value="Break-even price"), 'border', 'bold', 'highlight')
+    for col in range(2, 2 + len(ROI_HEATMAP_CLIENTS)):
+        count = f'{get_column_letter(col)}${header_row}'
+        style(ws_roi.cell(row=break_even_row, column=col, value=f'=({tools}+{per_client}*{count})/2'),
+              'border', 'highlight', 'money')
+
+    chart = MONEY_LINES.new("Break-even Plannetic Price by Clients per Month", x_title="New clients per month",
+                            y_title="£ per month", width=16, height=8)
+    chart.add_data(Reference(ws_roi, min_col=1, max_col=1 + len(ROI_HEATMAP_CLIENTS),
+                             min_row=break_even_row, max_row=break_even_row),
+                   from_rows=True, titles_from_data=True)
+    chart.set_categories(Reference(ws_roi, min_col=2, max_col=1 + len(ROI_HEATMAP_CLIENTS),
+                                   min_row=header_row, max_row=header_row))
+    ws_roi.add_chart(chart, f"A{break_even_row + 2}")
+
+
+def _build_tier_comparison(wb, style):
+    """Sheet 6: tier feature matrix (layouts/tier_comparison.json)"""
+    load_layout('tier_comparison').render(wb, style)
@@ -0,0 +1,630 @@
+"""
+Plannetic Pricing Analysis v2 - workbook builder
+
+The v2 pricing model (verified December 2025 data, working formulas and
+competitor/growth/ROI charts). Superseded by the per-prospect v3 pack in
+pricing.py but still produced for the original v2 download.
+"""
+
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+
+from .charts import MONEY_LINES, PERCENT_PIE, ChartTemplate
+from .styles import PLANNETIC_STYLES, StyleRegistry
+
+# v2's column charts predate the '£#,##0' axis format the v3 templates share
+SOFTWARE_COST_COLUMNS = ChartTemplate('bar', {'type': 'col', 'style': 10, 'shape': 4, 'legend': None})
+SAVINGS_COLUMNS = ChartTemplate('bar', {'type': 'col', 'style': 10, 'legend': None})
+
+
+def build_pricing_v2_workbook():
+    """Build the workbook and return it unsaved"""
+    wb = Workbook()
+    style = StyleRegistry(wb, PLANNETIC_STYLES, 'Plannetic')
+    _build_summary(wb, style)
+    _build_competitor_pricing(wb, style)
+    _build_revenue_calculator(wb, style)
+    _build_growth_projections(wb, style)
+    _build_roi_calculator(wb, style)
+    _build_tier_comparison(wb, style)
+    return wb
+
+
+def _build_summary(wb, style):
+    """Sheet 1: executive summary"""
+    ws_summary = wb.active
+    ws_summary.title = "Summary"
+
+    ws_summary['A1'] = "PLANNETIC PRICING ANALYSIS"
+    style(ws_summary['A1'], 'title')
+    ws_summary.merge_cells('A1:F1')
+
+    ws_summary['A2'] = "Verified December 2025"
+    style(ws_summary['A2'], 'small')
+
+    ws_summary['A4'] = "What is Plannetic?"
+    style(ws_summary['A4'], 'subheader')
+
+    summary_text = [
+        "Plannetic is a comprehensive, compliance-focused financial advisory platform",
+        "designed specifically for UK-regulated Independent Financial Advisors (IFAs).",
+        "",
+        "Key Value Proposition:",
+        "• Replaces 5-7 separate tools with one integrated platform",
+        "• Saves IFAs £280+/month vs competitor tool stack (£530 → £250)",
+        "• Saves 10-20 hours per client onboarding",
+        "• Built-in FCA compliance and Consumer Duty workflows",
+        "• AI-enhanced assessments and form auto-population",
+    ]
+
+    for i, text in enumerate(summary_text, start=6):
+        ws_summary[f'A{i}'] = text
+        style(ws_summary[f'A{i}'], 'normal')
+
+    # Pricing Summary Table
+    ws_summary['A17'] = "Recommended Pricing Tiers"
+    style(ws_summary['A17'], 'subheader')
+
+    pricing_headers = ['Tier', 'Monthly', 'Commitment', '2-Year TCV', '3-Year TCV', 'Best For']
+    for col, header in enumerate(pricing_headers, start=1):
+        style(ws_summary.cell(row=19, column=col, value=header), 'header', 'border', 'center')
+
+    pricing_data = [
+        ['Monthly', 350, 'Month-to-month', '=B20*24', '=B20*36', 'Trial/uncertain firms'],
+        ['Standard', 250, '2-year', '=B21*24', '=B21*36', 'Solo advisors, small firms'],
+        ['Professional', 300, '2-year', '=B22*24', '=B22*36', 'Growing firms, AI + support'],
+        ['Enterprise', 'Custom', '3-year', 'Custom', 'Custom', '5+ advisors, white-label'],
+    ]
+
+    for row_idx, row_data in enumerate(pricing_data, start=20):
+        for col_idx, value in enumerate(row_data, start=1):
+            parts = ['normal', 'border', 'center']
+            if row_idx % 2 == 1:
+                parts.append('alt')
+            if col_idx == 2 and isinstance(value, int):
+                parts.append('money')
+            if col_idx in [4, 5] and isinstance(value, str) and value.startswith('='):
+                parts.append('money')
+            style(ws_summary.cell(row=row_idx, column=col_idx, value=value), *parts)
+
+    # Key savings metrics
+    ws_summary['A26'] = "Monthly Savings Analysis"
+    style(ws_summary['A26'], 'subheader')
+
+    savings_data = [
+        ['Metric', 'Value', 'Notes'],
+        ['Competitor Stack Cost', 530, 'Verified Dec 2025 pricing'],
+        ['Plannetic Standard', 250, 'Full platform access'],
+        ['Monthly Savings', '=B28-B29', 'Per month'],
+        ['Annual Savings', '=B30*12', 'Per year'],
+        ['Savings %', '=B30/B28', 'vs competitors'],
+    ]
+
+    for row_idx, row_data in enumerate(savings_data, start=28):
+        for col_idx, value in enumerate(row_data, start=1):
+            if row_idx == 28:
+                parts = ['header', 'border']
+            elif row_idx == 32:  # Highlight the savings row
+                parts = ['normal', 'highlight', 'border']
+            elif row_idx % 2 == 0:
+                parts = ['normal', 'alt', 'border']
+            else:
+                parts = ['normal', 'border']
+            if col_idx == 2 and row_idx > 28:
+                parts.append('percent_1dp' if row_idx == 33 else 'money')
+            style(ws_summary.cell(row=row_idx, column=col_idx, value=value), *parts)
+
+    # Column widths
+    ws_summary.column_dimensions['A'].width = 25
+    ws_summary.column_dimensions['B'].width = 15
+    ws_summary.column_dimensions['C'].width = 22
+    ws_summary.column_dimensions['D'].width = 15
+    ws_summary.column_dimensions['E'].width = 15
+    ws_summary.column_dimensions['F'].width = 28
+
+
+def _build_competitor_pricing(wb, style):
+    """Sheet 2: competitor analysis (with chart)"""
+    from openpyxl.chart import Reference
+
+    ws_comp = wb.create_sheet("Competitor Pricing")
+
+    ws_comp['A1'] = "COMPETITOR PRICING ANALYSIS"
+    style(ws_comp['A1'], 'title')
+    ws_comp.merge_cells('A1:E1')
+
+    ws_comp['A2'] = "Verified December 2025 - Sources linked below"
+    style(ws_comp['A2'], 'small')
+
+    # Verified competitor pricing
+    ws_comp['A4'] = "UK IFA Software Market - Verified Pricing"
+    style(ws_comp['A4'], 'subheader')
+
+    comp_headers = ['Software', 'Monthly Price', 'Price Type', 'What They Offer', 'Source']
+    for col, header in enumerate(comp_headers, start=1):
+        style(ws_comp.cell(row=6, column=col, value=header), 'header', 'border', 'center')
+
+    # Verified data
+    competitors = [
+        ['Intelliflo Office', 132, 'Per user', 'Back office + cashflow', 'TrustRadius'],
+        ['Voyant AdviserGo', 175, 'Flat fee', 'Cash flow planning', 'voyant.com'],
+        ['Timeline', 162, 'Flat (+VAT)', 'Monte Carlo simulations', 'timeline.co'],
+        ['FE CashCalc', 90, 'Per adviser (+VAT)', 'Cash flow modelling', 'advisoryai.com'],
+        ['Dynamic Planner', 200, 'Estimated', 'Risk profiling + reports', 'Contact required'],
+        ['Plannetic Standard', 250, 'Flat fee', 'ALL-IN-ONE PLATFORM', 'Your price'],
+    ]
+
+    for row_idx, row_data in enumerate(competitors, start=7):
+        for col_idx, value in enumerate(row_data, start=1):
+            parts = ['border']
+            if col_idx == 2:
+                parts.append('money')
+            if row_idx == 12:  # Plannetic row
+                parts += ['highlight', 'bold']
+            elif row_idx % 2 == 0:
+                parts += ['alt', 'normal']
+            else:
+                parts.append('normal')
+            style(ws_comp.cell(row=row_idx, column=col_idx, value=value), *parts)
+
+    # Add bar chart for competitor pricing
+    chart1 = SOFTWARE_COST_COLUMNS.new("Monthly Software Costs Comparison", y_title="£ per month", width=15, height=10)
+
+    # Data for chart
+    data = Reference(ws_comp, min_col=2, min_row=6, max_row=12)
+    cats = Reference(ws_comp, min_col=1, min_row=7, max_row=12)
+    chart1.add_data(data, titles_from_data=True)
+    chart1.set_categories(cats)
+
+    ws_comp.add_chart(chart1, "A15")
+
+    # Tool Stack Comparison
+    ws_comp['A32'] = "Typical IFA Tool Stack vs Plannetic"
+    style(ws_comp['A32'], 'subheader')
+
+    stack_headers = ['Tool Category', 'Standalone Cost', 'Plannetic', 'Savings']
+    for col, header in enumerate(stack_headers, start=1):
+        style(ws_comp.cell(row=34, column=col, value=header), 'header', 'border', 'center')
+
+    stack_data = [
+        ['CRM (generic)', 50, 'Included', '=B35'],
+        ['Risk Profiling', 50, 'Included', '=B36'],
+        ['Cash Flow (Voyant)', 175, 'Included', '=B37'],
+        ['Monte Carlo (Timeline)', 162, 'Included', '=B38'],
+        ['Document Generation', 50, 'Included', '=B39'],
+        ['E-Signatures', 23, 'Included', '=B40'],
+        ['Compliance Tracking', 50, 'Included', '=B41'],
+    ]
+
+    for row_idx, row_data in enumerate(stack_data, start=35):
+        for col_idx, value in enumerate(row_data, start=1):
+            money = ('money',) if col_idx in [2, 4] else ()
+            style(ws_comp.cell(row=row_idx, column=col_idx, value=value), 'normal', 'border', *money)
+
+    # Total row
+    ws_comp['A42'] = 'TOTAL'
+    ws_comp['B42'] = '=SUM(B35:B41)'
+    ws_comp['C42'] = '£250/mo'
+    ws_comp['D42'] = '=B42-250'
+
+    for col in range(1, 5):
+        money = ('money',) if col in [2, 4] else ()
+        style(ws_comp.cell(row=42, column=col), 'bold', 'highlight', 'border', *money)
+
+    # Add pie chart for tool stack
+    chart2 = PERCENT_PIE.new("Tool Stack Cost Breakdown", width=12, height=10)
+    data2 = Reference(ws_comp, min_col=2, min_row=35, max_row=41)
+    labels2 = Reference(ws_comp, min_col=1, min_row=35, max_row=41)
+    chart2.add_data(data2)
+    chart2.set_categories(labels2)
+
+    ws_comp.add_chart(chart2, "F32")
+
+    # Sources
+    ws_comp['A45'] = "Sources:"
+    style(ws_comp['A45'], 'section')
+    sources = [
+        "• Voyant: planwithvoyant.com/uk/pricing",
+        "• Timeline: timeline.co (£135+VAT = £162)",
+        "• CashCalc: advisoryai.com (£75+VAT = £90)",
+        "• Intelliflo: trustradius.com (£130-135/user)",
+    ]
+    for i, source in enumerate(sources, start=46):
+        ws_comp[f'A{i}'] = source
+        style(ws_comp[f'A{i}'], 'small')
+
+    # Column widths
+    ws_comp.column_dimensions['A'].width = 22
+    ws_comp.column_dimensions['B'].width = 15
+    ws_comp.column_dimensions['C'].width = 18
+    ws_comp.column_dimensions['D'].width = 12
+    ws_comp.column_dimensions['E'].width = 18
+
+
+def _build_revenue_calculator(wb, style):
+    """Sheet 3: revenue calculator"""
+    ws_calc = wb.create_sheet("Revenue Calculator")
+
+    ws_calc['A1'] = "REVENUE CALCULATOR"
+    style(ws_calc['A1'], 'title')
+    ws_calc.merge_cells('A1:G1')
+
+    # Input Section
+    ws_calc['A3'] = "INPUT PARAMETERS (Edit yellow cells)"
+    style(ws_calc['A3'], 'subheader')
+
+    ws_calc['A5'] = "Standard Monthly Rate (£)"
+    ws_calc['B5'] = 250
+    style(ws_calc['B5'], 'input', 'border', 'money')
+
+    ws_calc['A6'] = "Professional Monthly Rate (£)"
+    ws_calc['B6'] = 300
+    style(ws_calc['B6'], 'input', 'border', 'money')
+
+    ws_calc['A7'] = "Monthly Rate (no commitment) (£)"
+    ws_calc['B7'] = 350
+    style(ws_calc['B7'], 'input', 'border', 'money')
+
+    # Revenue by Number of Firms
+    ws_calc['A10'] = "REVENUE BY NUMBER OF FIRMS"
+    style(ws_calc['A10'], 'subheader')
+
+    calc_headers = ['# Firms', '£250/mo (2yr)', '£300/mo (2yr)', '£250/mo (3yr)', '£300/mo (3yr)', 'Difference', 'Avg MRR']
+    for col, header in enumerate(calc_headers, start=1):
+        style(ws_calc.cell(row=12, column=col, value=header), 'header', 'border', 'center')
+
+    firm_counts = [1, 2, 3, 4, 5, 10, 15, 20, 25, 50, 75, 100, 150, 200, 250, 300]
+    for row_idx, firms in enumerate(firm_counts, start=13):
+        # Even rows are banded up to (not including) the highlighted Difference column
+        alt = ('alt',) if row_idx % 2 == 0 else ()
+        style(ws_calc.cell(row=row_idx, column=1, value=firms), 'border', 'center', *alt)
+
+        # £250/mo 2yr
+        style(ws_calc.cell(row=row_idx, column=2, value=f'=A{row_idx}*$B$5*24'), 'border', 'money', *alt)
+
+        # £300/mo 2yr
+        style(ws_calc.cell(row=row_idx, column=3, value=f'=A{row_idx}*$B$6*24'), 'border', 'money', *alt)
+
+        # £250/mo 3yr
+        style(ws_calc.cell(row=row_idx, column=4, value=f'=A{row_idx}*$B$5*36'), 'border', 'money', *alt)
+
+        # £300/mo 3yr
+        style(ws_calc.cell(row=row_idx, column=5, value=f'=A{row_idx}*$B$6*36'), 'border', 'money', *alt)
+
+        # Difference
+        style(ws_calc.cell(row=row_idx, column=6, value=f'=E{row_idx}-B{row_idx}'), 'highlight', 'border', 'money')
+
+        # Avg MRR
+        style(ws_calc.cell(row=row_idx, column=7, value=f'=A{row_idx}*($B$5+$B$6)/2'), 'border', 'money')
+
+    # Column widths
+    for col in range(1, 8):
+        ws_calc.column_dimensions[get_column_letter(col)].width = 16
+
+
+def _build_growth_projections(wb, style):
+    """Sheet 4: growth projections (with chart)"""
+    from openpyxl.chart import Reference
+
+    ws_growth = wb.create_sheet("Growth Projections")
+
+    ws_growth['A1'] = "GROWTH PROJECTIONS"
+    style(ws_growth['A1'], 'title')
+    ws_growth.merge_cells('A1:F1')
+
+    # Input parameters
+    ws_growth['A3'] = "SCENARIO INPUTS (Edit yellow cells)"
+    style(ws_growth['A3'], 'subheader')
+
+    ws_growth['A5'] = "Monthly Rate (£)"
+    ws_growth['B5'] = 250
+    style(ws_growth['B5'], 'input', 'border', 'money')
+
+    ws_growth['A6'] = "Annual Churn Rate (%)"
+    ws_growth['B6'] = 0.05
+    style(ws_growth['B6'], 'input', 'border', 'percent')
+
+    # Conservative Growth
+    ws_growth['A9'] = "CONSERVATIVE (10 new firms/year)"
+    style(ws_growth['A9'], 'section')
+
+    growth_headers = ['Year', 'New Firms', 'Churn', 'Total Firms', 'MRR', 'ARR']
+    for col, header in enumerate(growth_headers, start=1):
+        style(ws_growth.cell(row=10, column=col, value=header), 'header', 'border', 'center')
+
+    conservative_new = [10, 10, 15, 20, 25]
+    for i, new_firms in enumerate(conservative_new):
+        row = 11 + i
+        style(ws_growth.cell(row=row, column=1, value=i+1), 'border', 'center')
+        style(ws_growth.cell(row=row, column=2, value=new_firms), 'border', 'center')
+        if i == 0:
+            style(ws_growth.cell(row=row, column=3, value=0), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=B{row}'), 'border', 'center')
+        else:
+            style(ws_growth.cell(row=row, column=3, value=f'=ROUND(D{row-1}*$B$6,0)'), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=D{row-1}+B{row}-C{row}'), 'border', 'center')
+        style(ws_growth.cell(row=row, column=5, value=f'=D{row}*$B$5'), 'border', 'center', 'money')
+        style(ws_growth.cell(row=row, column=6, value=f'=E{row}*12'), 'border', 'center', 'money')
+
+    # Moderate Growth
+    ws_growth['A18'] = "MODERATE (25 new firms/year)"
+    style(ws_growth['A18'], 'section')
+
+    for col, header in enumerate(growth_headers, start=1):
+        style(ws_growth.cell(row=19, column=col, value=header), 'header', 'border', 'center')
+
+    moderate_new = [25, 35, 45, 60, 75]
+    for i, new_firms in enumerate(moderate_new):
+        row = 20 + i
+        style(ws_growth.cell(row=row, column=1, value=i+1), 'border', 'center')
+        style(ws_growth.cell(row=row, column=2, value=new_firms), 'border', 'center')
+        if i == 0:
+            style(ws_growth.cell(row=row, column=3, value=0), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=B{row}'), 'border', 'center')
+        else:
+            style(ws_growth.cell(row=row, column=3, value=f'=ROUND(D{row-1}*$B$6,0)'), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=D{row-1}+B{row}-C{row}'), 'border', 'center')
+        style(ws_growth.cell(row=row, column=5, value=f'=D{row}*$B$5'), 'border', 'center', 'money')
+        style(ws_growth.cell(row=row, column=6, value=f'=E{row}*12'), 'border', 'center', 'money')
+
+    # Aggressive Growth
+    ws_growth['A27'] = "AGGRESSIVE (50 new firms/year)"
+    style(ws_growth['A27'], 'section')
+
+    for col, header in enumerate(growth_headers, start=1):
+        style(ws_growth.cell(row=28, column=col, value=header), 'header', 'border', 'center')
+
+    aggressive_new = [50, 70, 100, 130, 150]
+    for i, new_firms in enumerate(aggressive_new):
+        row = 29 + i
+        style(ws_growth.cell(row=row, column=1, value=i+1), 'border', 'center')
+        style(ws_growth.cell(row=row, column=2, value=new_firms), 'border', 'center')
+        if i == 0:
+            style(ws_growth.cell(row=row, column=3, value=0), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=B{row}'), 'border', 'center')
+        else:
+            style(ws_growth.cell(row=row, column=3, value=f'=ROUND(D{row-1}*$B$6,0)'), 'border', 'center')
+            style(ws_growth.cell(row=row, column=4, value=f'=D{row-1}+B{row}-C{row}'), 'border', 'center')
+        style(ws_growth.cell(row=row, column=5, value=f'=D{row}*$B$5'), 'border', 'center', 'money')
+        style(ws_growth.cell(row=row, column=6, value=f'=E{row}*12'), 'border', 'center', 'money')
+
+    # Create comparison table for chart
+    ws_growth['H3'] = "ARR Comparison (for chart)"
+    style(ws_growth['H3'], 'section')
+
+    chart_headers = ['Year', 'Conservative', 'Moderate', 'Aggressive']
+    for col, header in enumerate(chart_headers, start=8):
+        style(ws_growth.cell(row=4, column=col, value=header), 'header', 'border')
+
+    for i in range(5):
+        row = 5 + i
+        style(ws_growth.cell(row=row, column=8, value=i+1), 'border')
+        style(ws_growth.cell(row=row, column=9, value=f'=F{11+i}'), 'border', 'money')  # Conservative ARR
+        style(ws_growth.cell(row=row, column=10, value=f'=F{20+i}'), 'border', 'money')  # Moderate ARR
+        style(ws_growth.cell(row=row, column=11, value=f'=F{29+i}'), 'border', 'money')  # Aggressive ARR
+
+    # Add line chart for ARR projections
+    chart3 = MONEY_LINES.new("ARR Growth Projections", x_title="Year", y_title="Annual Recurring Revenue (£)",
+                             width=15, height=10)
+
+    data3 = Reference(ws_growth, min_col=9, min_row=4, max_col=11, max_row=9)
+    cats3 = Reference(ws_growth, min_col=8, min_row=5, max_row=9)
+    chart3.add_data(data3, titles_from_data=True)
+    chart3.set_categories(cats3)
+
+    ws_growth.add_chart(chart3, "H12")
+
+    # Column widths
+    for col in range(1, 12):
+        ws_growth.column_dimensions[get_column_letter(col)].width = 14
+
+
+def _build_roi_calculator(wb, style):
+    """Sheet 5: ROI calculator"""
+    from openpyxl.chart import Reference
+
+    ws_roi = wb.create_sheet("ROI Calculator")
+
+    ws_roi['A1'] = "CLIENT ROI CALCULATOR"
+    style(ws_roi['A1'], 'title')
+    ws_roi.merge_cells('A1:D1')
+
+    ws_roi['A2'] = "Calculate the ROI for your prospective clients"
+    style(ws_roi['A2'], 'small')
+
+    ws_roi['A4'] = "CURRENT TOOL COSTS (Edit yellow cells)"
+    style(ws_roi['A4'], 'subheader')
+
+    # Input section with verified defaults
+    inputs = [
+        ['Tool', 'Monthly Cost', 'Notes'],
+        ['CRM (generic)', 50, 'Salesforce/HubSpot equivalent'],
+        ['Risk Profiling Tool', 50, 'Dynamic Planner element'],
+        ['Cash Flow (Voyant)', 175, 'Verified Dec 2025'],
+        ['Monte Carlo (Timeline)', 162, 'Verified Dec 2025 (£135+VAT)'],
+        ['Document Generation', 50, 'Word templates/Templafy'],
+        ['E-Signatures', 23, 'DocuSign/Adobe Sign'],
+        ['Compliance Tracking', 50, 'Manual/specialist tool'],
+    ]
+
+    for row_idx, row_data in enumerate(inputs, start=6):
+        for col_idx, value in enumerate(row_data, start=1):
+            cell = ws_roi.cell(row=row_idx, column=col_idx, value=value)
+            if row_idx == 6:
+                style(cell, 'header', 'border')
+            elif col_idx == 2:
+                style(cell, 'normal', 'input', 'border', 'money')
+            else:
+                style(cell, 'normal', 'border')
+
+    # Total current cost
+    ws_roi['A14'] = "TOTAL CURRENT MONTHLY COST"
+    ws_roi['B14'] = '=SUM(B7:B13)'
+    style(ws_roi['A14'], 'bold', 'blue', 'border')
+    style(ws_roi['B14'], 'bold', 'blue', 'border', 'money')
+
+    # Time savings section
+    ws_roi['A17'] = "TIME SAVINGS (Edit yellow cells)"
+    style(ws_roi['A17'], 'subheader')
+
+    time_inputs = [
+        ['Metric', 'Value', 'Notes'],
+        ['Hours per client onboarding (current)', 15, 'Manual process'],
+        ['Time saved with Plannetic (%)', 0.6, '60% automation'],
+        ['Your hourly rate (£)', 100, 'Advisor charge-out rate'],
+        ['New clients per month', 4, 'Average new clients'],
+    ]
+
+    for row_idx, row_data in enumerate(time_inputs, start=19):
+        for col_idx, value in enumerate(row_data, start=1):
+            cell = ws_roi.cell(row=row_idx, column=col_idx, value=value)
+            if row_idx == 19:
+                style(cell, 'header', 'border')
+            elif col_idx == 2:
+                number_format = {21: ('percent',), 22: ('money',)}.get(row_idx, ())
+                style(cell, 'normal', 'input', 'border', *number_format)
+            else:
+                style(cell, 'normal', 'border')
+
+    # Plannetic cost
+    ws_roi['A26'] = "PLANNETIC COST"
+    style(ws_roi['A26'], 'subheader')
+
+    ws_roi['A28'] = "Plannetic Monthly Cost"
+    ws_roi['B28'] = 250
+    style(ws_roi['B28'], 'input', 'border', 'money')
+    style(ws_roi['A28'], 'border')
+
+    # Results section
+    ws_roi['A31'] = "ROI ANALYSIS"
+    style(ws_roi['A31'], 'subheader')
+
+    results = [
+        ['Metric', 'Monthly', 'Annual', 'Formula'],
+        ['Software Savings', '=B14-B28', '=B33*12', 'Current tools - Plannetic'],
+        ['Hours Saved per Client', '=B20*B21', '=B34*12', 'Hours × automation %'],
+        ['Clients per Month', '=B23', '=B35*12', 'From inputs'],
+        ['Total Hours Saved', '=B34*B35', '=B36*12', 'Hours × clients'],
+        ['Value of Time Saved', '=B36*B22', '=B37*12', 'Hours × rate'],
+        ['', '', '', ''],
+        ['TOTAL MONTHLY BENEFIT', '=B33+B37', '=B39*12', 'Software + time savings'],
+        ['Plannetic Cost', '=B28', '=B28*12', 'Your subscription'],
+        ['NET BENEFIT', '=B39-B40', '=B41*12', 'Benefit - cost'],
+        ['ROI %', '=B41/B40*100', '=C41/C40*100', '(Benefit-Cost)/Cost'],
+    ]
+
+    for row_idx, row_data in enumerate(results, start=33):
+        for col_idx, value in enumerate(row_data, start=1):
+            cell = ws_roi.cell(row=row_idx, column=col_idx, value=value)
+            if row_idx == 33:
+                style(cell, 'header', 'border')
+                continue
+            parts = ['border']
+            if col_idx in [2, 3] and value and value != '':
+                if row_idx == 44:  # ROI row
+                    parts.append('points_1dp')
+                elif row_idx in [35, 36, 37]:  # Hours
+                    parts.append('decimal')
+                else:
+                    parts.append('money')
+
+            # Highlight key rows
+            if row_idx in [39, 41, 43, 44]:
+                parts += ['highlight', 'bold']
+            else:
+                parts.append('normal')
+            style(cell, *parts)
+
+    # Add savings bar chart
+    chart4 = SAVINGS_COLUMNS.new("Monthly Savings Breakdown", width=10, height=8)
+
+    # Create data for chart
+    ws_roi['F33'] = "Category"
+    ws_roi['G33'] = "Value"
+    ws_roi['F34'] = "Software Savings"
+    ws_roi['G34'] = '=B33'
+    ws_roi['F35'] = "Time Value Saved"
+    ws_roi['G35'] = '=B37'
+    style(ws_roi['G34'], 'money')
+    style(ws_roi['G35'], 'money')
+
+    data4 = Reference(ws_roi, min_col=7, min_row=33, max_row=35)
+    cats4 = Reference(ws_roi, min_col=6, min_row=34, max_row=35)
+    chart4.add_data(data4, titles_from_data=True)
+    chart4.set_categories(cats4)
+
+    ws_roi.add_chart(chart4, "E17")
+
+    # Column widths
+    ws_roi.column_dimensions['A'].width = 32
+    ws_roi.column_dimensions['B'].width = 15
+    ws_roi.column_dimensions['C'].width = 15
+    ws_roi.column_dimensions['D'].width = 25
+
+
+def _build_tier_comparison(wb, style):
+    """Sheet 6: tier comparison"""
+    ws_tiers = wb.create_sheet("Tier Comparison")
+
+    ws_tiers['A1'] = "PLANNETIC PRICING TIERS"
+    style(ws_tiers['A1'], 'title')
+    ws_tiers.merge_cells('A1:D1')
+
+    tier_headers = ['Feature', 'Standard £250/mo', 'Professional £300/mo', 'Enterprise (Custom)']
+    for col, header in enumerate(tier_headers, start=1):
+        style(ws_tiers.cell(row=3, column=col, value=header), 'header', 'border', 'center')
+
+    features = [
+        ['CORE FEATURES', '', '', ''],
+        ['Client Management Hub', '✓', '✓', '✓'],
+        ['All 6 Assessment Types', '✓', '✓', '✓'],
+        ['Unlimited Clients', '✓', '✓', '✓'],
+        ['Document Generation', '✓', '✓', '✓'],
+        ['E-Signatures', 'Fair Use', 'Unlimited', 'Unlimited'],
+        ['FCA Compliance Registers', '✓', '✓', '✓'],
+        ['Consumer Duty Workflows', '✓', '✓', '✓'],
+        ['', '', '', ''],
+        ['PREMIUM FEATURES', '', '', ''],
+        ['AI Enhancement', '—', '✓', '✓'],
+        ['Priority Support (4hr SLA)', '—', '✓', '✓'],
+        ['Phone Support', '—', '✓', '✓'],
+        ['White-label Client Portal', '—', '✓', '✓'],
+        ['Advanced Analytics', '—', '✓', '✓'],
+        ['API Access', '—', '—', '✓'],
+        ['Custom Integrations', '—', '—', '✓'],
+        ['Dedicated Account Manager', '—', '—', '✓'],
+        ['', '', '', ''],
+        ['ONBOARDING', '', '', ''],
+        ['Data Migration', 'Self-serve', 'Assisted', 'Full Service'],
+        ['Training Sessions', '2 calls', '4 calls', 'Unlimited'],
+        ['', '', '', ''],
+        ['CONTRACT', '', '', ''],
+        ['Minimum Commitment', '2 years', '2 years', '3 years'],
+        ['2-Year TCV', '=250*24', '=300*24', 'Custom'],
+        ['3-Year TCV', '=250*36', '=300*36', 'Custom'],
+    ]
+
+    for row_idx, row_data in enumerate(features, start=4):
+        for col_idx, value in enumerate(row_data, start=1):
+            parts = ['border', 'center' if col_idx > 1 else 'left']
+
+            # Section headers
+            if value in ['CORE FEATURES', 'PREMIUM FEATURES', 'ONBOARDING', 'CONTRACT']:
+                parts += ['section', 'blue']
+            elif value == '✓':
+                parts.append('tick')
+            elif value == '—':
+                parts.append('dash')
+            else:
+                parts.append('normal')
+
+            # Number formatting for TCV
+            if row_idx in [29, 30] and col_idx in [2, 3]:
+                parts.append('money')
+            style(ws_tiers.cell(row=row_idx, column=col_idx, value=value), *parts)
+
+    # Column widths
+    ws_tiers.column_dimensions['A'].width = 28
+    ws_tiers.column_dimensions['B'].width = 20
+    ws_tiers.column_dimensions['C'].width = 20
+    ws_tiers.column_dimensions['D'].width = 20
@@ -0,0 +1,80 @@
+"""
+Vectorised revenue grid behind the Revenue Calculator
+
+Total contract value for every (firm count, monthly rate, contract term)
+combination is firms * rate * term, so the whole grid is one broadcast
+multiply. RevenueGrid keeps the three axes plus the per-firm TCV matrix
+(rates x terms) and materialises the full firms x rates x terms cube only
+when asked for it, so sweeping thousands of price/term combinations over
+firm counts up to 100,000 stays well under a second.
+
+    grid = revenue_grid(np.arange(1, 100_001), np.arange(150, 401, 5), [12, 24, 36, 48, 60])
+    grid.firms_needed(1_000_000)      # (rates, terms) firms to reach £1m TCV
+    grid.column(250, 24)              # TCV for every firm count at £250/mo, 2yr
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# Firm counts shown on the Revenue Calculator sheet
+DEFAULT_FIRM_COUNTS = (1, 2, 3, 4, 5, 10, 15, 20, 25, 50, 75, 100, 150, 200, 250, 300)
+
+
+@dataclass
+class RevenueGrid:
+    """TCV/MRR for every firm count x monthly rate x contract term"""
+
+    firm_counts: np.ndarray
+    rates: np.ndarray
+    terms: np.ndarray
+    per_firm_tcv: np.ndarray
+
+    @property
+    def shape(self):
+        return (len(self.firm_counts), len(self.rates), len(self.terms))
+
+    @property
+    def mrr(self):
+        """(firms, rates) monthly recurring revenue"""
+        return np.multiply.outer(self.firm_counts, self.rates)
+
+    @property
+    def tcv(self):
+        """(firms, rates, terms) total contract value - allocates the full cube"""
+        return np.multiply.outer(self.firm_counts, self.per_firm_tcv)
+
+    def _index(self, axis, value, name):
+        matches = np.flatnonzero(axis == value)
+        if not len(matches):
+            raise KeyError(f'{name} {value} is not on this grid')
+        return matches[0]
+
+    def column(self, rate, term):
+        """TCV for every firm count at one (rate, term)"""
+        r = self._index(self.rates, rate, 'rate')
+        t = self._index(self.terms, term, 'term')
+        return self.firm_counts * self.per_firm_tcv[r, t]
+
+    def difference(self, base, other):
+        """TCV of other minus base, each a (rate, term) pair, per firm count"""
+        return self.column(*other) - self.column(*base)
+
+    def avg_mrr(self, rates=None):
+        """MRR per firm count assuming an even mix of the given rates"""
+        rates = self.rates if rates is None else np.asarray(rates, dtype=self.rates.dtype)
+        return self.firm_counts * rates.mean()
+
+    def firms_needed(self, target_tcv):
+        """(rates, terms) smallest firm count whose TCV reaches target_tcv"""
+        return np.ceil(target_tcv / self.per_firm_tcv).astype(np.int64)
+
+
+def revenue_grid(firm_counts=DEFAULT_FIRM_COUNTS, rates=(250, 300), terms=(24, 36), dtype=np.float64):
+    """Build a RevenueGrid over the given axes"""
+    firm_counts = np.asarray(firm_counts, dtype=dtype)
+    rates = np.asarray(rates, dtype=dtype)
+    terms = np.asarray(terms, dtype=dtype)
+    if firm_counts.ndim != 1 or rates.ndim != 1 or terms.ndim != 1:
+        raise ValueError('firm_counts, rates and terms must be 1-D')
+    return RevenueGrid(firm_counts, rates, terms, np.multiply.outer(rates, terms))
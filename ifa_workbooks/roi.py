@@ -0,0 +1,105 @@
+"""
+Price-sensitivity and break-even solver for the ROI Calculator
+
+The ROI Calculator sheet evaluates one input set:
+
+    software savings = tool costs - price
+    time value       = hours per client * time saved * hourly rate * clients
+    net benefit      = software savings + time value - price
+    ROI %            = net benefit / price * 100
+
+Net benefit is linear in the Plannetic price and in clients per month, so
+the break-even price and the fewest clients for a positive ROI have closed
+forms, and ROI over a whole (price, clients) grid is one broadcast:
+
+    surface = roi_surface(560, 15, 0.6, 100)
+    surface.roi                     # (prices, clients) ROI %
+    surface.break_even_prices()     # (clients,) price where net benefit is 0
+    surface.min_clients()           # (prices,) whole clients for ROI > 0
+
+Every input may also be an array over prospects; results then gain a
+leading prospect axis, so thousands of prospects are solved in one call.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# Grids the solver covers by default: 101 prices x 30 client counts
+PRICE_GRID = np.arange(100, 601, 5)
+CLIENT_GRID = np.arange(1, 31)
+
+
+def value_per_client(hours_per_client, time_saved_pct, hourly_rate):
+    """Monthly value of the adviser time saved per new client"""
+    return np.asarray(hours_per_client, dtype=np.float64) * time_saved_pct * hourly_rate
+
+
+def net_benefit(tool_costs, per_client, clients, price):
+    """Monthly net benefit as the sheet computes it (price counted in savings and cost)"""
+    return tool_costs + per_client * clients - 2 * price
+
+
+def break_even_price(tool_costs, per_client, clients):
+    """Plannetic price at which net benefit is exactly 0"""
+    return (tool_costs + per_client * clients) / 2
+
+
+def min_clients(tool_costs, per_client, price):
+    """
+    Fewest whole clients per month with a positive net benefit; inf when
+    no number of clients gets there (no time value and software savings
+    alone do not cover the price).
+    """
+    tool_costs, per_client, price = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64)
+                                                          for v in (tool_costs, per_client, price)))
+    shortfall = 2 * price - tool_costs
+    with np.errstate(divide='ignore', invalid='ignore'):
+        needed = np.maximum(np.floor(shortfall / per_client) + 1, 0)
+    return np.where(per_client > 0, needed, np.where(shortfall < 0, 0, np.inf))
+
+
+@dataclass
+class RoiSurface:
+    """Net benefit and ROI over a price x clients grid, per prospect"""
+
+    prices: np.ndarray          # (P,)
+    clients: np.ndarray         # (C,)
+    tool_costs: np.ndarray      # () or (prospects,)
+    per_client: np.ndarray      # () or (prospects,)
+
+    @property
+    def net(self):
+        """(..., P, C) monthly net benefit"""
+        return net_benefit(self.tool_costs[..., None, None], self.per_client[..., None, None],
+                           self.clients[None, :], self.prices[:, None])
+
+    @property
+    def roi(self):
+        """(..., P, C) ROI %"""
+        return self.net / self.prices[:, None] * 100
+
+    def break_even_prices(self):
+        """(..., C) break-even price at each client count"""
+        return break_even_price(self.tool_costs[..., None], self.per_client[..., None], self.clients)
+
+    def min_clients(self):
+        """(..., P) fewest whole clients for a positive ROI at each price"""
+        return min_clients(self.tool_costs[..., None], self.per_client[..., None], self.prices)
+
+
+def roi_surface(tool_costs, hours_per_client, time_saved_pct, hourly_rate, prices=PRICE_GRID, clients=CLIENT_GRID):
+    """
+    Build the RoiSurface for one prospect (scalars) or many (1-D arrays of
+    equal length). tool_costs is the total monthly cost of the current tool
+    stack (the sheet's TOTAL CURRENT MONTHLY COST).
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    clients = np.asarray(clients, dtype=np.float64)
+    if prices.ndim != 1 or clients.ndim != 1:
+        raise ValueError('prices and clients must be 1-D')
+    if (prices <= 0).any():
+        raise ValueError('prices must be positive')
+    tool_costs, per_client = np.broadcast_arrays(np.asarray(tool_costs, dtype=np.float64),
+                                                 value_per_client(hours_per_client, time_saved_pct, hourly_rate))
+    return RoiSurface(prices, clients, tool_costs, per_client)
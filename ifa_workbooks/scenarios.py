@@ -0,0 +1,317 @@
+"""
+Versioned pricing scenario store
+
+A pricing scenario is one full set of pack inputs: the prospect's ROI
+Calculator inputs, the tier prices, the competitor stack headline and the
+Growth Projections assumptions. Each generation of script hard-coded its
+own (the v1 analysis quotes a £420 competitor stack, v2 and v3 £530).
+This module keeps every scenario ever recorded in an append-only SQLite
+store, with the script version that produced it and its outputs:
+
+    conn = connect('scenarios.db')
+    create_schema(conn)
+    record_scenario(conn, 'v3 pack', ScenarioInputs(), source='ifa-platform/create-pricing-excel-v3.py')
+    comparison = compare_scenarios(conn, ['v1 analysis', 'v3 pack', 'v3 pack@1'])
+    comparison.column('net_annual')          # one value per scenario
+    comparison.delta()                       # every output minus the first scenario's
+
+Recording a name again adds a new version; nothing is ever updated or
+deleted (triggers refuse it), so any earlier version can still be
+compared. Outputs are computed once, when a scenario is recorded, from
+the same model the sheets use (roi.py, the Growth Projections churn
+recurrence, the Tier Comparison TCVs) and stored as one float64 vector per
+scenario. Comparing N scenarios reads N vectors into an (N, outputs)
+array; no workbook is built or evaluated.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+import numpy as np
+
+from .cache import PACKAGE_DIR, source_fingerprint
+from .growth import DEFAULT_ANNUAL_CHURN, DEFAULT_MONTHLY_RATE, GROWTH_SCENARIOS, year_end_firms
+from .pricing import TOOL_STACK, ProspectParams
+from .roi import break_even_price, min_clients, net_benefit, value_per_client
+from .tiers import TIER_PRICES
+
+# SQLite file the generator scripts record their scenario in (nothing recorded when unset)
+SCENARIO_STORE_ENV = 'IFA_SCENARIO_STORE'
+
+GROWTH_YEARS = 5
+CONTRACT_TERMS = (24, 36)
+
+# Order of the stored output vectors. Changing it means a new OUTPUT_MODEL:
+# vectors are stored per model, and compare_scenarios() computes the
+# current model's vectors for scenarios recorded before it
+OUTPUT_NAMES = (
+    ('current_tool_cost', 'software_savings', 'time_value', 'net_monthly', 'net_annual', 'roi_pct',
+     'break_even_price', 'min_clients', 'competitor_saving')
+    + tuple(f'{tier}_tcv_{term}m' for tier in TIER_PRICES for term in CONTRACT_TERMS)
+    + tuple(f'{scenario.lower()}_{measure}_y{year}' for scenario in GROWTH_SCENARIOS
+            for measure in ('firms', 'arr') for year in range(1, GROWTH_YEARS + 1))
+)
+OUTPUT_MODEL = 'outputs-1'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pricing_scenarios (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    inputs TEXT NOT NULL,            -- canonical JSON of ScenarioInputs
+    inputs_hash TEXT NOT NULL,
+    source TEXT,                     -- script (or inputs file) that produced the inputs
+    source_version TEXT,             -- digest of that script and the ifa_workbooks modules
+    recorded_at TEXT NOT NULL,
+    UNIQUE (name, version)
+);
+
+CREATE TABLE IF NOT EXISTS pricing_scenario_outputs (
+    scenario_id INTEGER NOT NULL REFERENCES pricing_scenarios (id),
+    model TEXT NOT NULL,             -- OUTPUT_MODEL the vector follows
+    vector BLOB NOT NULL,            -- float64 per OUTPUT_NAMES, NaN where undefined
+    PRIMARY KEY (scenario_id, model)
+);
+
+CREATE INDEX IF NOT EXISTS idx_pricing_scenarios_hash ON pricing_scenarios (inputs_hash);
+
+CREATE TRIGGER IF NOT EXISTS pricing_scenarios_no_update BEFORE UPDATE ON pricing_scenarios
+BEGIN SELECT RAISE(ABORT, 'pricing_scenarios is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS pricing_scenarios_no_delete BEFORE DELETE ON pricing_scenarios
+BEGIN SELECT RAISE(ABORT, 'pricing_scenarios is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS pricing_scenario_outputs_no_update BEFORE UPDATE ON pricing_scenario_outputs
+BEGIN SELECT RAISE(ABORT, 'pricing_scenario_outputs is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS pricing_scenario_outputs_no_delete BEFORE DELETE ON pricing_scenario_outputs
+BEGIN SELECT RAISE(ABORT, 'pricing_scenario_outputs is append-only'); END;
+"""
+
+
+@dataclass
+class ScenarioInputs:
+    """Every input a pricing pack's figures depend on"""
+
+    prospect: ProspectParams = field(default_factory=ProspectParams)
+    tier_prices: dict = field(default_factory=lambda: dict(TIER_PRICES))
+    competitor_stack_cost: float = 530     # the Summary's "Competitor Stack" headline
+    monthly_rate: float = DEFAULT_MONTHLY_RATE
+    annual_churn: float = DEFAULT_ANNUAL_CHURN
+    growth: dict = field(default_factory=lambda: {name: list(new) for name, new in GROWTH_SCENARIOS.items()})
+
+    def __post_init__(self):
+        if isinstance(self.prospect, dict):
+            self.prospect = ProspectParams(**self.prospect)
+        if set(self.tier_prices) != set(TIER_PRICES):
+            raise ValueError(f'tier_prices must price exactly {sorted(TIER_PRICES)}')
+        if set(self.growth) != set(GROWTH_SCENARIOS):
+            raise ValueError(f'growth must give new firms per year for exactly {sorted(GROWTH_SCENARIOS)}')
+        for name, new in self.growth.items():
+            if len(new) != GROWTH_YEARS:
+                raise ValueError(f"growth['{name}'] must give {GROWTH_YEARS} years of new firms")
+            self.growth[name] = [float(n) for n in new]
+
+    def to_json(self):
+        """Canonical JSON: equal inputs always give equal text (and hash)"""
+        return json.dumps(dataclasses.asdict(self), sort_keys=True, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text):
+        return cls(**json.loads(text))
+
+
+# The literal inputs of each generation of pricing script, as first recorded
+GENERATION_SCENARIOS = {
+    'v1 analysis': ('ifa-platform/plannetic-pricing-analysis.py', ScenarioInputs(
+        prospect=ProspectParams(tool_costs={'crm': 50, 'risk_profiling': 50, 'cash_flow': 100, 'monte_carlo': 100,
+                                            'document_generation': 50, 'e_signatures': 20,
+                                            'compliance_tracking': 50}),
+        competitor_stack_cost=420,
+    )),
+    'v2 pack': ('ifa-platform/create-pricing-excel-v2.py', ScenarioInputs()),
+    'v3 pack': ('ifa-platform/create-pricing-excel-v3.py', ScenarioInputs()),
+}
+
+
+def scenario_outputs(inputs):
+    """The OUTPUT_NAMES vector for one ScenarioInputs"""
+    p = inputs.prospect
+    tools = float(sum(p.tool_costs.get(key, cost) for key, _, cost, _ in TOOL_STACK))
+    per_client = value_per_client(p.hours_per_client, p.time_saved_pct, p.hourly_rate)
+    net = net_benefit(tools, per_client, p.clients_per_month, p.plannetic_cost)
+    values = [tools, tools - p.plannetic_cost, per_client * p.clients_per_month, net, net * 12,
+              net / p.plannetic_cost * 100 if p.plannetic_cost else np.nan,
+              break_even_price(tools, per_client, p.clients_per_month),
+              min_clients(tools, per_client, p.plannetic_cost),
+              inputs.competitor_stack_cost - inputs.tier_prices['standard']]
+    values += [inputs.tier_prices[tier] * term for tier in TIER_PRICES for term in CONTRACT_TERMS]
+    for scenario in GROWTH_SCENARIOS:
+        _, firms = year_end_firms(inputs.growth[scenario], inputs.annual_churn)
+        values += list(firms) + list(firms * inputs.monthly_rate * 12)
+    vector = np.array(values, dtype=np.float64)
+    vector[np.isinf(vector)] = np.nan
+    return vector
+
+
+def source_version(path):
+    """Digest of a script and the ifa_workbooks modules it builds with"""
+    return source_fingerprint([path] + [os.path.join(PACKAGE_DIR, name) for name in os.listdir(PACKAGE_DIR)
+                                        if name.endswith('.py')])[:16]
+
+
+def connect(path):
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    return conn
+
+
+def create_schema(conn):
+    conn.executescript(SCHEMA)
+    conn.commit()
+
+
+def record_scenario(conn, name, inputs, source=None, recorded_at=None):
+    """
+    Append inputs as the next version of name and store its outputs.
+    Returns the scenario id; when the latest version of name already has
+    these inputs from the same source version, that version's id instead.
+    """
+    text = inputs.to_json()
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    relative = version = None    # source path (relative inside the repo) and its version
+    if source is not None:
+        relative = os.path.abspath(source)
+        root = os.path.dirname(PACKAGE_DIR)
+        if os.path.commonpath([relative, root]) == root:
+            relative = os.path.relpath(relative, root)
+        version = source_version(source)
+    with conn:
+        latest = conn.execute('SELECT id, version, inputs_hash, source_version FROM pricing_scenarios '
+                              'WHERE name = ? ORDER BY version DESC LIMIT 1', (name,)).fetchone()
+        if latest is not None and latest[2] == digest and latest[3] == version:
+            return latest[0]
+        recorded_at = recorded_at or datetime.now(timezone.utc).isoformat(timespec='seconds')
+        cursor = conn.execute(
+            'INSERT INTO pricing_scenarios (name, version, inputs, inputs_hash, source, source_version, recorded_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (name, latest[1] + 1 if latest else 1, text, digest, relative, version, recorded_at))
+        conn.execute('INSERT INTO pricing_scenario_outputs (scenario_id, model, vector) VALUES (?, ?, ?)',
+                     (cursor.lastrowid, OUTPUT_MODEL, scenario_outputs(inputs).tobytes()))
+    return cursor.lastrowid
+
+
+def record_from_env(name, inputs, source):
+    """Record in the store named by IFA_SCENARIO_STORE; None when it is unset"""
+    path = os.environ.get(SCENARIO_STORE_ENV)
+    if not path:
+        return None
+    conn = connect(path)
+    try:
+        create_schema(conn)
+        return record_scenario(conn, name, inputs, source)
+    finally:
+        conn.close()
+
+
+def record_generations(conn):
+    """Record each script generation's literal inputs (GENERATION_SCENARIOS); returns their ids"""
+    root = os.path.dirname(PACKAGE_DIR)
+    ids = {}
+    for name, (script, inputs) in GENERATION_SCENARIOS.items():
+        path = os.path.join(root, script)
+        ids[name] = record_scenario(conn, name, inputs, source=path if os.path.exists(path) else None)
+    return ids
+
+
+def scenario_history(conn, name=None):
+    """(id, name, version, source, source_version, recorded_at) rows, oldest first"""
+    where, params = ('WHERE name = ?', (name,)) if name is not None else ('', ())
+    return conn.execute(f'SELECT id, name, version, source, source_version, recorded_at FROM pricing_scenarios '
+                        f'{where} ORDER BY name, version', params).fetchall()
+
+
+def load_inputs(conn, scenario_id):
+    row = conn.execute('SELECT inputs FROM pricing_scenarios WHERE id = ?', (scenario_id,)).fetchone()
+    if row is None:
+        raise KeyError(f'no pricing scenario {scenario_id}')
+    return ScenarioInputs.from_json(row[0])
+
+
+def resolve_scenarios(conn, refs):
+    """
+    Scenario ids for refs: an int id, 'name' (its latest version) or
+    'name@version'
+    """
+    ids = []
+    for ref in refs:
+        if isinstance(ref, int):
+            row = conn.execute('SELECT id FROM pricing_scenarios WHERE id = ?', (ref,)).fetchone()
+        elif '@' in ref and ref.rsplit('@', 1)[1].isdigit():
+            name, version = ref.rsplit('@', 1)
+            row = conn.execute('SELECT id FROM pricing_scenarios WHERE name = ? AND version = ?',
+                               (name, int(version))).fetchone()
+        else:
+            row = conn.execute('SELECT id FROM pricing_scenarios WHERE name = ? ORDER BY version DESC LIMIT 1',
+                               (ref,)).fetchone()
+        if row is None:
+            raise KeyError(f"no pricing scenario '{ref}'")
+        ids.append(row[0])
+    return ids
+
+
+@dataclass
+class ScenarioComparison:
+    """Outputs of N scenarios side by side"""
+
+    ids: list
+    labels: list            # 'name@version' per scenario
+    outputs: np.ndarray     # (N, len(OUTPUT_NAMES))
+
+    def column(self, output):
+        """One output across all the scenarios"""
+        return self.outputs[:, OUTPUT_NAMES.index(output)]
+
+    def delta(self, baseline=0):
+        """(N, outputs) difference from the scenario at index baseline"""
+        return self.outputs - self.outputs[baseline]
+
+    def changed(self, baseline=0, tolerance=1e-9):
+        """Names of the outputs that differ from the baseline in any scenario"""
+        same = np.isclose(self.outputs, self.outputs[baseline], rtol=0, atol=tolerance, equal_nan=True)
+        return [name for name, moved in zip(OUTPUT_NAMES, (~same).any(axis=0)) if moved]
+
+    def rank(self, output, descending=True):
+        """Scenario labels ordered by one output (NaN last)"""
+        values = self.column(output)
+        order = np.argsort(np.where(np.isnan(values), -np.inf if descending else np.inf, values), kind='stable')
+        return [self.labels[i] for i in (order[::-1] if descending else order)]
+
+
+def compare_scenarios(conn, refs):
+    """
+    Side-by-side outputs of the scenarios in refs (see resolve_scenarios),
+    in that order. Scenarios recorded under an older OUTPUT_MODEL get the
+    current model's vector computed from their inputs and appended.
+    """
+    ids = resolve_scenarios(conn, refs)
+    conn.execute('CREATE TEMP TABLE IF NOT EXISTS compare_ids (position INTEGER PRIMARY KEY, scenario_id INTEGER)')
+    with conn:
+        conn.execute('DELETE FROM compare_ids')
+        conn.executemany('INSERT INTO compare_ids VALUES (?, ?)', enumerate(ids))
+        rows = conn.execute(
+            'SELECT c.position, s.id, s.name, s.version, o.vector FROM compare_ids c '
+            'JOIN pricing_scenarios s ON s.id = c.scenario_id '
+            'LEFT JOIN pricing_scenario_outputs o ON o.scenario_id = s.id AND o.model = ? '
+            'ORDER BY c.position', (OUTPUT_MODEL,)).fetchall()
+        outputs = np.empty((len(rows), len(OUTPUT_NAMES)))
+        for position, scenario_id, _, _, vector in rows:
+            if vector is None:
+                outputs[position] = scenario_outputs(load_inputs(conn, scenario_id))
+                conn.execute('INSERT OR IGNORE INTO pricing_scenario_outputs (scenario_id, model, vector) '
+                             'VALUES (?, ?, ?)', (scenario_id, OUTPUT_MODEL, outputs[position].tobytes()))
+            else:
+                outputs[position] = np.frombuffer(vector, dtype=np.float64)
+    return ScenarioComparison(ids, [f'{name}@{version}' for _, _, name, version, _ in rows], outputs)
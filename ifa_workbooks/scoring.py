@@ -0,0 +1,291 @@
+"""
+Bulk ROI scoring of a prospect database
+
+The ROI Calculator sheet scores one prospect; score_prospects() applies the
+same model (roi.py) to every firm in a prospect table and ranks them by net
+annual benefit. The table is a local SQLite stand-in for the platform's
+firm_profiles table (database/migration_fix.sql), with the ROI Calculator
+inputs added as columns named like the batch CSV fields (batch.py). A NULL
+input takes the ProspectParams default, and a NULL plannetic_cost the
+price of the firm's tier.
+
+The pipeline never holds the table in Python:
+
+    1. one SELECT is stepped through with fetchmany(chunk_size), so SQLite
+       hands over rows as they are read, like a server-side cursor
+    2. each chunk becomes NumPy columns and is scored in one vector pass
+    3. the scores are bulk-inserted with executemany into
+       prospect_roi_scores, in the same transaction
+
+    with connect('prospects.db') as conn:
+        create_schema(conn)
+        result = score_prospects(conn)
+        top_prospects(conn, 20)           # best net annual benefit first
+        prospect_rank(conn, firm_id)
+
+Ranks are not stored: they are read off the index on net_annual, so
+rescoring a few firms never renumbers the rest.
+"""
+
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+
+from .pricing import TOOL_STACK, ProspectParams
+from .roi import break_even_price, min_clients, net_benefit, value_per_client
+from .tiers import TIER_PRICES
+
+# Rows fetched, scored and inserted per round trip
+DEFAULT_CHUNK_SIZE = 50_000
+
+TOOL_KEYS = tuple(key for key, _, _, _ in TOOL_STACK)
+_DEFAULTS = ProspectParams()
+_TOOL_COLUMNS = ''.join(f'    {key} REAL,\n' for key in TOOL_KEYS)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS firm_profiles (
+    id TEXT PRIMARY KEY,
+    firm_id TEXT NOT NULL UNIQUE,
+    firm_name TEXT NOT NULL,
+    primary_sectors TEXT DEFAULT '[]',
+    firm_size TEXT DEFAULT 'Medium',
+    fca_reference TEXT,
+    regulatory_status TEXT DEFAULT 'Authorised',
+    permissions TEXT DEFAULT '[]',
+    business_address TEXT,
+    contact_email TEXT,
+    contact_phone TEXT,
+    website_url TEXT,
+    client_ref_prefix TEXT DEFAULT 'CLI',
+    default_review_frequency INTEGER DEFAULT 12,
+    vulnerability_review_frequency INTEGER DEFAULT 6,
+    consumer_duty_enabled INTEGER DEFAULT 1,
+    auto_vulnerability_alerts INTEGER DEFAULT 1,
+    mandatory_annual_reviews INTEGER DEFAULT 1,
+    -- ROI Calculator inputs; NULL uses the ProspectParams default
+{_TOOL_COLUMNS}    hours_per_client REAL,
+    time_saved_pct REAL,
+    hourly_rate REAL,
+    clients_per_month REAL,
+    tier TEXT DEFAULT 'standard',
+    plannetic_cost REAL,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS prospect_roi_scores (
+    firm_id TEXT NOT NULL,       -- firm_profiles.firm_id
+    plannetic_cost REAL NOT NULL,
+    current_tool_cost REAL NOT NULL,
+    software_savings REAL NOT NULL,
+    time_value REAL NOT NULL,
+    net_monthly REAL NOT NULL,
+    net_annual REAL NOT NULL,
+    roi_pct REAL,                -- NULL when plannetic_cost is 0
+    break_even_price REAL NOT NULL,
+    min_clients INTEGER,         -- NULL when no client count reaches a positive ROI
+    scored_at TEXT NOT NULL
+);
+"""
+
+# Dropped while a full run loads the scores and rebuilt once at the end:
+# one sort is far cheaper than a million random B-tree inserts
+SCORE_INDEXES = {
+    'idx_prospect_roi_scores_firm_id':
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_prospect_roi_scores_firm_id ON prospect_roi_scores (firm_id)',
+    'idx_prospect_roi_scores_net_annual':
+        'CREATE INDEX IF NOT EXISTS idx_prospect_roi_scores_net_annual ON prospect_roi_scores (net_annual DESC, firm_id)',
+}
+
+SCORE_COLUMNS = ('firm_id', 'plannetic_cost', 'current_tool_cost', 'software_savings', 'time_value',
+                 'net_monthly', 'net_annual', 'roi_pct', 'break_even_price', 'min_clients', 'scored_at')
+
+
+def _input_select(where=''):
+    """SELECT of firm_id and the ROI inputs with the defaults filled in by SQLite"""
+    tier_price = ' '.join(f"WHEN '{tier}' THEN {price}" for tier, price in TIER_PRICES.items())
+    # The model only needs the stack's total, so SQLite adds it up
+    columns = [' + '.join(f'COALESCE({key}, {cost})' for key, _, cost, _ in TOOL_STACK)]
+    columns += [f'COALESCE({name}, {getattr(_DEFAULTS, name)})'
+                for name in ('hours_per_client', 'time_saved_pct', 'hourly_rate', 'clients_per_month')]
+    columns.append(f"COALESCE(plannetic_cost, CASE COALESCE(tier, '{_DEFAULTS.tier}') {tier_price} END)")
+    return f"SELECT firm_id, {', '.join(columns)} FROM firm_profiles {where}"
+
+
+@dataclass
+class ScoreResult:
+    """What score_prospects() wrote"""
+
+    scored: int
+    skipped: list     # firm_ids whose tier is unknown and plannetic_cost is NULL
+    seconds: float
+
+    @property
+    def rows_per_second(self):
+        return self.scored / self.seconds if self.seconds else 0.0
+
+
+def connect(path):
+    """Open a prospect database tuned for bulk scoring (WAL, relaxed fsync)"""
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+def create_schema(conn):
+    conn.executescript(SCHEMA)
+    for statement in SCORE_INDEXES.values():
+        conn.execute(statement)
+    conn.commit()
+
+
+def _nullable(values, dtype=np.float64):
+    """values as a list for executemany, NaN and inf as None (NULL)"""
+    finite = np.isfinite(values)
+    values = np.where(finite, values, 0).astype(dtype).tolist()
+    if finite.all():
+        return values
+    return [v if ok else None for v, ok in zip(values, finite.tolist())]
+
+
+def score_chunk(rows, scored_at):
+    """
+    Score one fetchmany() chunk of _input_select() rows. Returns the
+    prospect_roi_scores rows (as SCORE_COLUMNS tuples) and the firm_ids
+    that could not be priced.
+    """
+    firm_ids = [row[0] for row in rows]
+    # None (an unknown tier with no explicit price) becomes NaN
+    inputs = np.array([row[1:] for row in rows], dtype=np.float64)
+    tools, hours, saved, rate, clients, price = inputs.T
+
+    unpriced = np.isnan(price)
+    skipped = [firm_ids[i] for i in np.flatnonzero(unpriced)]
+    if skipped:
+        keep = ~unpriced
+        firm_ids = [firm_ids[i] for i in np.flatnonzero(keep)]
+        tools, hours, saved, rate, clients, price = (a[keep] for a in (tools, hours, saved, rate, clients, price))
+
+    per_client = value_per_client(hours, saved, rate)
+    net = net_benefit(tools, per_client, clients, price)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi = np.where(price > 0, net / price * 100, np.nan)
+    fewest = min_clients(tools, per_client, price)
+
+    columns = [c.tolist() for c in (price, tools, tools - price, per_client * clients, net, net * 12)]
+    columns += [_nullable(roi), break_even_price(tools, per_client, clients).tolist(), _nullable(fewest, np.int64)]
+    stamps = [scored_at] * len(firm_ids)
+    return list(zip(firm_ids, *columns, stamps)), skipped
+
+
+def score_prospects(conn, chunk_size=DEFAULT_CHUNK_SIZE, firm_ids=None, scored_at=None):
+    """
+    Score every firm in firm_profiles into prospect_roi_scores, replacing
+    all earlier scores, or only firm_ids, replacing just theirs. Runs in one
+    transaction; returns a ScoreResult.
+    """
+    start = time.perf_counter()
+    scored_at = scored_at or datetime.now(timezone.utc).isoformat(timespec='seconds')
+    insert = (f"INSERT OR REPLACE INTO prospect_roi_scores ({', '.join(SCORE_COLUMNS)}) "
+              f"VALUES ({', '.join('?' * len(SCORE_COLUMNS))})")
+    reader = conn.cursor()
+    scored = 0
+    skipped = []
+    with conn:
+        if firm_ids is None:
+            for name in SCORE_INDEXES:
+                conn.execute(f'DROP INDEX IF EXISTS {name}')
+            conn.execute('DELETE FROM prospect_roi_scores')
+            reader.execute(_input_select())
+        else:
+            conn.execute('CREATE TEMP TABLE IF NOT EXISTS score_firm_ids (firm_id TEXT PRIMARY KEY)')
+            conn.execute('DELETE FROM score_firm_ids')
+            conn.executemany('INSERT OR IGNORE INTO score_firm_ids VALUES (?)', ((f,) for f in firm_ids))
+            conn.execute('DELETE FROM prospect_roi_scores WHERE firm_id IN (SELECT firm_id FROM score_firm_ids)')
+            reader.execute(_input_select('WHERE firm_id IN (SELECT firm_id FROM score_firm_ids)'))
+        while True:
+            rows = reader.fetchmany(chunk_size)
+            if not rows:
+                break
+            scores, unpriced = score_chunk(rows, scored_at)
+            conn.executemany(insert, scores)
+            scored += len(scores)
+            skipped.extend(unpriced)
+        reader.close()
+        for statement in SCORE_INDEXES.values():
+            conn.execute(statement)
+    return ScoreResult(scored, skipped, time.perf_counter() - start)
+
+
+def top_prospects(conn, limit=20, offset=0):
+    """
+    Prospects ranked by net annual benefit (rank 1 is the best), as dicts
+    with the firm's name, rank and scores. Walks the net_annual index, so a
+    page costs the same however many firms were scored.
+    """
+    cursor = conn.execute(
+        'SELECT f.firm_name, s.* FROM prospect_roi_scores s JOIN firm_profiles f USING (firm_id) '
+        'ORDER BY s.net_annual DESC, s.firm_id LIMIT ? OFFSET ?', (limit, offset))
+    names = [d[0] for d in cursor.description]
+    return [{'rank': offset + i + 1, **dict(zip(names, row))} for i, row in enumerate(cursor)]
+
+
+def prospect_rank(conn, firm_id):
+    """Rank of one scored firm by net annual benefit, or None if it has no score"""
+    row = conn.execute('SELECT net_annual FROM prospect_roi_scores WHERE firm_id = ?', (firm_id,)).fetchone()
+    if row is None:
+        return None
+    (ahead,), = conn.execute('SELECT COUNT(*) FROM prospect_roi_scores WHERE net_annual > ? '
+                             'OR (net_annual = ? AND firm_id < ?)', (row[0], row[0], firm_id))
+    return ahead + 1
+
+
+def import_prospects(conn, prospects):
+    """Insert ProspectParams (e.g. from batch.load_prospects) as firm_profiles rows; returns their firm_ids"""
+    firm_ids = [str(uuid.uuid4()) for _ in prospects]
+    columns = ('id', 'firm_id', 'firm_name') + TOOL_KEYS + (
+        'hours_per_client', 'time_saved_pct', 'hourly_rate', 'clients_per_month', 'tier', 'plannetic_cost')
+    rows = (
+        (str(uuid.uuid4()), firm_id, params.firm_name or f'Prospect {i + 1}',
+         *(params.tool_costs.get(key) for key in TOOL_KEYS),
+         params.hours_per_client, params.time_saved_pct, params.hourly_rate, params.clients_per_month,
+         params.tier, params.plannetic_cost)
+        for i, (firm_id, params) in enumerate(zip(firm_ids, prospects))
+    )
+    with conn:
+        conn.executemany(f"INSERT INTO firm_profiles ({', '.join(columns)}) "
+                         f"VALUES ({', '.join('?' * len(columns))})", rows)
+    return firm_ids
+
+
+def insert_demo_prospects(conn, count, seed=0, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Fill firm_profiles with count synthetic prospects (for demos and timing)"""
+    rng = np.random.default_rng(seed)
+    tiers = np.array(list(TIER_PRICES))
+    columns = ('id', 'firm_id', 'firm_name', 'firm_size') + TOOL_KEYS + (
+        'hours_per_client', 'time_saved_pct', 'hourly_rate', 'clients_per_month', 'tier')
+    insert = f"INSERT INTO firm_profiles ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    sizes = np.array(['Small', 'Medium', 'Large'])
+    with conn:
+        for offset in range(0, count, chunk_size):
+            n = min(chunk_size, count - offset)
+            ids = rng.bytes(32 * n)
+            tool_costs = [np.round(cost * rng.uniform(0, 1.5, n)).tolist() for _, _, cost, _ in TOOL_STACK]
+            rows = zip(
+                (str(uuid.UUID(bytes=ids[i * 32:i * 32 + 16], version=4)) for i in range(n)),
+                (str(uuid.UUID(bytes=ids[i * 32 + 16:i * 32 + 32], version=4)) for i in range(n)),
+                (f'Prospect {offset + i + 1}' for i in range(n)),
+                sizes[rng.integers(0, 3, n)].tolist(),
+                *tool_costs,
+                rng.integers(8, 25, n).astype(float).tolist(),
+                np.round(rng.uniform(0.3, 0.8, n), 2).tolist(),
+                rng.choice([75.0, 100.0, 125.0, 150.0], n).tolist(),
+                rng.integers(1, 11, n).astype(float).tolist(),
+                tiers[rng.integers(0, len(tiers), n)].tolist(),
+            )
+            conn.executemany(insert, rows)
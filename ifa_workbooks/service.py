@@ -0,0 +1,338 @@
+"""
+Asyncio HTTP service that renders pricing packs on demand
+
+Sales gets a personalised v3 pack by asking for it instead of editing the
+script's constants. The service is standard library only:
+
+    POST /render/pricing   JSON body, or GET with the same fields as a
+                           query string; answers with the .xlsx
+    GET  /metrics          request counts and p50/p99 latency per endpoint
+    GET  /health
+
+Render fields are the batch CSV fields (firm_name, tier, plannetic_cost,
+hours_per_client, time_saved_pct, hourly_rate, clients_per_month and one
+per TOOL_STACK key) plus the v3 script's options: paths, scenario, seed,
+cohort_years and cached_values. Options default to a plain batch pack (no
+Monte Carlo fan chart or cohort summary).
+
+Rendering is CPU-bound, so it runs in a process pool of `workers`
+processes while the event loop keeps answering. Identical requests that
+arrive while one is rendering share that render instead of queueing their
+own. At most `max_pending` distinct renders are queued or running; past
+that the service answers 503 with Retry-After instead of letting the
+queue, and every client's latency, grow without bound.
+
+    service = RenderService(workers=4)
+    asyncio.run(service.serve('127.0.0.1', 8080))
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlsplit
+
+from .batch import NUMERIC_FIELDS, TOOL_KEYS, pack_filename, prospect_from_row
+from .growth import GROWTH_SCENARIOS
+
+XLSX_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+MAX_BODY_BYTES = 64 * 1024
+MAX_PATHS = 1_000_000
+MAX_COHORT_YEARS = 50
+# Latencies kept per endpoint for the percentiles
+LATENCY_WINDOW = 1024
+# Routed paths -> allowed methods; /metrics reports each routed method and path, the rest as one bucket
+ENDPOINTS = {'/render/pricing': ('GET', 'POST'), '/metrics': ('GET',), '/health': ('GET',)}
+OTHER_ENDPOINT = 'other'
+
+PARAM_FIELDS = frozenset(('firm_name', 'tier') + NUMERIC_FIELDS + TOOL_KEYS)
+OPTION_DEFAULTS = {'paths': 0, 'scenario': 'Moderate', 'seed': 2025, 'cohort_years': 0, 'cached_values': False}
+
+
+class RequestError(Exception):
+    """A request the service refuses, with the HTTP status to answer"""
+
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+def _int_option(options, name, low, high):
+    try:
+        value = int(options[name])
+    except (TypeError, ValueError):
+        raise RequestError(HTTPStatus.BAD_REQUEST, f'{name} must be a whole number') from None
+    if not low <= value <= high:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f'{name} must be between {low} and {high}')
+    return value
+
+
+def stats_key(method, path):
+    """The /metrics bucket for a request: 'POST /render/pricing', or OTHER_ENDPOINT when it is not routed"""
+    return f'{method} {path}' if method in ENDPOINTS.get(path, ()) else OTHER_ENDPOINT
+
+
+def parse_render_fields(fields):
+    """Split request fields into (ProspectParams, options); raises RequestError"""
+    unknown = set(fields) - PARAM_FIELDS - set(OPTION_DEFAULTS)
+    if unknown:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f'Unknown fields: {sorted(unknown)}')
+    try:
+        params = prospect_from_row({k: v for k, v in fields.items() if k in PARAM_FIELDS})
+    except (TypeError, ValueError) as exc:
+        raise RequestError(HTTPStatus.BAD_REQUEST, str(exc)) from None
+
+    options = {**OPTION_DEFAULTS, **{k: v for k, v in fields.items() if k in OPTION_DEFAULTS}}
+    options['paths'] = _int_option(options, 'paths', 0, MAX_PATHS)
+    options['seed'] = _int_option(options, 'seed', 0, 2 ** 32 - 1)
+    options['cohort_years'] = _int_option(options, 'cohort_years', 0, MAX_COHORT_YEARS)
+    if options['scenario'] not in GROWTH_SCENARIOS:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"scenario must be one of {sorted(GROWTH_SCENARIOS)}")
+    cached = options['cached_values']
+    options['cached_values'] = cached if isinstance(cached, bool) else str(cached).lower() in ('1', 'true', 'yes')
+    return params, options
+
+
+def render_request(params, options, cache=None):
+    """Build, save and return the bytes of one pack (runs in a worker process)"""
+    from .cohorts import cohort_revenue
+    from .formulas import FormulaEngine, write_cached_values
+    from .growth import simulate_growth
+    from .pricing import build_pricing_workbook
+
+    key = cache.key({'params': params, 'options': options}) if cache is not None else None
+    fd, path = tempfile.mkstemp(prefix='.render-', suffix='.xlsx')
+    os.close(fd)
+    try:
+        if key is None or not cache.fetch(key, path):
+            growth_bands = None
+            if options['paths']:
+                growth_bands = simulate_growth(options['scenario'], paths=options['paths'], seed=options['seed'])
+            cohorts = None
+            if options['cohort_years']:
+                cohorts = cohort_revenue(options['scenario'], months=12 * options['cohort_years'])
+            wb = build_pricing_workbook(params, streaming=True, growth_bands=growth_bands, cohorts=cohorts)
+            wb.save(path)
+            if options['cached_values']:
+                write_cached_values(FormulaEngine.from_file(path), path)
+            if key is not None:
+                cache.store(key, path)
+        with open(path, 'rb') as f:
+            return f.read()
+    finally:
+        os.unlink(path)
+
+
+def _warm_worker():
+    """Import the builders once per worker so the first request does not pay for it"""
+    from . import pricing  # noqa: F401
+    return os.getpid()
+
+
+@dataclasses.dataclass
+class EndpointStats:
+    """Request count, statuses and recent latencies of one endpoint"""
+
+    count: int = 0
+    statuses: dict = dataclasses.field(default_factory=dict)
+    latencies: deque = dataclasses.field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def record(self, status, seconds):
+        self.count += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.latencies.append(seconds)
+
+    def percentile(self, q):
+        """Latency at quantile q (0-1) over the window, nearest rank"""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered) + 0.5) - 1))]
+
+    def summary(self):
+        p50, p99 = self.percentile(0.5), self.percentile(0.99)
+        return {
+            'count': self.count,
+            'statuses': {str(status): n for status, n in sorted(self.statuses.items())},
+            'p50_ms': None if p50 is None else round(p50 * 1000, 1),
+            'p99_ms': None if p99 is None else round(p99 * 1000, 1),
+        }
+
+
+class RenderService:
+    """
+    The HTTP front end and its render pool. workers defaults to
+    os.cpu_count(), max_pending to twice the workers; cache (an
+    OutputCache) lets workers reuse packs rendered by earlier requests.
+    """
+
+    def __init__(self, workers=None, max_pending=None, cache=None):
+        self.workers = workers or os.cpu_count()
+        self.max_pending = max_pending or 2 * self.workers
+        self.cache = cache
+        self.stats = {}
+        self.coalesced = 0
+        self.rejected = 0
+        self._inflight = {}
+        self._pool = None
+        self._server = None
+
+    def start_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            for future in [self._pool.submit(_warm_worker) for _ in range(self.workers)]:
+                future.result()
+
+    async def start(self, host='127.0.0.1', port=8080):
+        """Start the pool and listen; returns the asyncio Server"""
+        self.start_pool()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def serve(self, host='127.0.0.1', port=8080):
+        server = await self.start(host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def metrics(self):
+        return {
+            'endpoints': {name: stats.summary() for name, stats in sorted(self.stats.items())},
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            'pending': len(self._inflight),
+            'coalesced': self.coalesced,
+            'rejected': self.rejected,
+        }
+
+    async def render(self, params, options):
+        """The pack's bytes, sharing an identical render already in flight"""
+        blob = json.dumps({'params': dataclasses.asdict(params), 'options': options}, sort_keys=True)
+        key = hashlib.sha256(blob.encode()).hexdigest()
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            if len(self._inflight) >= self.max_pending:
+                self.rejected += 1
+                raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, 'Render queue is full, retry shortly',
+                                   {'Retry-After': '1'})
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._pool, render_request, params, options, self.cache)
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A client hanging up must not cancel the render others are waiting on
+        return await asyncio.shield(future)
+
+    async def _route(self, method, target, body):
+        """(status, headers, body) for one request; raises RequestError"""
+        url = urlsplit(target)
+        allowed = ENDPOINTS.get(url.path)
+        if allowed is None:
+            raise RequestError(HTTPStatus.NOT_FOUND, f'No endpoint {url.path}')
+        if method not in allowed:
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, f"Use {' or '.join(allowed)}",
+                               {'Allow': ', '.join(allowed)})
+        if url.path == '/health':
+            return HTTPStatus.OK, {'Content-Type': 'application/json'}, b'{"status": "ok"}'
+        if url.path == '/metrics':
+            return HTTPStatus.OK, {'Content-Type': 'application/json'}, json.dumps(self.metrics(), indent=2).encode()
+        if url.path == '/render/pricing':
+            fields = dict(parse_qsl(url.query))
+            if body:
+                try:
+                    payload = json.loads(body)
+                except ValueError:
+                    raise RequestError(HTTPStatus.BAD_REQUEST, 'Body must be a JSON object') from None
+                if not isinstance(payload, dict):
+                    raise RequestError(HTTPStatus.BAD_REQUEST, 'Body must be a JSON object')
+                fields.update(payload)
+            params, options = parse_render_fields(fields)
+            try:
+                data = await self.render(params, options)
+            except RequestError:
+                raise
+            except Exception as exc:
+                raise RequestError(HTTPStatus.INTERNAL_SERVER_ERROR, f'{type(exc).__name__}: {exc}') from None
+            headers = {
+                'Content-Type': XLSX_TYPE,
+                'Content-Disposition': f'attachment; filename="{pack_filename(params, 0)}"',
+            }
+            return HTTPStatus.OK, headers, data
+
+    async def _read_request(self, reader):
+        """(method, target, headers, body), or None when the client closed the connection"""
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, _version = line.decode('latin-1').split()
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, 'Malformed request line') from None
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, 'Bad Content-Length') from None
+        if length > MAX_BODY_BYTES:
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f'Body over {MAX_BODY_BYTES} bytes')
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), target, headers, body
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                start = time.perf_counter()
+                endpoint = None
+                keep_alive = True
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, target, headers, body = request
+                    endpoint = stats_key(method, urlsplit(target).path)
+                    keep_alive = headers.get('connection', '').lower() != 'close'
+                    status, response_headers, payload = await self._route(method, target, body)
+                except RequestError as exc:
+                    status, response_headers = exc.status, {'Content-Type': 'application/json', **exc.headers}
+                    payload = json.dumps({'error': str(exc)}).encode()
+                    keep_alive = keep_alive and endpoint is not None
+                await self._respond(writer, status, response_headers, payload, keep_alive)
+                if endpoint is not None:
+                    self.stats.setdefault(endpoint, EndpointStats()).record(int(status), time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, headers, payload, keep_alive):
+        lines = [f'HTTP/1.1 {status.value} {status.phrase}',
+                 f'Content-Length: {len(payload)}',
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines += [f'{name}: {value}' for name, value in headers.items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + payload)
+        await writer.drain()
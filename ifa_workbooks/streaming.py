@@ -0,0 +1,168 @@
+"""
+Streaming (write-only) workbook used by the Excel generators
+
+StreamingWorkbook exposes the small part of the openpyxl Workbook/Worksheet
+API the generators use (ws['A1'], ws.cell(), merge_cells, column_dimensions,
+add_chart) but backs it with an openpyxl write-only workbook. Cells for the
+sheet being built are held as light slot objects and flushed row by row into
+the write-only stream as soon as the next sheet is started, so only one
+sheet's cell values are ever held in memory and openpyxl never builds its
+full Cell grid. Tables added to direct_tables (see direct.py) are spliced
+into the saved file without going through cells at all.
+"""
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles.fills import DEFAULT_EMPTY_FILL
+from openpyxl.utils import coordinate_to_tuple
+
+from .direct import DirectTables
+
+
+class BufferedCell:
+    """Value and style attributes for one cell awaiting flush"""
+
+    __slots__ = ('value', 'font', 'fill', 'border', 'alignment', 'number_format', 'style')
+
+    def __init__(self, value=None):
+        self.value = value
+        self.font = None
+        self.fill = DEFAULT_EMPTY_FILL
+        self.border = None
+        self.alignment = None
+        self.number_format = None
+        self.style = None
+
+    def to_write_only(self, ws):
+        cell = WriteOnlyCell(ws, value=self.value)
+        # Named style first so explicit attributes still override it
+        if self.style is not None:
+            cell.style = self.style
+        if self.font is not None:
+            cell.font = self.font
+        if self.fill is not DEFAULT_EMPTY_FILL:
+            cell.fill = self.fill
+        if self.border is not None:
+            cell.border = self.border
+        if self.alignment is not None:
+            cell.alignment = self.alignment
+        if self.number_format is not None:
+            cell.number_format = self.number_format
+        return cell
+
+
+class BufferedWorksheet:
+    """Worksheet facade that buffers one sheet and streams it on flush"""
+
+    def __init__(self, ws):
+        self._ws = ws
+        self._cells = {}
+
+    @property
+    def title(self):
+        return self._ws.title
+
+    @title.setter
+    def title(self, value):
+        self._ws.title = value
+
+    @property
+    def column_dimensions(self):
+        return self._ws.column_dimensions
+
+    @property
+    def merged_cells(self):
+        return self._ws.merged_cells
+
+    @property
+    def conditional_formatting(self):
+        return self._ws.conditional_formatting
+
+    @property
+    def parent(self):
+        return self._ws.parent
+
+    def __getitem__(self, coordinate):
+        row, column = coordinate_to_tuple(coordinate)
+        return self.cell(row=row, column=column)
+
+    def __setitem__(self, coordinate, value):
+        self[coordinate].value = value
+
+    def cell(self, row, column, value=None):
+        key = (row, column)
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = BufferedCell()
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def merge_cells(self, range_string):
+        self._ws.merged_cells.add(range_string)
+
+    def add_chart(self, chart, anchor=None):
+        self._ws.add_chart(chart, anchor)
+
+    def flush(self):
+        """Write buffered cells to the write-only sheet in row order"""
+        if self._cells is None:
+            return
+        rows = {}
+        for (row, column), cell in self._cells.items():
+            rows.setdefault(row, {})[column] = cell
+        self._cells = None
+
+        ws = self._ws
+        for row in range(1, max(rows, default=0) + 1):
+            columns = rows.pop(row, None)
+            if not columns:
+                ws.append([])
+                continue
+            values = [None] * max(columns)
+            for column, cell in columns.items():
+                values[column - 1] = cell.to_write_only(ws)
+            ws.append(values)
+
+
+class StreamingWorkbook:
+    """Drop-in for Workbook() that writes each sheet as a row stream"""
+
+    def __init__(self):
+        self._wb = Workbook(write_only=True)
+        self._sheets = []
+        self.direct_tables = DirectTables()
+        self.active = self.create_sheet()
+
+    def create_sheet(self, title=None):
+        # Starting a new sheet means the previous one is complete
+        if self._sheets:
+            self._sheets[-1].flush()
+        sheet = BufferedWorksheet(self._wb.create_sheet(title))
+        self._sheets.append(sheet)
+        return sheet
+
+    @property
+    def worksheets(self):
+        return list(self._sheets)
+
+    @property
+    def sheetnames(self):
+        return [ws.title for ws in self._sheets]
+
+    @property
+    def named_styles(self):
+        return self._wb.named_styles
+
+    def add_named_style(self, style):
+        self._wb.add_named_style(style)
+
+    @property
+    def defined_names(self):
+        return self._wb.defined_names
+
+    def save(self, filename):
+        for sheet in self._sheets:
+            sheet.flush()
+        self._wb.save(filename)
+        self.direct_tables.write(filename)
@@ -0,0 +1,196 @@
+"""
+Shared named-style registry for the pricing and Cyber Essentials generators
+
+Setting cell.font / cell.fill / cell.border one attribute at a time makes
+openpyxl hash and dedupe a style object on every assignment, and the
+generators used to build fresh Font/PatternFill objects inside their cell
+loops. Instead each generator describes its look as a catalogue of parts
+(a font, a fill, a border, an alignment or a number format) and styles a
+cell with a combination of them:
+
+    style = StyleRegistry(wb, PLANNETIC_STYLES, 'Plannetic')
+    style(ws['A1'], 'title')
+    style(cell, 'header', 'border', 'center')
+
+Each distinct combination is registered once per workbook as an openpyxl
+NamedStyle (it shows up in Excel's Cell Styles gallery, e.g. "Plannetic
+Header Border Center") and every later cell just references it by name.
+style_report() counts the styles a saved file ends up with, so a change
+that starts minting one style per cell shows up straight away. Writers that
+emit cell XML themselves (direct.py) use style_id() for the cellXfs index
+of a combination instead.
+"""
+
+import zipfile
+from xml.etree import ElementTree
+
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.styles.borders import DEFAULT_BORDER
+from openpyxl.styles.fonts import DEFAULT_FONT
+
+from .xlsx_parts import MAIN_NS
+
+
+def solid(color):
+    """Solid background fill in one colour"""
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+
+def box(color=None):
+    """Thin border on all four sides"""
+    side = Side(style='thin', color=color)
+    return Border(left=side, right=side, top=side, bottom=side)
+
+
+def _plannetic_fonts(name):
+    return {
+        'title': {'font': Font(name=name, size=20, bold=True, color='1E40AF')},
+        'subheader': {'font': Font(name=name, size=13, bold=True, color='1E40AF')},
+        'section': {'font': Font(name=name, size=11, bold=True, color='374151')},
+        'normal': {'font': Font(name=name, size=10)},
+        'bold': {'font': Font(name=name, size=10, bold=True)},
+        'small': {'font': Font(name=name, size=9, color='6B7280')},
+        'tick': {'font': Font(name=name, size=10, color='059669', bold=True)},
+        'dash': {'font': Font(name=name, size=10, color='9CA3AF')},
+    }
+
+
+_NUMBER_FORMATS = {
+    'money': {'number_format': '£#,##0'},
+    'percent': {'number_format': '0%'},
+    'percent_1dp': {'number_format': '0.0%'},
+    'decimal': {'number_format': '0.0'},
+    'integer': {'number_format': '0'},
+    'points': {'number_format': '0"%"'},
+    'points_1dp': {'number_format': '0.0"%"'},
+}
+
+_ALIGNMENTS = {
+    'center': {'alignment': Alignment(horizontal='center')},
+    'left': {'alignment': Alignment(horizontal='left')},
+}
+
+# Pricing workbooks (v2, v3 and the per-prospect packs)
+PLANNETIC_STYLES = {
+    **_plannetic_fonts('Calibri'),
+    'header': {'font': Font(name='Calibri', size=11, bold=True, color='FFFFFF'), 'fill': solid('1E40AF')},
+    'alt': {'fill': solid('F3F4F6')},
+    'highlight': {'fill': solid('DCFCE7')},
+    'input': {'fill': solid('FEF3C7')},
+    'warning': {'fill': solid('FEE2E2')},
+    'blue': {'fill': solid('DBEAFE')},
+    'green': {'fill': solid('D1FAE5')},
+    'border': {'border': box('D1D5DB')},
+    **_ALIGNMENTS,
+    **_NUMBER_FORMATS,
+}
+
+# Original Arial pricing analysis (plannetic-pricing-analysis.py)
+ANALYSIS_STYLES = {
+    'title': {'font': Font(name='Arial', size=18, bold=True, color='1E40AF')},
+    'subheader': {'font': Font(name='Arial', size=11, bold=True)},
+    'normal': {'font': Font(name='Arial', size=10)},
+    'bold': {'font': Font(name='Arial', size=10, bold=True)},
+    'emphasis': {'font': Font(bold=True)},
+    'tick': {'font': Font(name='Arial', size=10, color='059669')},
+    'dash': {'font': Font(name='Arial', size=10, color='9CA3AF')},
+    'header': {'font': Font(name='Arial', size=12, bold=True, color='FFFFFF'), 'fill': solid('1E40AF')},
+    'alt': {'fill': solid('F3F4F6')},
+    'highlight': {'fill': solid('DCFCE7')},
+    'input': {'fill': solid('FEF3C7')},
+    'border': {'border': box()},
+    **_ALIGNMENTS,
+    **_NUMBER_FORMATS,
+}
+
+
+def cyber_essentials_styles(header_color='4472C4'):
+    """Parts for the Cyber Essentials question-set workbooks"""
+    return {
+        'heading': {'font': Font(bold=True, size=14)},
+        'header': {'font': Font(bold=True, color='FFFFFF', size=11), 'fill': solid(header_color)},
+        'section': {'font': Font(bold=True, size=11)},
+        'bold': {'font': Font(bold=True)},
+        'ready': {'fill': solid('C6EFCE')},
+        'pending': {'fill': solid('FFEB9C')},
+        'confirm': {'fill': solid('BDD7EE')},
+        'partial': {'fill': solid('FCE4D6')},
+        'wrap': {'alignment': Alignment(wrap_text=True, vertical='top')},
+        'border': {'border': box()},
+    }
+
+
+class StyleRegistry:
+    """
+    Applies combinations of catalogue parts to cells as named styles.
+
+    parts maps a part name to the attributes it sets (font, fill, border,
+    alignment, number_format); two parts in one combination may not set the
+    same attribute. Attributes no part sets keep the workbook defaults.
+    """
+
+    def __init__(self, wb, parts, prefix):
+        self.wb = wb
+        self.parts = parts
+        self.prefix = prefix
+        self._order = {part: i for i, part in enumerate(parts)}
+        self._names = {}
+        self._ids = {}
+
+    def name(self, *parts):
+        """Named style for a combination of parts, registering it on first use"""
+        name = self._names.get(parts)
+        if name is None:
+            ordered = sorted(parts, key=self._order.__getitem__)
+            name = ' '.join([self.prefix] + [part.replace('_', ' ').title() for part in ordered])
+            if name not in self.wb.named_styles:
+                self.wb.add_named_style(NamedStyle(name=name, **self._compose(ordered)))
+            self._names[parts] = name
+        return name
+
+    def _compose(self, parts):
+        attrs = {'font': DEFAULT_FONT, 'border': DEFAULT_BORDER}
+        owner = {}
+        for part in parts:
+            for attr, value in self.parts[part].items():
+                if attr in owner:
+                    raise ValueError(f"Style parts '{owner[attr]}' and '{part}' both set {attr}")
+                owner[attr] = part
+                attrs[attr] = value
+        return attrs
+
+    def __call__(self, cell, *parts):
+        cell.style = self.name(*parts)
+        return cell
+
+    def style_id(self, ws, *parts):
+        """cellXfs index of a combination in the saved file (ws is any sheet of the workbook)"""
+        index = self._ids.get(parts)
+        if index is None:
+            index = self._ids[parts] = self(WriteOnlyCell(ws), *parts).style_id
+        return index
+
+
+def style_report(path):
+    """Count the style records stored in a saved .xlsx (from xl/styles.xml)"""
+    with zipfile.ZipFile(path) as zf:
+        root = ElementTree.fromstring(zf.read('xl/styles.xml'))
+
+    def count(tag):
+        element = root.find(f'{{{MAIN_NS}}}{tag}')
+        return 0 if element is None else len(element)
+
+    return {
+        'named_styles': count('cellStyles'),
+        'cell_formats': count('cellXfs'),
+        'fonts': count('fonts'),
+        'fills': count('fills'),
+        'borders': count('borders'),
+        'number_formats': count('numFmts'),
+    }
+
+
+def format_style_report(report):
+    """One-line summary of a style_report() result"""
+    return ', '.join(f"{count} {name.replace('_', ' ')}" for name, count in report.items())
@@ -0,0 +1,47 @@
+"""
+Plannetic tier prices and commitment terms
+
+One source for the pack (pricing.py), the cohort model (cohorts.py) and
+the customer-mix model (mix.py), so the three cannot quote different
+prices or contract lengths. Prices are the Summary pricing table's;
+commitment lengths come from the Tier Comparison layout's "Minimum
+Commitment" row, so editing the layout changes every model with it:
+
+    TIER_PRICES['professional']     # 300
+    tier_terms()                    # {'standard': 24, 'professional': 24, 'enterprise': 36}
+
+The Monthly tier is month to month and has no commitment row entry.
+"""
+
+import os
+import re
+from functools import lru_cache
+
+from .layout import LAYOUT_DIR, read_layout
+
+# Monthly price of each Plannetic tier the ROI Calculator can be quoted at
+TIER_PRICES = {
+    'monthly': 350,
+    'standard': 250,
+    'professional': 300,
+}
+
+COMMITMENT_RE = re.compile(r'^(\d+)\s*(year|month)s?$', re.I)
+COMMITMENT_LABEL = 'Minimum Commitment'
+
+
+@lru_cache(maxsize=1)
+def tier_terms():
+    """{tier: term months} from the Tier Comparison layout's Minimum Commitment row"""
+    spec = read_layout(os.path.join(LAYOUT_DIR, 'tier_comparison.json'))
+    table = next(block for block in spec['blocks'] if block.get('id') == 'tiers')
+    tiers = [column['key'] for column in table['columns'][1:]]
+    values = next(row['values'][1:] for row in table['rows'] if row['values'][0] == COMMITMENT_LABEL)
+    terms = {}
+    for tier, text in zip(tiers, values):
+        match = COMMITMENT_RE.match(text.strip())
+        if match is None:
+            raise ValueError(f"Tier Comparison: cannot read {COMMITMENT_LABEL} {text!r} for {tier}")
+        count = int(match.group(1))
+        terms[tier] = count * 12 if match.group(2).lower() == 'year' else count
+    return terms
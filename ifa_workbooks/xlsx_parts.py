@@ -0,0 +1,249 @@
+"""
+Low-level helpers for reading and rewriting parts inside a saved .xlsx
+
+An .xlsx is a zip of XML parts. These helpers locate worksheet parts by
+sheet title, read cells straight from a part's XML and rewrite individual
+<c> elements or whole parts while every other zip entry is copied through
+unchanged, so post-processing a saved workbook never needs a full openpyxl
+load.
+"""
+
+import math
+import os
+import posixpath
+import re
+import stat
+import tempfile
+import zipfile
+from contextlib import contextmanager
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, unescape
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+CELL_RE = re.compile(rb'<c\b([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+COORD_ATTR_RE = re.compile(rb'\br="([A-Z]+[0-9]+)"')
+TYPE_ATTR_RE = re.compile(rb'\s+t="[^"]*"')
+FORMULA_RE = re.compile(rb'<f\b[^>]*?(?:/>|>.*?</f>)', re.S)
+FORMULA_PARTS_RE = re.compile(rb'<f\b([^>]*?)(?:/>|>(.*?)</f>)', re.S)
+CELL_TYPE_RE = re.compile(rb'\st="([^"]*)"')
+SHARED_INDEX_RE = re.compile(rb'\bsi="(\d+)"')
+VALUE_RE = re.compile(rb'<v>(.*?)</v>', re.S)
+TEXT_RE = re.compile(rb'<t\b[^>]*>(.*?)</t>', re.S)
+XML_ENTITIES = {'&quot;': '"', '&apos;': "'"}
+
+
+class ExcelError(str):
+    """A cell error value such as #DIV/0! (stored with t="e")"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return f'ExcelError({str(self)!r})'
+
+
+def _resolve_target(base_dir, target):
+    if target.startswith('/'):
+        return target[1:]
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+def sheet_parts(zf):
+    """Map sheet title -> worksheet part name (e.g. 'xl/worksheets/sheet1.xml')"""
+    rels = ElementTree.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    targets = {rel.get('Id'): _resolve_target('xl', rel.get('Target'))
+               for rel in rels.iter(f'{{{PKG_REL_NS}}}Relationship')}
+    workbook = ElementTree.fromstring(zf.read('xl/workbook.xml'))
+    return {sheet.get('name'): targets[sheet.get(f'{{{REL_NS}}}id')]
+            for sheet in workbook.iter(f'{{{MAIN_NS}}}sheet')}
+
+
+def shared_strings(zf):
+    """The shared string table of an open .xlsx zip (empty if it has none)"""
+    try:
+        data = zf.read('xl/sharedStrings.xml')
+    except KeyError:
+        return []
+    root = ElementTree.fromstring(data)
+    return [''.join(t.text or '' for t in si.iter(f'{{{MAIN_NS}}}t')) for si in root.iter(f'{{{MAIN_NS}}}si')]
+
+
+def _xml_text(data):
+    return unescape(data.decode('utf-8'), XML_ENTITIES)
+
+
+def _parse_number(text):
+    if text.lstrip('-').isdigit():
+        return int(text)
+    return float(text)
+
+
+def read_cells(xml, strings=()):
+    """
+    Yield (coordinate, value, formula) for each cell in a worksheet part.
+
+    formula is the '=...' text or None; value is the literal value, or a
+    formula's cached result (None when the file stores none). strings is
+    the shared string table. Shared formulas are expanded per cell.
+    """
+    shared = {}
+    for match in CELL_RE.finditer(xml):
+        attrs, inner = match.group(1), match.group(2) or b''
+        coord = COORD_ATTR_RE.search(attrs)
+        if coord is None:
+            continue
+        coord = coord.group(1).decode()
+
+        formula = None
+        f = FORMULA_PARTS_RE.search(inner)
+        if f is not None:
+            f_attrs, f_text = f.group(1), f.group(2)
+            text = _xml_text(f_text) if f_text else None
+            index = SHARED_INDEX_RE.search(f_attrs)
+            if index is not None and b't="shared"' in f_attrs:
+                if text:
+                    shared[index.group(1)] = (text, coord)
+                elif index.group(1) in shared:
+                    from openpyxl.formula.translate import Translator
+
+                    base, origin = shared[index.group(1)]
+                    text = Translator(f'={base}', origin).translate_formula(coord)[1:]
+            if text:
+                formula = f'={text}'
+
+        cell_type = CELL_TYPE_RE.search(attrs)
+        cell_type = cell_type.group(1) if cell_type else b'n'
+        if cell_type == b'inlineStr':
+            value = ''.join(_xml_text(t) for t in TEXT_RE.findall(inner))
+        else:
+            v = VALUE_RE.search(inner)
+            if v is None:
+                value = None
+            elif cell_type == b's':
+                value = strings[int(v.group(1))]
+            elif cell_type == b'str':
+                value = _xml_text(v.group(1))
+            elif cell_type == b'b':
+                value = v.group(1) == b'1'
+            elif cell_type == b'e':
+                value = ExcelError(_xml_text(v.group(1)))
+            else:
+                value = _parse_number(v.group(1).decode())
+        yield coord, value, formula
+
+
+def format_number(value):
+    """Render a number the way Excel stores it in <v>"""
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f'Cannot store {value!r} in a cell')
+    return repr(value)
+
+
+def encode_value(value, cached):
+    """
+    Return (t attribute or None, inner XML) for a cell value.
+
+    cached=True encodes a formula's cached result (strings as t="str");
+    otherwise a literal cell value (strings as inline strings).
+    """
+    if value is None:
+        return None, b'' if not cached else b'<v />'
+    if isinstance(value, ExcelError):
+        return b'e', f'<v>{escape(str(value))}</v>'.encode()
+    if isinstance(value, bool):
+        return b'b', f'<v>{format_number(value)}</v>'.encode()
+    if isinstance(value, (int, float)):
+        return None, f'<v>{format_number(value)}</v>'.encode()
+    text = escape(str(value))
+    if cached:
+        return b'str', f'<v>{text}</v>'.encode()
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return b'inlineStr', f'<is><t{space}>{text}</t></is>'.encode()
+
+
+def set_cell_values(xml, values):
+    """
+    Rewrite the values of existing cells in a worksheet part.
+
+    values maps coordinate -> new value. A cell holding a formula keeps the
+    formula and gets the value as its cached result; any other cell gets
+    the value as its literal content. Returns (new_xml, coordinates that
+    were not found in the part). Everything outside the touched <c>
+    elements is left byte-for-byte as it was.
+    """
+    pending = {coord.encode(): value for coord, value in values.items()}
+
+    def replace(match):
+        attrs = match.group(1)
+        coord = COORD_ATTR_RE.search(attrs)
+        if coord is None or coord.group(1) not in pending:
+            return match.group(0)
+        value = pending.pop(coord.group(1))
+        formula = FORMULA_RE.search(match.group(2) or b'')
+        cell_type, inner = encode_value(value, cached=formula is not None)
+        attrs = TYPE_ATTR_RE.sub(b'', attrs)
+        if cell_type is not None:
+            attrs += b' t="' + cell_type + b'"'
+        if formula is not None:
+            inner = formula.group(0) + inner
+        return b'<c' + attrs + b'>' + inner + b'</c>'
+
+    new_xml = CELL_RE.sub(replace, xml)
+    return new_xml, {coord.decode() for coord in pending}
+
+
+def default_file_mode():
+    """Permissions a plain open() would give a new file under the current umask"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+@contextmanager
+def atomic_path(path, suffix='.xlsx', mode=None):
+    """
+    Yield a temp file path in path's directory; when the block finishes it
+    is given mode (default: default_file_mode(), since mkstemp files are
+    private) and moved over path, and on any error it is removed instead
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', suffix=suffix, dir=directory)
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.chmod(tmp_path, default_file_mode() if mode is None else mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def replace_parts(src_path, replacements, dest_path=None):
+    """
+    Copy an .xlsx, substituting the bytes of the named parts.
+
+    Entries not in replacements are copied with their original names, order
+    and compression. A replacement is bytes, or an iterable of byte chunks
+    that is streamed into the entry as it is produced. Writes atomically;
+    dest_path defaults to src_path, and keeps src_path's permissions.
+    """
+    dest_path = dest_path or src_path
+    with atomic_path(dest_path, mode=stat.S_IMODE(os.stat(src_path).st_mode)) as tmp_path:
+        with zipfile.ZipFile(src_path) as src, zipfile.ZipFile(tmp_path, 'w') as dest:
+            for info in src.infolist():
+                data = replacements.get(info.filename)
+                if data is None:
+                    dest.writestr(info, src.read(info.filename))
+                elif isinstance(data, bytes):
+                    dest.writestr(info, data)
+                else:
+                    with dest.open(info, 'w') as entry:
+                        for chunk in data:
+                            entry.write(chunk)
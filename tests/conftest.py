@@ -0,0 +1,6 @@
+"""Make ifa_workbooks importable when pytest runs from the repository root, as the scripts do"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
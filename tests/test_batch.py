@@ -0,0 +1,53 @@
+import os
+import stat
+
+import pytest
+
+from ifa_workbooks.batch import _assign_filenames, load_prospects, read_prospects, render_pack, unique_filenames
+from ifa_workbooks.pricing import ProspectParams
+from ifa_workbooks.xlsx_parts import default_file_mode
+
+
+def test_renamed_duplicates_never_collide():
+    prospects = [ProspectParams(firm_name=name) for name in ('Acme 3', 'Acme', 'Acme', 'Acme')]
+    names = _assign_filenames(prospects)
+    assert len(set(names)) == len(names)
+    assert names[:2] == ['Plannetic-Pricing-Acme-3.xlsx', 'Plannetic-Pricing-Acme.xlsx']
+
+
+def test_unique_filenames_skips_taken_suffixes():
+    assert unique_filenames(['a.xlsx', 'a.xlsx', 'a-2.xlsx']) == ['a.xlsx', 'a-2.xlsx', 'a-2-3.xlsx']
+
+
+def test_names_differing_only_by_case_never_collide():
+    prospects = [ProspectParams(firm_name=name) for name in ('Acme', 'acme', 'ACME-2')]
+    assert _assign_filenames(prospects) == [
+        'Plannetic-Pricing-Acme.xlsx', 'Plannetic-Pricing-acme-2.xlsx', 'Plannetic-Pricing-ACME-2-3.xlsx']
+
+
+def test_unnamed_prospects_get_numbered_names():
+    assert _assign_filenames([ProspectParams(), ProspectParams()]) == [
+        'Plannetic-Pricing-prospect-1.xlsx', 'Plannetic-Pricing-prospect-2.xlsx']
+
+
+def test_packs_get_normal_file_permissions(tmp_path):
+    path = str(tmp_path / 'pack.xlsx')
+    result = render_pack(0, ProspectParams(firm_name='Acme'), path)
+    assert result.error is None
+    assert stat.S_IMODE(os.stat(path).st_mode) == default_file_mode()
+    assert [name for name in os.listdir(tmp_path) if name.startswith('.tmp-')] == []
+
+
+def test_bad_records_are_skipped_and_reported(tmp_path):
+    path = str(tmp_path / 'prospects.csv')
+    with open(path, 'w') as f:
+        f.write('firm_name,tier,plannetic_cost\nAcme,standard,\nBeta,enterprise,\n,professional,\n')
+    prospects, indexes, rejected = read_prospects(path)
+    assert [p.firm_name for p in prospects] == ['Acme', '']
+    assert indexes == [0, 2]
+    assert [(r.index, r.firm_name) for r in rejected] == [(1, 'Beta')]
+    assert rejected[0].error.startswith("record 2: Unknown tier 'enterprise'")
+    # Unnamed prospects keep the number of their record
+    assert _assign_filenames(prospects, indexes)[1] == 'Plannetic-Pricing-prospect-3.xlsx'
+    with pytest.raises(ValueError, match='record 2'):
+        load_prospects(path)
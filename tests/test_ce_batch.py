@@ -0,0 +1,14 @@
+import pytest
+
+from ifa_workbooks import ce_batch
+from ifa_workbooks.ce_store import connect, create_schema
+
+
+def test_unknown_base_columns_are_a_value_error(tmp_path, monkeypatch):
+    base = tmp_path / 'base.xlsx'
+    base.write_bytes(b'')
+    monkeypatch.setattr(ce_batch, 'read_ce_workbook', lambda path: ((('Odd', 10),), []))
+    conn = connect(':memory:')
+    create_schema(conn)
+    with pytest.raises(ValueError, match='match no known CE layout'):
+        ce_batch.load_base(conn, str(base))
@@ -0,0 +1,32 @@
+import pytest
+
+from ifa_workbooks.columnar import roi_table
+from ifa_workbooks.formulas import FormulaEngine
+from ifa_workbooks.names import read_names
+from ifa_workbooks.pricing import ProspectParams, build_pricing_workbook
+
+# roi_table result key -> the defined name of the same monthly figure on the sheet
+RESULT_NAMES = {
+    'software': 'roi_software_savings_monthly',
+    'hours_per_client': 'roi_hours_saved_per_client',
+    'total_hours': 'roi_hours_saved_monthly',
+    'time_value': 'roi_time_value_monthly',
+    'benefit': 'roi_total_benefit_monthly',
+    'net': 'roi_net_benefit_monthly',
+    'roi': 'roi_pct',
+}
+
+
+def test_roi_table_matches_the_sheet(tmp_path):
+    params = ProspectParams(firm_name='Acme', tool_costs={'cash_flow': 180}, hours_per_client=12,
+                            time_saved_pct=0.5, hourly_rate=90, clients_per_month=7, tier='professional')
+    path = str(tmp_path / 'pack.xlsx')
+    build_pricing_workbook(params).save(path)
+    names = read_names(path)
+    engine = FormulaEngine.from_file(path)
+
+    table = roi_table('Acme', params)
+    monthly = {key: value for section, key, value in zip(table['section'], table['key'], table['monthly'])
+               if section == 'results'}
+    for key, name in RESULT_NAMES.items():
+        assert monthly[key] == pytest.approx(engine.value(*names[name].cell)), key
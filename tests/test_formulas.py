@@ -0,0 +1,67 @@
+import os
+import stat
+
+import pytest
+from openpyxl import load_workbook
+
+from ifa_workbooks.formulas import FormulaEngine, write_cached_values
+from ifa_workbooks.pricing import build_pricing_workbook
+
+
+@pytest.fixture(scope='module')
+def pack(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('formulas') / 'pack.xlsx')
+    build_pricing_workbook().save(path)
+    return path
+
+
+# (sheet, coordinate, value) for the default v3 pack, as Excel shows them
+KNOWN_VALUES = [
+    ('Revenue Calculator', 'B22', 300_000),     # 50 firms x £250 x 24
+    ('Revenue Calculator', 'F22', 240_000),     # 3yr £300 minus 2yr £250
+    ('Growth Projections', 'D24', 223),         # Moderate year-5 firms
+    ('Growth Projections', 'F24', 669_000),     # Moderate year-5 ARR
+    ('ROI Calculator', 'B14', 560),             # tool stack total
+    ('ROI Calculator', 'B41', 3660),            # net benefit per month
+    ('ROI Calculator', 'C41', 43_920),          # net benefit per year
+    ('ROI Calculator', 'B42', 1464),            # ROI %
+    ('Summary', 'D29', 6000),                   # Standard 2-year TCV
+]
+
+
+@pytest.mark.parametrize('sheet, coord, expected', KNOWN_VALUES)
+def test_engine_matches_known_pack_values(pack, sheet, coord, expected):
+    for engine in (FormulaEngine.from_file(pack), FormulaEngine.from_parts(pack)):
+        engine.recalculate()
+        assert engine.value(sheet, coord) == pytest.approx(expected)
+
+
+def test_changed_input_only_recalculates_dependents(pack):
+    engine = FormulaEngine.from_parts(pack)
+    engine.recalculate()
+    engine.set_cell('ROI Calculator', 'B28', 300)
+    changed = engine.recalculate()
+    assert ('ROI Calculator', 'C41') in changed
+    assert not any(sheet == 'Revenue Calculator' for sheet, _ in changed)
+    assert engine.value('ROI Calculator', 'C41') == pytest.approx(43_920 - 2 * 50 * 12)
+
+
+def test_defined_names_evaluate(pack):
+    engine = FormulaEngine.from_parts(pack)
+    engine.set_cell('ROI Calculator', 'Z1', '=roi_net_benefit_annual/12')
+    engine.set_cell('ROI Calculator', 'Z2', '=SUM(revenue_tcv_standard_24m)')
+    engine.recalculate()
+    assert engine.value('ROI Calculator', 'Z1') == pytest.approx(3660)
+    assert engine.value('ROI Calculator', 'Z2') == pytest.approx(250 * 24 * sum(
+        engine.value('Revenue Calculator', f'A{row}') for row in range(13, 29)))
+
+
+def test_cached_values_are_readable_and_keep_permissions(pack, tmp_path):
+    dest = str(tmp_path / 'cached.xlsx')
+    os.chmod(pack, 0o644)
+    engine = FormulaEngine.from_file(pack)
+    write_cached_values(engine, pack, dest)
+    write_cached_values(engine, dest)
+    assert stat.S_IMODE(os.stat(dest).st_mode) == 0o644
+    ws = load_workbook(dest, data_only=True)['ROI Calculator']
+    assert ws['C41'].value == pytest.approx(43_920)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from ifa_workbooks.growth import GROWTH_SCENARIOS, simulate_growth, year_end_firms
+
+
+def test_year_end_firms_match_the_sheet():
+    churned, firms = year_end_firms(GROWTH_SCENARIOS['Moderate'])
+    assert firms.tolist() == [25, 59, 101, 156, 223]
+    assert churned[0] == 0
+
+
+def test_simulation_is_reproducible_with_a_seed():
+    first = simulate_growth(paths=2_000, seed=7)
+    second = simulate_growth(paths=2_000, seed=7)
+    assert np.array_equal(first.firms, second.firms)
+
+
+@pytest.mark.parametrize('annual_churn', [0.0, 1.0])
+def test_churn_at_either_end_is_accepted(annual_churn):
+    bands = simulate_growth(paths=1_000, seed=1, annual_churn=annual_churn)
+    assert bands.firms.shape == (len(bands.percentiles), 60)
+    assert (bands.firms >= 0).all()
+
+
+def test_full_churn_keeps_fewer_firms_than_none():
+    kept = simulate_growth(paths=1_000, seed=1, annual_churn=0.0)
+    lost = simulate_growth(paths=1_000, seed=1, annual_churn=1.0)
+    assert (lost.year_end()[:, -1] < kept.year_end()[:, -1]).all()
+
+
+@pytest.mark.parametrize('annual_churn', [-0.1, 1.5])
+def test_churn_outside_zero_to_one_is_rejected(annual_churn):
+    with pytest.raises(ValueError, match='between 0 and 1'):
+        simulate_growth(paths=10, annual_churn=annual_churn)
+
+
+def test_workers_share_batches_without_changing_the_result():
+    serial = simulate_growth(paths=20_000, seed=3, batch_size=5_000)
+    pooled = simulate_growth(paths=20_000, seed=3, batch_size=5_000, workers=2)
+    assert np.array_equal(serial.firms, pooled.firms)
+
+
+def test_more_workers_than_batches_warns():
+    with pytest.warns(UserWarning, match='only 1 of 4 workers'):
+        simulate_growth(paths=1_000, seed=1, workers=4)
@@ -0,0 +1,49 @@
+import openpyxl
+import pytest
+
+from ifa_workbooks.batch import TOOL_KEYS, load_prospects
+from ifa_workbooks.formulas import FormulaEngine
+from ifa_workbooks.harvest import harvest_pack, write_inputs
+from ifa_workbooks.patch import patch_workbook
+from ifa_workbooks.pricing import ProspectParams, build_pricing_workbook
+
+
+@pytest.fixture
+def pack(tmp_path):
+    path = str(tmp_path / 'Plannetic-Pricing-Acme.xlsx')
+    build_pricing_workbook(ProspectParams(firm_name='Acme', tier='professional')).save(path)
+    return path
+
+
+def test_harvest_reads_edited_inputs_and_tier(pack, tmp_path):
+    patch_workbook(pack, {'ROI Calculator': {'roi_tool_costs_crm': 80, 'roi_clients_per_month': 6}})
+    result = harvest_pack(pack)
+    assert result.error is None and result.problems == [] and result.blank == []
+    assert result.firm_name == 'Acme'
+    assert result.tier == 'professional'
+    assert result.inputs['crm'] == 80
+    assert result.inputs['clients_per_month'] == 6
+    assert result.inputs['plannetic_cost'] == 300
+
+    csv_path = str(tmp_path / 'returned.csv')
+    write_inputs([result], csv_path)
+    prospects = load_prospects(csv_path)
+    assert prospects[0].tier == 'professional'
+    assert prospects[0].tool_costs['crm'] == 80
+
+
+def test_blank_inputs_harvest_as_zero_like_the_sheet(pack):
+    wb = openpyxl.load_workbook(pack)
+    ws = wb['ROI Calculator']
+    ws['B9'] = None             # Cash Flow (Voyant)
+    ws['B20'] = 'lots'          # hours per client
+    wb.save(pack)
+
+    result = harvest_pack(pack)
+    assert result.blank == ['cash_flow']
+    assert result.inputs['cash_flow'] == 0
+    assert 'hours_per_client' not in result.inputs
+    assert result.problems == ["B20 (hours_per_client): 'lots' is not a number"]
+    # The sheet's total counts the blank as 0 too
+    engine = FormulaEngine.from_file(pack)
+    assert engine.value('ROI Calculator', 'B14') == sum(result.inputs[key] for key in TOOL_KEYS)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from ifa_workbooks.cohorts import DEFAULT_PLANS
+from ifa_workbooks.formulas import FormulaEngine
+from ifa_workbooks.mix import mix_revenue, tier_plans, vary_share
+from ifa_workbooks.pricing import MIX_FIRM_COUNTS, MIX_SWEEP_SHARES, RATE_INPUTS, build_pricing_workbook
+from ifa_workbooks.tiers import TIER_PRICES, tier_terms
+
+SHEET = 'Revenue Calculator'
+
+
+def test_cohort_and_mix_plans_share_prices_and_terms():
+    plans = tier_plans()
+    for tier in ('monthly', 'standard', 'professional'):
+        assert DEFAULT_PLANS[tier].monthly_rate == plans[tier].monthly_rate == TIER_PRICES[tier]
+        assert DEFAULT_PLANS[tier].term_months == plans[tier].term_months == tier_terms().get(tier, 0)
+        assert DEFAULT_PLANS[tier].renewal_rate == pytest.approx(plans[tier].renewal_rate)
+
+
+def test_firms_needed_is_inf_for_worthless_mixes():
+    plans = tier_plans({'enterprise': 0})
+    model = mix_revenue([{'enterprise': 1}, {'standard': 1}], plans=plans)
+    needed = model.firms_needed(1_000_000)
+    assert needed[0] == np.inf
+    assert needed[1] == np.ceil(1_000_000 / model.per_firm_value[1])
+    assert model.firms_needed(0)[0] == 0
+
+
+def test_mix_mrr_table_follows_rates_and_shares(tmp_path):
+    path = str(tmp_path / 'pack.xlsx')
+    build_pricing_workbook().save(path)
+    engine = FormulaEngine.from_file(path)
+
+    plans = tier_plans({tier: rate for tier, _, rate in RATE_INPUTS})
+    sweep = mix_revenue(vary_share('professional', MIX_SWEEP_SHARES, plans=plans), firm_counts=MIX_FIRM_COUNTS,
+                        plans=plans)
+    table = [[engine.value(SHEET, f'{col}{row}') for col in 'CDEFG'] for row in range(47, 58)]
+    np.testing.assert_allclose(table, sweep.mrr.T)
+
+    # Professional £400, no Monthly firms: the rest is Standard 4:1 Enterprise, (250*4 + 500) / 5
+    engine.set_cell(SHEET, 'B6', 400)
+    engine.set_cell(SHEET, 'E35', 0)
+    engine.recalculate()
+    assert engine.value(SHEET, 'B52') == pytest.approx(0.5 * 400 + 0.5 * 300)
+    assert engine.value(SHEET, 'G57') == pytest.approx(250 * 400)
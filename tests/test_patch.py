@@ -0,0 +1,67 @@
+import os
+import shutil
+import stat
+
+import pytest
+
+from ifa_workbooks.formulas import FormulaEngine
+from ifa_workbooks.names import read_names
+from ifa_workbooks.patch import patch_workbook
+from ifa_workbooks.pricing import build_pricing_workbook
+
+
+@pytest.fixture
+def pack(tmp_path_factory, tmp_path):
+    built = tmp_path_factory.getbasetemp() / 'patch-pack.xlsx'
+    if not built.exists():
+        build_pricing_workbook().save(str(built))
+    path = str(tmp_path / 'pack.xlsx')
+    shutil.copyfile(built, path)
+    os.chmod(path, 0o644)
+    return path
+
+
+def test_patch_round_trip_matches_a_fresh_evaluation(pack):
+    result = patch_workbook(pack, {'ROI Calculator': {'Cash Flow (Voyant)': 180, 'roi_plannetic_cost': 300}})
+    assert result.cells['ROI Calculator']['B9'] == 180
+    assert result.cells['ROI Calculator']['B28'] == 300
+    assert result.parts == ['xl/worksheets/sheet5.xml']
+
+    # from_parts keeps the patched cached results; from_file evaluates every formula again
+    patched = FormulaEngine.from_parts(pack)
+    patched.recalculate()
+    fresh = FormulaEngine.from_file(pack)
+    fresh.recalculate()
+    for coord in ('B14', 'B41', 'C41', 'B42'):
+        assert patched.value('ROI Calculator', coord) == pytest.approx(fresh.value('ROI Calculator', coord))
+    assert patched.value('ROI Calculator', 'B14') == 565
+
+
+def test_patch_keeps_file_permissions(pack):
+    patch_workbook(pack, {'Competitor Pricing': {'Voyant AdviserGo': 180}})
+    assert stat.S_IMODE(os.stat(pack).st_mode) == 0o644
+
+
+def test_patch_rejects_formula_cells_and_unknown_targets(pack):
+    with pytest.raises(ValueError, match='formula'):
+        patch_workbook(pack, {'ROI Calculator': {'C41': 1}})
+    with pytest.raises(ValueError, match='no row labelled'):
+        patch_workbook(pack, {'ROI Calculator': {'Nothing here': 1}})
+    with pytest.raises(ValueError, match='not a cell on'):
+        patch_workbook(pack, {'Summary': {'roi_plannetic_cost': 1}})
+
+
+def test_roi_sensitivity_follows_patched_inputs(pack):
+    patch_workbook(pack, {'ROI Calculator': {'roi_plannetic_cost': 2000, 'roi_clients_per_month': 6}})
+    names = read_names(pack)
+    engine = FormulaEngine.from_file(pack)
+    engine.recalculate()
+    # tool costs 560, value per client 15 h x 60% x £100 = £900
+    assert engine.value(*names['roi_break_even_price'].cell) == (560 + 900 * 6) / 2
+    assert engine.value(*names['roi_min_clients'].cell) == 4
+    assert names['roi_min_clients'].label == 'Minimum clients/month for positive ROI'
+    assert engine.value('ROI Calculator', 'A64') == 'Break-even Plannetic price (6 clients/month)'
+    assert engine.value('ROI Calculator', 'A65') == 'Minimum clients/month for positive ROI (at £2000)'
+    # Heatmap at £250 x 4 clients, and the break-even row for 12 clients
+    assert engine.value('ROI Calculator', 'E73') == pytest.approx((560 + 900 * 4 - 500) / 250 * 100)
+    assert engine.value('ROI Calculator', 'M84') == (560 + 900 * 12) / 2
@@ -0,0 +1,44 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import pytest
+
+from ifa_workbooks.service import OTHER_ENDPOINT, RenderService, RequestError, parse_render_fields
+
+
+@pytest.mark.parametrize('fields', [{'crm': 'nan'}, {'cash_flow': 'inf'}, {'hourly_rate': '-Infinity'}])
+def test_non_finite_inputs_are_bad_requests(fields):
+    with pytest.raises(RequestError, match='must be a finite number') as caught:
+        parse_render_fields(fields)
+    assert caught.value.status == HTTPStatus.BAD_REQUEST
+
+
+async def _get(port, path, method='GET'):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n'.encode())
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), body
+
+
+def test_metrics_only_track_routed_endpoints():
+    async def run():
+        service = RenderService(workers=1)
+        server = await service.start('127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            for path in ('/nope0', '/nope1', '/nope2'):
+                assert (await _get(port, path))[0] == HTTPStatus.NOT_FOUND
+            assert (await _get(port, '/health', 'DELETE'))[0] == HTTPStatus.METHOD_NOT_ALLOWED
+            assert (await _get(port, '/health'))[0] == HTTPStatus.OK
+            status, body = await _get(port, '/metrics')
+        finally:
+            service.close()
+        return status, json.loads(body)
+
+    status, metrics = asyncio.run(run())
+    assert status == HTTPStatus.OK
+    assert set(metrics['endpoints']) == {'GET /health', OTHER_ENDPOINT}
+    assert metrics['endpoints'][OTHER_ENDPOINT]['statuses'] == {'404': 3, '405': 1}